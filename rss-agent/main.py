@@ -11,10 +11,13 @@ from pathlib import Path
 
 import yaml
 
-from src.core.rss_fetcher import RSSFetcher
-from src.core.content_filter import ContentFilter
-from src.core.ai_processor import AIProcessor
-from src.formatters.output_formatter import OutputFormatter
+try:
+    # libyaml的C加载器，配置解析比纯Python实现快5-10倍
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 重模块（openai、feedparser等）延迟到实际使用处导入，降低冷启动耗时
 from src.utils import URLDeduplicator
 
 # 配置日志
@@ -37,7 +40,7 @@ def load_config(config_path: str) -> dict:
     """
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         logger.info(f"配置文件加载成功: {config_path}")
         return config
     except Exception as e:
@@ -150,7 +153,10 @@ def main():
         logger.error("配置文件中没有RSS订阅源")
         sys.exit(1)
     
-    fetcher = RSSFetcher(feeds)
+    from src.core.rss_fetcher import RSSFetcher
+
+    trust_feeds = config.get('rss', {}).get('trust_feeds', False)
+    fetcher = RSSFetcher(feeds, trusted=trust_feeds)
     articles = fetcher.fetch_all()
     
     if not articles:
@@ -159,6 +165,8 @@ def main():
     
     # 2. 内容过滤
     logger.info("\n🔍 Step 2: 应用内容过滤...")
+    from src.core.content_filter import ContentFilter
+
     content_filter = ContentFilter(config, deduplicator)
     filtered_articles = content_filter.apply_all_filters(articles)
     
@@ -178,16 +186,24 @@ def main():
         sys.exit(0)
     
     logger.info("\n🤖 Step 3: 调用AI进行分析...")
+    # dry-run不会走到这里，openai只在真正分析时才被导入
+    from src.core.ai_processor import AIProcessor
+
     ai_processor = AIProcessor(config)
-    results = ai_processor.analyze_batch(filtered_articles, max_articles)
-    
-    # 4. 标记已处理的URL
-    logger.info("\n📝 Step 4: 更新URL缓存...")
-    processed_urls = [r.article.url for r in results]
-    deduplicator.mark_batch_processed(processed_urls)
+    # 结果按完成顺序流式写入URL缓存，慢请求不阻塞已完成文章的进度落盘
+    results = ai_processor.analyze_batch(
+        filtered_articles,
+        max_articles,
+        on_result=lambda result: deduplicator.mark_processed(result.article.url)
+    )
+
+    # 4. URL缓存已在分析过程中增量更新
+    logger.info("\n📝 Step 4: URL缓存已更新")
     
     # 5. 输出报告
     logger.info("\n📄 Step 5: 生成Markdown报告...")
+    from src.formatters.output_formatter import OutputFormatter
+
     formatter = OutputFormatter(str(output_path))
     saved_path = formatter.save_report(results)
     
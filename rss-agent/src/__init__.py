@@ -1,32 +1,47 @@
 """
 RSS Agent 源代码包
-"""
 
-from .utils import URLDeduplicator, clean_html, truncate_text, format_datetime
-from .core import Article, RSSFetcher, ContentFilter, AIProcessor, AnalysisResult
-from .formatters import OutputFormatter, WeeklyFormatter, WeeklyItem
-from .fetchers import LeetCodeFetcher, LeetCodeProblem
-from .generators import WeeklyGenerator
+为缩短冷启动时间（cron/CI场景），重导出使用PEP 562惰性加载：
+首次访问属性时才导入对应子模块，避免一进包就拖起openai、feedparser等重依赖。
+"""
 
-__all__ = [
+# 属性名 -> 所在子模块
+_LAZY_IMPORTS = {
     # Utils
-    'URLDeduplicator',
-    'clean_html',
-    'truncate_text',
-    'format_datetime',
+    'URLDeduplicator': '.utils',
+    'clean_html': '.utils',
+    'truncate_text': '.utils',
+    'format_datetime': '.utils',
     # Core
-    'Article',
-    'RSSFetcher',
-    'ContentFilter',
-    'AIProcessor',
-    'AnalysisResult',
+    'Article': '.core.rss_fetcher',
+    'RSSFetcher': '.core.rss_fetcher',
+    'ContentFilter': '.core.content_filter',
+    'AIProcessor': '.core.ai_processor',
+    'AnalysisResult': '.core.ai_processor',
     # Formatters
-    'OutputFormatter',
-    'WeeklyFormatter',
-    'WeeklyItem',
+    'OutputFormatter': '.formatters.output_formatter',
+    'WeeklyFormatter': '.formatters.weekly_formatter',
+    'WeeklyItem': '.formatters.weekly_formatter',
     # Fetchers
-    'LeetCodeFetcher',
-    'LeetCodeProblem',
+    'LeetCodeFetcher': '.fetchers.leetcode_fetcher',
+    'LeetCodeProblem': '.fetchers.leetcode_fetcher',
     # Generators
-    'WeeklyGenerator',
-]
+    'WeeklyGenerator': '.generators.weekly_generator',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """按需导入重导出的符号（PEP 562）"""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
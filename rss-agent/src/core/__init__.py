@@ -1,16 +1,32 @@
 """
 核心模块
 包含 RSS 抓取、内容过滤和 AI 处理
+
+重导出使用PEP 562惰性加载：只用到RSSFetcher时不必连带导入AI处理链（openai）。
 """
 
-from .rss_fetcher import Article, RSSFetcher
-from .content_filter import ContentFilter
-from .ai_processor import AIProcessor, AnalysisResult
+# 属性名 -> 所在子模块
+_LAZY_IMPORTS = {
+    'Article': '.rss_fetcher',
+    'RSSFetcher': '.rss_fetcher',
+    'ContentFilter': '.content_filter',
+    'AIProcessor': '.ai_processor',
+    'AnalysisResult': '.ai_processor',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """按需导入重导出的符号（PEP 562）"""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
 
-__all__ = [
-    'Article',
-    'RSSFetcher',
-    'ContentFilter',
-    'AIProcessor',
-    'AnalysisResult',
-]
+def __dir__():
+    return sorted(__all__)
@@ -3,19 +3,31 @@ AI处理模块
 调用AI API分析文章内容
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
+from collections import deque
 from dataclasses import dataclass
+import asyncio
+import json
 import logging
 import os
-from openai import OpenAI
+import random
+import re
+import time
+from openai import OpenAI, AsyncOpenAI, APIError, RateLimitError
 
 from .rss_fetcher import Article
-from ..utils import truncate_text
+from ..utils import DATACLASS_SLOTS, truncate_text
+
+try:
+    # 可选依赖：按token精确截断提示词，未安装时回退按字符截断
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnalysisResult:
     """AI分析结果"""
     article: Article
@@ -60,7 +72,24 @@ class AIProcessor:
 ## AI行业相关性
 - 判断：[是/否]
 - 理由：[简要说明为什么相关或不相关]"""
-    
+
+    # 多篇打包分析的系统提示词（要求JSON输出，便于拆分结果）
+    MULTI_SYSTEM_PROMPT = """你是一个 AI 时事分析助手。
+
+下面会提供多条新闻，每条新闻有一个编号 id。请对每一条新闻：
+1. 提炼 3 条核心要点
+2. 判断是否与 AI 行业高度相关，并给出简要理由
+3. 用中文输出
+
+必须输出 JSON 对象，不要任何 markdown 标记或额外文本，格式如下：
+{"results": [{"id": 1, "key_points": ["要点1", "要点2", "要点3"], "is_ai_related": true, "ai_relevance_reason": "简要理由"}]}"""
+
+    # 预编译的响应解析正则（一次扫描代替逐行状态机）
+    _POINTS_RE = re.compile(r"##\s*核心要点\s*\n(.*?)(?=\n##|\Z)", re.S)
+    _ITEM_RE = re.compile(r"^\s*(?:\d+\.|[-*])\s*(.+?)\s*$", re.M)
+    _JUDGE_RE = re.compile(r"判断[^：:\n]*[:：]\s*\[?\s*(是|否)")
+    _REASON_RE = re.compile(r"理由[^：:\n]*[:：]\s*(.+)")
+
     def __init__(self, config: Dict[str, Any]):
         """
         初始化AI处理器
@@ -76,28 +105,89 @@ class AIProcessor:
         self.api_key = os.getenv(self.api_key_env) or ai_config.get('api_key', '')
         self.max_tokens = ai_config.get('max_tokens', 4096)
         self.temperature = ai_config.get('temperature', 0.7)
+        # 单篇文章正文的输入token预算
+        self.max_input_tokens = ai_config.get('max_input_tokens', 1000)
+        self._enc = self._load_encoder(self.model)
+
+        # 请求模式: sync（实时并发请求）或 batch（Batch API离线批处理）
+        self.mode = ai_config.get('mode', 'sync')
+        self.batch_poll_interval = ai_config.get('batch_poll_interval', 30)
+
+        # 每次请求打包分析的文章数（>1时可绕开RPM瓶颈）
+        self.pack_size = ai_config.get('pack_size', 4)
+
+        # 并发与限流配置
+        self.concurrency = ai_config.get('concurrency', 10)
+        self.max_requests_per_minute = ai_config.get('max_requests_per_minute', 0)
+        self.max_tokens_per_minute = ai_config.get('max_tokens_per_minute', 0)
+        self.max_attempts = ai_config.get('max_attempts', 3)
 
         if not self.api_key:
             logger.warning(f"未检测到 AI API Key，请设置环境变量 {self.api_key_env}")
-        
+
         # 初始化OpenAI客户端（兼容API）
         self.client = OpenAI(
             api_key=self.api_key,
             base_url=self.api_base
         )
+        self.async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.api_base
+        )
+        # 滑动窗口记录最近一分钟的 (时间戳, 估算token数)
+        self._usage_window: deque = deque()
+        self._rate_lock: Optional[asyncio.Lock] = None
     
+    @staticmethod
+    def _load_encoder(model: str) -> Optional[Any]:
+        """
+        加载模型对应的tiktoken编码器
+
+        Args:
+            model: 模型名称
+
+        Returns:
+            编码器对象，tiktoken不可用时返回None
+        """
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # 未知模型（如各类兼容API）统一用cl100k_base
+            return tiktoken.get_encoding('cl100k_base')
+
+    def _truncate_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        按token数截断文本（模型只关心token预算，不关心字符数）
+
+        Args:
+            text: 原始文本
+            max_tokens: 最大token数
+
+        Returns:
+            截断后的文本
+        """
+        if self._enc is None:
+            # 没有tiktoken时按字符近似：中英文混排大致1 token ≈ 2-4字符
+            return truncate_text(text, max_tokens * 4)
+        ids = self._enc.encode(text)
+        if len(ids) <= max_tokens:
+            return text
+        return self._enc.decode(ids[:max_tokens])
+
     def _build_user_prompt(self, article: Article) -> str:
         """
         构建用户提示词
-        
+
         Args:
             article: 文章对象
-            
+
         Returns:
             用户提示词
         """
         content = article.content or article.summary
-        content = truncate_text(content, 4000)  # 限制内容长度
+        content = self._truncate_tokens(content, self.max_input_tokens)  # 限制内容长度
         
         return f"""新闻内容：
 
@@ -123,57 +213,85 @@ class AIProcessor:
             "is_ai_related": False,
             "ai_relevance_reason": ""
         }
-        
-        lines = response_text.strip().split('\n')
-        current_section = None
-        
-        for line in lines:
-            line = line.strip()
-            
-            if '核心要点' in line:
-                current_section = 'key_points'
-                continue
-            elif 'AI行业相关性' in line or 'AI 行业相关性' in line:
-                current_section = 'ai_related'
-                continue
-            
-            if current_section == 'key_points':
-                # 解析要点
-                if line.startswith(('1.', '2.', '3.', '- ', '* ')):
-                    point = line.lstrip('0123456789.-* ').strip()
-                    if point:
-                        result["key_points"].append(point)
-            
-            elif current_section == 'ai_related':
-                # 解析AI相关性判断
-                if '判断' in line:
-                    result["is_ai_related"] = '是' in line and '否' not in line.split('是')[0]
-                elif '理由' in line:
-                    reason = line.split('理由')[-1].strip().lstrip('：:').strip()
-                    result["ai_relevance_reason"] = reason
-        
+
+        text = (response_text or "").strip()
+
+        # 提取"核心要点"区块中的列表项
+        points_match = self._POINTS_RE.search(text)
+        if points_match:
+            result["key_points"] = self._ITEM_RE.findall(points_match.group(1))[:3]
+
+        # 解析AI相关性判断与理由
+        judge_match = self._JUDGE_RE.search(text)
+        result["is_ai_related"] = bool(judge_match and judge_match.group(1) == '是')
+
+        reason_match = self._REASON_RE.search(text)
+        if reason_match:
+            result["ai_relevance_reason"] = reason_match.group(1).strip()
+
         # 确保有3个要点
         while len(result["key_points"]) < 3:
             result["key_points"].append("（无更多要点）")
-        result["key_points"] = result["key_points"][:3]  # 只保留前3个
-        
+
         return result
     
+    def _build_result(self, article: Article, response_text: str) -> AnalysisResult:
+        """
+        根据AI响应文本构建分析结果
+
+        Args:
+            article: 文章对象
+            response_text: AI响应文本
+
+        Returns:
+            分析结果
+        """
+        parsed = self._parse_response(response_text)
+        return AnalysisResult(
+            article=article,
+            key_points=parsed["key_points"],
+            is_ai_related=parsed["is_ai_related"],
+            ai_relevance_reason=parsed["ai_relevance_reason"],
+            raw_response=response_text,
+            success=True
+        )
+
+    def _build_failure_result(self, article: Article, error: Exception) -> AnalysisResult:
+        """
+        构建分析失败的结果
+
+        Args:
+            article: 文章对象
+            error: 异常对象
+
+        Returns:
+            分析结果
+        """
+        return AnalysisResult(
+            article=article,
+            key_points=["分析失败", "分析失败", "分析失败"],
+            is_ai_related=False,
+            ai_relevance_reason="分析过程中发生错误",
+            raw_response="",
+            success=False,
+            error_message=str(error)
+        )
+
     def analyze_article(self, article: Article) -> AnalysisResult:
         """
         分析单篇文章
-        
+
         Args:
             article: 文章对象
-            
+
         Returns:
             分析结果
         """
         try:
             logger.info(f"正在分析文章: {article.title[:50]}...")
-            
+
             user_prompt = self._build_user_prompt(article)
-            
+
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -183,54 +301,485 @@ class AIProcessor:
                 max_tokens=self.max_tokens,
                 temperature=self.temperature
             )
-            
+
             response_text = response.choices[0].message.content
-            parsed = self._parse_response(response_text)
-            
-            return AnalysisResult(
-                article=article,
-                key_points=parsed["key_points"],
-                is_ai_related=parsed["is_ai_related"],
-                ai_relevance_reason=parsed["ai_relevance_reason"],
-                raw_response=response_text,
-                success=True
-            )
-            
+            return self._build_result(article, response_text)
+
         except Exception as e:
             logger.error(f"分析文章失败: {article.title}, 错误: {e}")
-            return AnalysisResult(
-                article=article,
-                key_points=["分析失败", "分析失败", "分析失败"],
-                is_ai_related=False,
-                ai_relevance_reason="分析过程中发生错误",
-                raw_response="",
-                success=False,
-                error_message=str(e)
+            return self._build_failure_result(article, e)
+
+    async def _acquire_capacity(self, estimated_tokens: int):
+        """
+        基于滑动窗口的 RPM/TPM 限流，必要时等待配额释放
+
+        Args:
+            estimated_tokens: 本次请求的估算token数
+        """
+        if not self.max_requests_per_minute and not self.max_tokens_per_minute:
+            return
+
+        while True:
+            async with self._rate_lock:
+                now = time.monotonic()
+                while self._usage_window and now - self._usage_window[0][0] >= 60:
+                    self._usage_window.popleft()
+
+                request_ok = (
+                    not self.max_requests_per_minute
+                    or len(self._usage_window) < self.max_requests_per_minute
+                )
+                token_ok = (
+                    not self.max_tokens_per_minute
+                    or sum(tokens for _, tokens in self._usage_window) + estimated_tokens
+                    <= self.max_tokens_per_minute
+                )
+
+                if request_ok and token_ok:
+                    self._usage_window.append((now, estimated_tokens))
+                    return
+
+                wait_seconds = 60 - (now - self._usage_window[0][0]) if self._usage_window else 1.0
+
+            await asyncio.sleep(max(wait_seconds, 0.1))
+
+    async def _chat_async(self, messages: List[Dict[str, str]], estimated_tokens: int, label: str = "") -> str:
+        """
+        发送一次异步对话请求，带限流与重试
+
+        Args:
+            messages: 对话消息列表
+            estimated_tokens: 估算token数，用于TPM限流
+            label: 日志标识
+
+        Returns:
+            AI响应文本
+
+        Raises:
+            Exception: 重试耗尽后抛出最后一次的异常
+        """
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self._acquire_capacity(estimated_tokens)
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature
+                )
+                return response.choices[0].message.content
+            except (RateLimitError, APIError) as e:
+                last_error = e
+                if attempt < self.max_attempts:
+                    # 指数退避 + 随机抖动，避免重试风暴
+                    delay = min(2 ** attempt, 30) + random.uniform(0, 1)
+                    logger.warning(
+                        f"请求受限，{delay:.1f}秒后重试({attempt}/{self.max_attempts}): "
+                        f"{label}, 错误: {e}"
+                    )
+                    await asyncio.sleep(delay)
+            except Exception as e:
+                last_error = e
+                break
+
+        raise last_error
+
+    async def _analyze_async(self, article: Article, semaphore: asyncio.Semaphore) -> AnalysisResult:
+        """
+        异步分析单篇文章，带限流与重试
+
+        Args:
+            article: 文章对象
+            semaphore: 并发信号量
+
+        Returns:
+            分析结果
+        """
+        user_prompt = self._build_user_prompt(article)
+        # 粗略估算token数（约4字符/1token），用于TPM限流
+        estimated_tokens = (len(self.SYSTEM_PROMPT) + len(user_prompt)) // 4 + self.max_tokens
+
+        async with semaphore:
+            try:
+                logger.info(f"正在分析文章: {article.title[:50]}...")
+                response_text = await self._chat_async(
+                    [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    estimated_tokens,
+                    label=article.title[:40]
+                )
+                return self._build_result(article, response_text)
+            except Exception as e:
+                logger.error(f"分析文章失败: {article.title}, 错误: {e}")
+                return self._build_failure_result(article, e)
+
+    def _build_multi_prompt(self, articles: List[Article]) -> str:
+        """
+        构建多篇文章的打包提示词
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            用户提示词
+        """
+        sections = []
+        for index, article in enumerate(articles, 1):
+            content = article.content or article.summary
+            content = self._truncate_tokens(content, self.max_input_tokens)
+            sections.append(f"""【新闻 {index}】
+标题：{article.title}
+来源：{article.source}
+发布时间：{article.published.isoformat() if article.published else '未知'}
+
+正文：
+{content}""")
+        return "\n\n".join(sections)
+
+    def _parse_multi_response(self, response_text: str) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        解析打包分析的JSON响应
+
+        Args:
+            response_text: AI响应文本
+
+        Returns:
+            id到结果字典的映射，解析失败返回None
+        """
+        clean_text = (response_text or "").strip()
+        # 容忍模型在JSON外包裹代码块标记
+        if clean_text.startswith("```"):
+            clean_text = clean_text.strip("`").lstrip("json").strip()
+
+        try:
+            parsed = json.loads(clean_text)
+        except json.JSONDecodeError:
+            return None
+
+        if isinstance(parsed, dict):
+            entries = parsed.get("results", [])
+        elif isinstance(parsed, list):
+            entries = parsed
+        else:
+            return None
+
+        by_id: Dict[int, Dict[str, Any]] = {}
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("id"), int):
+                by_id[entry["id"]] = entry
+        return by_id or None
+
+    def _build_result_from_entry(self, article: Article, entry: Dict[str, Any], raw_response: str) -> AnalysisResult:
+        """
+        从打包响应的单条JSON结果构建分析结果
+
+        Args:
+            article: 文章对象
+            entry: JSON结果字典
+            raw_response: 原始响应文本
+
+        Returns:
+            分析结果
+        """
+        key_points = [str(p).strip() for p in entry.get("key_points", []) if str(p).strip()]
+        while len(key_points) < 3:
+            key_points.append("（无更多要点）")
+
+        return AnalysisResult(
+            article=article,
+            key_points=key_points[:3],
+            is_ai_related=bool(entry.get("is_ai_related", False)),
+            ai_relevance_reason=str(entry.get("ai_relevance_reason", "")).strip(),
+            raw_response=raw_response,
+            success=True
+        )
+
+    async def _analyze_group_async(
+        self,
+        group: List[Article],
+        semaphore: asyncio.Semaphore
+    ) -> List[AnalysisResult]:
+        """
+        打包分析一组文章，解析失败时回退为逐篇分析
+
+        Args:
+            group: 文章分组
+            semaphore: 并发信号量
+
+        Returns:
+            分析结果列表（与分组顺序一致）
+        """
+        if len(group) == 1:
+            return [await self._analyze_async(group[0], semaphore)]
+
+        user_prompt = self._build_multi_prompt(group)
+        estimated_tokens = (len(self.MULTI_SYSTEM_PROMPT) + len(user_prompt)) // 4 + self.max_tokens
+
+        response_text = ""
+        async with semaphore:
+            try:
+                logger.info(f"正在打包分析 {len(group)} 篇文章...")
+                response_text = await self._chat_async(
+                    [
+                        {"role": "system", "content": self.MULTI_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    estimated_tokens,
+                    label=f"打包请求({len(group)}篇)"
+                )
+            except Exception as e:
+                logger.warning(f"打包分析请求失败，回退为逐篇分析: {e}")
+
+        if response_text:
+            by_id = self._parse_multi_response(response_text)
+            if by_id:
+                results = []
+                for index, article in enumerate(group, 1):
+                    entry = by_id.get(index)
+                    if entry:
+                        results.append(self._build_result_from_entry(article, entry, response_text))
+                    else:
+                        results.append(self._build_failure_result(
+                            article, RuntimeError("打包响应中缺少该文章的结果")
+                        ))
+                return results
+            logger.warning("打包响应JSON解析失败，回退为逐篇分析")
+
+        return list(await asyncio.gather(
+            *(self._analyze_async(article, semaphore) for article in group)
+        ))
+
+    def _estimate_article_tokens(self, article: Article) -> int:
+        """
+        估算单篇文章正文的token数（上限为输入预算）
+
+        Args:
+            article: 文章对象
+
+        Returns:
+            估算token数
+        """
+        text = article.content or article.summary
+        if self._enc is not None:
+            count = len(self._enc.encode(text))
+        else:
+            count = max(1, len(text) // 4)
+        return min(count, self.max_input_tokens)
+
+    def _bucket_by_length(self, articles: List[Article], pack_size: int) -> List[List[Article]]:
+        """
+        按正文长度分桶打包文章
+
+        长短文章混在一个打包请求里时，短文章会陪着长文章等完整生成；
+        先按token数排序，再贪心装桶并限制桶内最长/最短比小于2倍，
+        让每个请求里的文章长度大致均匀。
+
+        Args:
+            articles: 文章列表
+            pack_size: 每组最大文章数
+
+        Returns:
+            分组后的文章列表
+        """
+        sized = sorted(
+            ((self._estimate_article_tokens(article), article) for article in articles),
+            key=lambda pair: pair[0]
+        )
+
+        groups: List[List[Article]] = []
+        current: List[Article] = []
+        group_min_tokens = 0
+        for tokens, article in sized:
+            if current and (len(current) >= pack_size or tokens > group_min_tokens * 2):
+                groups.append(current)
+                current = []
+            if not current:
+                group_min_tokens = max(1, tokens)
+            current.append(article)
+        if current:
+            groups.append(current)
+
+        return groups
+
+    async def _analyze_batch_async(
+        self,
+        articles: List[Article],
+        on_result: Optional[Callable[[AnalysisResult], None]] = None
+    ) -> List[AnalysisResult]:
+        """
+        并发分析一批文章（按pack_size打包请求）
+
+        Args:
+            articles: 文章列表
+            on_result: 单条结果完成时的回调（按完成顺序触发）
+
+        Returns:
+            分析结果列表（与输入顺序一致）
+        """
+        self._rate_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        groups = self._bucket_by_length(articles, max(1, self.pack_size))
+
+        async def run_group(index: int, group: List[Article]):
+            return index, await self._analyze_group_async(group, semaphore)
+
+        # 用as_completed逐组消费结果：慢请求不阻塞已完成文章的回调
+        # （缓存落盘、报告写入），中途退出也能保留部分进度
+        indexed_results: Dict[int, List[AnalysisResult]] = {}
+        for coro in asyncio.as_completed(
+            [run_group(index, group) for index, group in enumerate(groups)]
+        ):
+            index, group_results = await coro
+            indexed_results[index] = group_results
+            if on_result is not None:
+                for result in group_results:
+                    on_result(result)
+
+        # 分组打乱了文章顺序，按原始输入顺序还原
+        order = {id(article): position for position, article in enumerate(articles)}
+        flat = [
+            result
+            for index in sorted(indexed_results)
+            for result in indexed_results[index]
+        ]
+        return sorted(flat, key=lambda result: order.get(id(result.article), 0))
+
+    def analyze_batch_offline(self, articles: List[Article]) -> List[AnalysisResult]:
+        """
+        通过 Batch API 离线批量分析文章
+
+        所有请求打包为一个JSONL批处理任务提交，成本约为实时接口的一半，
+        且不占用实时RPM配额；代价是延迟（completion_window为24小时）。
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            分析结果列表（与输入顺序一致）
+        """
+        logger.info(f"提交 Batch API 批处理任务: {len(articles)} 篇文章")
+
+        # 1. 构造JSONL请求体，custom_id用于回填结果
+        lines = []
+        for index, article in enumerate(articles):
+            request = {
+                "custom_id": f"article-{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_user_prompt(article)}
+                    ],
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature
+                }
+            }
+            lines.append(json.dumps(request, ensure_ascii=False))
+
+        try:
+            # 2. 上传输入文件并创建批处理任务
+            batch_file = self.client.files.create(
+                file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
             )
-    
-    def analyze_batch(self, articles: List[Article], max_articles: int = 20) -> List[AnalysisResult]:
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"批处理任务已创建: {batch.id}")
+
+            # 3. 指数退避轮询直到任务结束
+            delay = self.batch_poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(delay)
+                delay = min(delay * 1.5, 300)
+                batch = self.client.batches.retrieve(batch.id)
+                logger.info(f"批处理任务状态: {batch.status}")
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"批处理任务未成功结束: {batch.id}, 状态: {batch.status}")
+
+            # 4. 下载输出并按custom_id映射回文章
+            output_text = self.client.files.content(batch.output_file_id).text
+            responses: Dict[str, str] = {}
+            for line in output_text.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    payload = json.loads(line)
+                    body = payload.get("response", {}).get("body", {})
+                    choices = body.get("choices", [])
+                    if choices:
+                        responses[payload.get("custom_id", "")] = choices[0]["message"]["content"]
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning(f"解析批处理输出行失败: {e}")
+
+        except Exception as e:
+            logger.error(f"Batch API 批处理失败: {e}")
+            return [self._build_failure_result(article, e) for article in articles]
+
+        results = []
+        for index, article in enumerate(articles):
+            response_text = responses.get(f"article-{index}")
+            if response_text:
+                results.append(self._build_result(article, response_text))
+            else:
+                results.append(self._build_failure_result(
+                    article, RuntimeError("批处理输出中缺少该文章的结果")
+                ))
+
+        successful = sum(1 for r in results if r.success)
+        logger.info(f"批处理分析完成: 成功 {successful}/{len(results)}")
+        return results
+
+    def analyze_batch(
+        self,
+        articles: List[Article],
+        max_articles: int = 20,
+        on_result: Optional[Callable[[AnalysisResult], None]] = None
+    ) -> List[AnalysisResult]:
         """
-        批量分析文章
-        
+        批量分析文章（并发请求，受并发数与RPM/TPM限流约束）
+
         Args:
             articles: 文章列表
             max_articles: 最大处理数量
-            
+            on_result: 单条结果完成时的回调（按完成顺序触发）
+
         Returns:
             分析结果列表
         """
+        # 先按URL去重再截断，保证真正分析的是N篇不同的文章（重复文章白烧token）
+        seen_urls = set()
+        unique_articles = [
+            article for article in articles
+            if not (article.url in seen_urls or seen_urls.add(article.url))
+        ]
+
         # 限制处理数量
-        articles_to_process = articles[:max_articles]
-        
-        logger.info(f"开始批量分析 {len(articles_to_process)} 篇文章")
-        
-        results = []
-        for i, article in enumerate(articles_to_process, 1):
-            logger.info(f"处理进度: {i}/{len(articles_to_process)}")
-            result = self.analyze_article(article)
-            results.append(result)
-        
+        articles_to_process = unique_articles[:max_articles]
+
+        # batch模式走 Batch API 离线批处理
+        if self.mode == 'batch':
+            results = self.analyze_batch_offline(articles_to_process)
+            if on_result is not None:
+                for result in results:
+                    on_result(result)
+            return results
+
+        logger.info(f"开始批量分析 {len(articles_to_process)} 篇文章（并发数: {self.concurrency}）")
+
+        results = asyncio.run(self._analyze_batch_async(articles_to_process, on_result))
+
         successful = sum(1 for r in results if r.success)
         logger.info(f"分析完成: 成功 {successful}/{len(results)}")
-        
+
         return results
@@ -10,6 +10,12 @@ import re
 
 from .rss_fetcher import Article
 
+try:
+    # 可选依赖：多模式匹配加速，关键词列表很大时收益明显
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +40,76 @@ class ContentFilter:
         self.include_keywords = pre_filter.get('include_keywords', [])
         self.exclude_keywords = pre_filter.get('exclude_keywords', [])
         self.min_content_length = pre_filter.get('min_content_length', 100)
+
+        # 预编译关键词为单个合并正则，过滤时每篇文章只扫描一次
+        self._include_re = self._compile_keywords(self.include_keywords)
+        self._exclude_re = self._compile_keywords(self.exclude_keywords)
+
+        # 如果安装了hyperscan，编译为多模式DFA一次扫描所有关键词
+        self._include_db = self._compile_hyperscan(self.include_keywords)
+        self._exclude_db = self._compile_hyperscan(self.exclude_keywords)
+
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> Optional[re.Pattern]:
+        """
+        将关键词列表编译为一个合并的正则
+
+        Args:
+            keywords: 关键词列表
+
+        Returns:
+            编译后的正则，列表为空时返回None
+        """
+        if not keywords:
+            return None
+        return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+
+    @staticmethod
+    def _compile_hyperscan(keywords: List[str]) -> Optional[Any]:
+        """
+        将关键词列表编译为hyperscan多模式数据库
+
+        Args:
+            keywords: 关键词列表
+
+        Returns:
+            hyperscan数据库，不可用或编译失败时返回None
+        """
+        if hyperscan is None or not keywords:
+            return None
+        try:
+            db = hyperscan.Database()
+            expressions = [re.escape(keyword.lower()).encode('utf-8') for keyword in keywords]
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"hyperscan关键词编译失败，回退为正则匹配: {e}")
+            return None
+
+    @staticmethod
+    def _keywords_match(db: Optional[Any], pattern: Optional[re.Pattern], text: str) -> bool:
+        """
+        判断文本是否命中关键词（优先hyperscan，回退合并正则）
+
+        Args:
+            db: hyperscan数据库（可为None）
+            pattern: 合并正则（可为None）
+            text: 小写文本
+
+        Returns:
+            是否命中任一关键词
+        """
+        if db is not None:
+            matched = []
+            db.scan(text.encode('utf-8'), match_event_handler=lambda *_: matched.append(1))
+            return bool(matched)
+        if pattern is not None:
+            return pattern.search(text) is not None
+        return False
     
     def filter_by_time(self, articles: List[Article]) -> List[Article]:
         """
@@ -78,39 +154,23 @@ class ContentFilter:
         Returns:
             过滤后的文章列表
         """
-        if not self.include_keywords and not self.exclude_keywords:
+        if not self._include_re and not self._exclude_re:
             return articles
-        
+
         filtered = []
         for article in articles:
-            # 合并标题、摘要和内容进行关键词匹配
-            text = f"{article.title} {article.summary} {article.content}".lower()
-            
+            # 合并标题、摘要和内容进行关键词匹配（缓存复用小写文本）
+            text = article.lowercased_text()
+
             # 检查排除关键词
-            should_exclude = False
-            for keyword in self.exclude_keywords:
-                if keyword.lower() in text:
-                    should_exclude = True
-                    break
-            
-            if should_exclude:
+            if self._keywords_match(self._exclude_db, self._exclude_re, text):
                 continue
-            
+
             # 如果有包含关键词列表，检查是否匹配
-            if self.include_keywords:
-                should_include = False
-                for keyword in self.include_keywords:
-                    # 使用正则进行更精确的匹配
-                    pattern = re.compile(re.escape(keyword.lower()))
-                    if pattern.search(text):
-                        should_include = True
-                        break
-                
-                if should_include:
-                    filtered.append(article)
-            else:
-                # 没有包含关键词列表，默认包含
-                filtered.append(article)
+            if self.include_keywords and not self._keywords_match(self._include_db, self._include_re, text):
+                continue
+
+            filtered.append(article)
         
         logger.info(f"关键词过滤: {len(articles)} -> {len(filtered)} 篇文章")
         return filtered
@@ -154,32 +214,59 @@ class ContentFilter:
         logger.info(f"去重过滤: {len(articles)} -> {len(filtered)} 篇文章")
         return filtered
     
+    def _keep(self, article: Article, cutoff: Optional[datetime]) -> bool:
+        """
+        判断单篇文章是否通过所有过滤器（按代价从低到高短路）
+
+        Args:
+            article: 文章对象
+            cutoff: 时间过滤截止点（None表示不过滤时间）
+
+        Returns:
+            是否保留该文章
+        """
+        # 1. 内容长度（最便宜的检查）
+        if self.min_content_length:
+            if len(article.content) + len(article.summary) < self.min_content_length:
+                return False
+
+        # 2. 时间范围（没有发布时间的文章默认保留）
+        if cutoff is not None and article.published:
+            pub_time = article.published
+            if pub_time.tzinfo is None:
+                pub_time = pub_time.replace(tzinfo=timezone.utc)
+            if pub_time < cutoff:
+                return False
+
+        # 3. 关键词（只在需要时构建小写文本，且按文章缓存复用）
+        if self.include_keywords or self.exclude_keywords:
+            text = article.lowercased_text()
+            if self._keywords_match(self._exclude_db, self._exclude_re, text):
+                return False
+            if self.include_keywords and not self._keywords_match(self._include_db, self._include_re, text):
+                return False
+
+        # 4. URL 去重（可选）
+        if self.deduplicator and self.deduplicator.is_duplicate(article.url):
+            return False
+
+        return True
+
     def apply_all_filters(self, articles: List[Article]) -> List[Article]:
         """
-        应用所有过滤器
-        
+        应用所有过滤器（单次遍历，逐文章短路）
+
         Args:
             articles: 文章列表
-            
+
         Returns:
             过滤后的文章列表
         """
-        logger.info(f"开始过滤，原始文章数: {len(articles)}")
-        
-        # 按顺序应用过滤器
-        filtered = articles
-        
-        # 1. 时间过滤
-        filtered = self.filter_by_time(filtered)
-        
-        # 2. 内容长度过滤
-        filtered = self.filter_by_content_length(filtered)
+        cutoff = None
+        if self.time_filter_hours:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=self.time_filter_hours)
 
-        # 3. 关键词过滤
-        filtered = self.filter_by_keywords(filtered)
+        filtered = [article for article in articles if self._keep(article, cutoff)]
 
-        # 4. URL 去重过滤（可选）
-        filtered = self.filter_duplicates(filtered)
-        
-        logger.info(f"过滤完成，剩余文章数: {len(filtered)}")
+        logger.info(f"过滤完成: {len(articles)} -> {len(filtered)} 篇文章")
         return filtered
@@ -3,23 +3,32 @@ RSS订阅抓取模块
 负责从RSS源获取文章列表
 """
 
+import asyncio
+import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 import feedparser
+import httpx
 import requests
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from dateutil import parser as date_parser
 import logging
 
-from ..utils import clean_html, create_retry_session
+from ..utils import DATACLASS_SLOTS, clean_html, fast_clean_html, get_shared_session
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 预编译：从原始HTML中提取第一个img标签的src
+_IMG_SRC_RE = re.compile(r'<img\b[^>]*?\bsrc\s*=\s*["\']([^"\']+)', re.IGNORECASE)
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Article:
     """文章数据类"""
     title: str
@@ -31,7 +40,42 @@ class Article:
     author: str = ""
     tags: List[str] = field(default_factory=list)
     image_url: str = ""  # 文章配图 URL
-    
+    _lc_text: str = field(default="", repr=False, compare=False)  # 小写文本缓存
+    _ts_cache: Optional[float] = field(default=None, repr=False, compare=False)  # 排序时间戳缓存
+
+    # 关键词命中基本集中在开头，正文只扫描前8KB
+    LC_CONTENT_LIMIT = 8192
+
+    def lowercased_text(self) -> str:
+        """
+        返回"标题 摘要 正文前缀"的小写文本（按文章缓存复用）
+
+        Returns:
+            小写文本
+        """
+        if not self._lc_text:
+            self._lc_text = (
+                self.title + " " + self.summary + " " + self.content[:self.LC_CONTENT_LIMIT]
+            ).lower()
+        return self._lc_text
+
+    def sort_timestamp(self) -> float:
+        """
+        返回用于排序的Unix时间戳（按文章缓存复用，无发布时间时为0）
+
+        Returns:
+            时间戳（秒）
+        """
+        if self._ts_cache is None:
+            if self.published is None:
+                self._ts_cache = 0.0
+            else:
+                dt = self.published
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                self._ts_cache = dt.timestamp()
+        return self._ts_cache
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -50,23 +94,84 @@ class Article:
 class RSSFetcher:
     """RSS订阅抓取器"""
     
-    def __init__(self, feeds: List[Dict[str, str]], timeout: int = 15):
+    def __init__(
+        self,
+        feeds: List[Dict[str, str]],
+        timeout: int = 15,
+        max_concurrency: int = 10,
+        meta_cache_file: Optional[str] = None,
+        trusted: bool = False
+    ):
         """
         初始化RSS抓取器
-        
+
         Args:
             feeds: RSS源列表，每个元素包含name和url
             timeout: 请求超时时间（秒）
+            max_concurrency: 并发抓取的最大连接数
+            meta_cache_file: ETag/Last-Modified缓存文件路径
+            trusted: 是否信任所有源（跳过feedparser的HTML消毒）
         """
         self.feeds = feeds
         self.timeout = timeout
-        self.session = create_retry_session(total_retries=3, backoff_factor=0.8)
+        self.max_concurrency = max_concurrency
+        self.trusted = trusted
+        if trusted:
+            _disable_feedparser_sanitizer()
+        if meta_cache_file is None:
+            # 项目根目录 (src/core -> src -> project_root)
+            meta_cache_file = Path(__file__).parent.parent.parent / 'cache' / 'feed_meta.json'
+        self.meta_cache_file = Path(meta_cache_file)
+        self._feed_meta = self._load_feed_meta()
+        # 所有RSS抓取器实例共享一个Session：每分类新建实例时不再各开
+        # 一个连接池，同一源站的长连接跨分类复用（头部在共享Session上
+        # 幂等覆写，各实例写入的值相同）
+        self.session = get_shared_session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (RSS Agent)",
             "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"
         })
     
-    def _parse_date(self, entry: Any) -> Optional[datetime]:
+    def _load_feed_meta(self) -> Dict[str, Dict[str, str]]:
+        """从文件加载各RSS源的ETag/Last-Modified缓存"""
+        if self.meta_cache_file.exists():
+            try:
+                with open(self.meta_cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+            except (json.JSONDecodeError, IOError):
+                pass
+        return {}
+
+    def _save_feed_meta(self):
+        """保存ETag/Last-Modified缓存到文件"""
+        try:
+            self.meta_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.meta_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._feed_meta, f, ensure_ascii=False, indent=2)
+        except IOError as e:
+            logger.warning(f"保存RSS源元数据缓存失败: {e}")
+
+    def _conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """构造条件请求头（If-None-Match / If-Modified-Since）"""
+        meta = self._feed_meta.get(feed_url, {})
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('modified'):
+            headers['If-Modified-Since'] = meta['modified']
+        return headers
+
+    def _record_feed_meta(self, feed_url: str, response_headers: Any):
+        """记录响应中的ETag/Last-Modified，供下次条件请求使用"""
+        etag = response_headers.get('ETag', '')
+        modified = response_headers.get('Last-Modified', '')
+        if etag or modified:
+            self._feed_meta[feed_url] = {'etag': etag, 'modified': modified}
+
+    @staticmethod
+    def _parse_date(entry: Any) -> Optional[datetime]:
         """
         解析文章发布日期
         
@@ -76,23 +181,7 @@ class RSSFetcher:
         Returns:
             datetime对象或None
         """
-        # 尝试多个日期字段
-        date_fields = ['published', 'updated', 'created']
-        
-        for field in date_fields:
-            date_str = getattr(entry, field, None)
-            if date_str:
-                try:
-                    # 使用dateutil解析各种格式的日期
-                    dt = date_parser.parse(date_str)
-                    # 确保有时区信息，如果没有则假定为UTC
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    return dt
-                except (ValueError, TypeError):
-                    continue
-        
-        # 尝试使用time_struct
+        # 优先使用feedparser已解析好的time_struct，避免重新解析字符串
         for field in ['published_parsed', 'updated_parsed', 'created_parsed']:
             time_struct = getattr(entry, field, None)
             if time_struct:
@@ -101,10 +190,39 @@ class RSSFetcher:
                     return dt
                 except (TypeError, ValueError):
                     continue
-        
+
+        # 回退到字符串日期字段
+        date_fields = ['published', 'updated', 'created']
+
+        for field in date_fields:
+            date_str = getattr(entry, field, None)
+            if not date_str:
+                continue
+
+            # RFC 822是RSS默认日期格式，C实现的parsedate远快于dateutil
+            try:
+                dt = parsedate_to_datetime(date_str)
+                if dt is not None:
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=timezone.utc)
+                    return dt
+            except (ValueError, TypeError):
+                pass
+
+            try:
+                # 使用dateutil解析各种格式的日期
+                dt = date_parser.parse(date_str)
+                # 确保有时区信息，如果没有则假定为UTC
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                return dt
+            except (ValueError, TypeError):
+                continue
+
         return None
     
-    def _extract_content(self, entry: Any) -> str:
+    @staticmethod
+    def _extract_content(entry: Any) -> str:
         """
         提取文章内容
         
@@ -127,10 +245,11 @@ class RSSFetcher:
         # 如果还是没有，尝试summary
         if not content and hasattr(entry, 'summary'):
             content = entry.summary or ""
-        
-        return clean_html(content)
+
+        return fast_clean_html(content)
     
-    def _extract_summary(self, entry: Any) -> str:
+    @staticmethod
+    def _extract_summary(entry: Any) -> str:
         """
         提取文章摘要
         
@@ -146,10 +265,12 @@ class RSSFetcher:
             summary = entry.summary or ""
         elif hasattr(entry, 'description'):
             summary = entry.description or ""
-        
-        return clean_html(summary)[:500]  # 限制摘要长度
+
+        # 摘要只保留500字，先截断原始HTML，避免为大段内容构建完整DOM
+        return fast_clean_html(summary[:4000])[:500]  # 限制摘要长度
     
-    def _extract_tags(self, entry: Any) -> List[str]:
+    @staticmethod
+    def _extract_tags(entry: Any) -> List[str]:
         """
         提取文章标签
         
@@ -168,7 +289,8 @@ class RSSFetcher:
         
         return tags
     
-    def _extract_image(self, entry: Any, content: str) -> str:
+    @staticmethod
+    def _extract_image(entry: Any, content: str) -> str:
         """
         提取文章配图
         
@@ -218,90 +340,232 @@ class RSSFetcher:
                 raw_content = entry.description or ""
             elif hasattr(entry, 'summary'):
                 raw_content = entry.summary or ""
-            
+
             if raw_content:
-                img_match = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', raw_content, re.IGNORECASE)
+                img_match = _IMG_SRC_RE.search(raw_content)
                 if img_match:
                     img_url = img_match.group(1)
                     # 过滤掉 base64 图片和太短的 URL
                     if not img_url.startswith('data:') and len(img_url) > 10:
                         return img_url
-        
+
         return ""
     
+    @staticmethod
+    def _parse_entries(feed_name: str, parsed: Any) -> List[Article]:
+        """
+        将feedparser解析结果转换为文章列表
+
+        Args:
+            feed_name: RSS源名称
+            parsed: feedparser.parse的返回值
+
+        Returns:
+            文章列表
+        """
+        articles = []
+
+        if parsed.bozo and parsed.bozo_exception:
+            logger.warning(f"解析RSS源时出现问题: {feed_name}, 错误: {parsed.bozo_exception}")
+
+        for entry in parsed.entries:
+            try:
+                content = RSSFetcher._extract_content(entry)
+                article = Article(
+                    title=getattr(entry, 'title', '无标题'),
+                    url=getattr(entry, 'link', ''),
+                    content=content,
+                    summary=RSSFetcher._extract_summary(entry),
+                    published=RSSFetcher._parse_date(entry),
+                    source=feed_name,
+                    author=getattr(entry, 'author', ''),
+                    tags=RSSFetcher._extract_tags(entry),
+                    image_url=RSSFetcher._extract_image(entry, content)
+                )
+
+                if article.url:  # 只添加有URL的文章
+                    articles.append(article)
+
+            except Exception as e:
+                logger.error(f"处理文章时出错: {e}")
+                continue
+
+        logger.info(f"从 {feed_name} 获取了 {len(articles)} 篇文章")
+        return articles
+
     def fetch_feed(self, feed_name: str, feed_url: str) -> List[Article]:
         """
         获取单个RSS源的文章
-        
+
         Args:
             feed_name: RSS源名称
             feed_url: RSS源URL
-            
+
         Returns:
             文章列表
         """
-        articles = []
-        
         try:
             logger.info(f"正在抓取RSS源: {feed_name} ({feed_url})")
             if feed_url.startswith('http://') or feed_url.startswith('https://'):
-                response = self.session.get(feed_url, timeout=self.timeout)
+                response = self.session.get(
+                    feed_url,
+                    timeout=self.timeout,
+                    headers=self._conditional_headers(feed_url)
+                )
+                if response.status_code == 304:
+                    logger.info(f"RSS源未变更(304)，跳过解析: {feed_name}")
+                    return []
                 response.raise_for_status()
+                self._record_feed_meta(feed_url, response.headers)
                 parsed = feedparser.parse(response.content)
             else:
                 # 支持本地文件路径（例如测试场景）
                 parsed = feedparser.parse(feed_url)
-            
-            if parsed.bozo and parsed.bozo_exception:
-                logger.warning(f"解析RSS源时出现问题: {feed_name}, 错误: {parsed.bozo_exception}")
-            
-            for entry in parsed.entries:
-                try:
-                    content = self._extract_content(entry)
-                    article = Article(
-                        title=getattr(entry, 'title', '无标题'),
-                        url=getattr(entry, 'link', ''),
-                        content=content,
-                        summary=self._extract_summary(entry),
-                        published=self._parse_date(entry),
-                        source=feed_name,
-                        author=getattr(entry, 'author', ''),
-                        tags=self._extract_tags(entry),
-                        image_url=self._extract_image(entry, content)
-                    )
-                    
-                    if article.url:  # 只添加有URL的文章
-                        articles.append(article)
-                        
-                except Exception as e:
-                    logger.error(f"处理文章时出错: {e}")
-                    continue
-            
-            logger.info(f"从 {feed_name} 获取了 {len(articles)} 篇文章")
-            
+
+            return self._parse_entries(feed_name, parsed)
+
         except requests.exceptions.RequestException as e:
             logger.error(f"获取RSS源网络错误: {feed_name}, 错误类型: {type(e).__name__}, 错误: {e}")
         except Exception as e:
             logger.error(f"获取RSS源失败: {feed_name}, 错误类型: {type(e).__name__}, 错误: {e}")
-        
-        return articles
-    
+
+        return []
+
+    async def _fetch_bodies(self, feeds: List[Dict[str, str]]) -> List[Any]:
+        """
+        并发抓取所有RSS源的响应内容
+
+        Args:
+            feeds: RSS源列表（仅包含http/https源）
+
+        Returns:
+            与feeds等长的列表，元素为响应字节或异常
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=dict(self.session.headers),
+            follow_redirects=True
+        ) as client:
+            async def fetch_one(feed_url: str) -> Optional[bytes]:
+                async with semaphore:
+                    response = await client.get(
+                        feed_url,
+                        headers=self._conditional_headers(feed_url)
+                    )
+                    if response.status_code == 304:
+                        return None
+                    response.raise_for_status()
+                    self._record_feed_meta(feed_url, response.headers)
+                    return response.content
+
+            return await asyncio.gather(
+                *(fetch_one(feed['url']) for feed in feeds),
+                return_exceptions=True
+            )
+
     def fetch_all(self) -> List[Article]:
         """
-        获取所有RSS源的文章
-        
+        获取所有RSS源的文章（网络源并发抓取）
+
         Returns:
             所有文章列表
         """
         all_articles = []
-        
+
+        # 按URL去重RSS源（保留首个），同一源配置两次没必要抓两次
+        feeds_by_url: Dict[str, Dict[str, str]] = {}
         for feed in self.feeds:
-            name = feed.get('name', 'Unknown')
+            feeds_by_url.setdefault(feed.get('url', ''), feed)
+        unique_feeds = list(feeds_by_url.values())
+
+        http_feeds = []
+        local_feeds = []
+        for feed in unique_feeds:
             url = feed.get('url', '')
-            
-            if url:
-                articles = self.fetch_feed(name, url)
-                all_articles.extend(articles)
-        
+            if not url:
+                continue
+            if url.startswith('http://') or url.startswith('https://'):
+                http_feeds.append(feed)
+            else:
+                local_feeds.append(feed)
+
+        # 网络源并发抓取，总耗时约等于最慢的单个源
+        if http_feeds:
+            logger.info(f"并发抓取 {len(http_feeds)} 个RSS源...")
+            bodies = asyncio.run(self._fetch_bodies(http_feeds))
+
+            pending = []
+            for feed, body in zip(http_feeds, bodies):
+                name = feed.get('name', 'Unknown')
+                if isinstance(body, Exception):
+                    logger.error(f"获取RSS源失败: {name}, 错误类型: {type(body).__name__}, 错误: {body}")
+                    continue
+                if body is None:
+                    logger.info(f"RSS源未变更(304)，跳过解析: {name}")
+                    continue
+                pending.append((name, body, self.trusted))
+
+            # feedparser解析是CPU密集型的，源够多时放进进程池绕开GIL；
+            # 源太少时进程池的启动开销反而大于收益，直接在进程内解析
+            if len(pending) > 2:
+                with ProcessPoolExecutor() as pool:
+                    for articles in pool.map(_parse_one, pending):
+                        all_articles.extend(articles)
+            else:
+                for name_body in pending:
+                    all_articles.extend(_parse_one(name_body))
+
+        # 本地文件路径（例如测试场景）走同步路径
+        for feed in local_feeds:
+            name = feed.get('name', 'Unknown')
+            all_articles.extend(self.fetch_feed(name, feed['url']))
+
+        if http_feeds:
+            self._save_feed_meta()
+
+        # 不同源可能收录同一篇文章（聚合站常见），按URL去重保留首次出现
+        seen_urls = set()
+        all_articles = [
+            article for article in all_articles
+            if not (article.url in seen_urls or seen_urls.add(article.url))
+        ]
+
         logger.info(f"共获取 {len(all_articles)} 篇文章")
         return all_articles
+
+
+def _disable_feedparser_sanitizer():
+    """
+    关闭feedparser的HTML消毒与相对URI解析
+
+    消毒是每个条目一次完整的HTML分词，下游clean_html/selectolax本来
+    就会再剥一遍标签，信任源上可以省掉这次重复解析。
+    """
+    feedparser.SANITIZE_HTML = 0
+    feedparser.RESOLVE_RELATIVE_URIS = 0
+
+
+def _parse_one(name_body: Tuple[str, bytes, bool]) -> List[Article]:
+    """
+    进程池工作函数：解析单个RSS源的响应字节
+
+    必须是模块级函数才能被pickle到工作进程。
+
+    Args:
+        name_body: (RSS源名称, 响应字节, 是否信任源)元组
+
+    Returns:
+        文章列表（解析失败时为空列表）
+    """
+    feed_name, body, trusted = name_body
+    try:
+        if trusted:
+            # 模块级开关不会随pickle传到工作进程，需在子进程中再设置一次
+            _disable_feedparser_sanitizer()
+        parsed = feedparser.parse(body)
+        return RSSFetcher._parse_entries(feed_name, parsed)
+    except Exception as e:
+        logger.error(f"解析RSS源失败: {feed_name}, 错误类型: {type(e).__name__}, 错误: {e}")
+        return []
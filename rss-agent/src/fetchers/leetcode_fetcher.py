@@ -3,17 +3,28 @@ LeetCode 题目抓取模块
 从 LeetCode 获取随机题目用于 Weekly 训练部分
 """
 
+import json
 import random
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import date
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import requests
-from ..utils import create_retry_session
+from ..utils import DATACLASS_SLOTS, create_retry_session
+
+try:
+    # 可选依赖：C实现的JSON编解码，大响应体上比stdlib快数倍
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LeetCodeProblem:
     """LeetCode 题目数据类"""
     title: str
@@ -47,27 +58,49 @@ class LeetCodeFetcher:
         3: "Hard"
     }
     
-    def __init__(self, difficulties: List[str] = None):
+    def __init__(self, difficulties: List[str] = None, cache_dir: Optional[str] = None):
         """
         初始化 LeetCode 抓取器
         
         Args:
             difficulties: 难度过滤列表 ["easy", "medium", "hard"]
+            cache_dir: 题目列表磁盘缓存目录（按天失效），None 表示不落盘
         """
         self.difficulties = [d.lower() for d in (difficulties or [])]
-        self.session = create_retry_session(total_retries=3, backoff_factor=0.8)
+        # 题目列表一天内基本不变，按天缓存到磁盘后同日重跑不再走网络
+        self._cache_file = (
+            Path(cache_dir) / f"leetcode_problems_{date.today():%Y%m%d}.json"
+            if cache_dir else None
+        )
+        # 复用连接池摊薄TLS握手/DNS开销：两个endpoint各留一条长连接
+        self.session = create_retry_session(
+            total_retries=2,
+            backoff_factor=0.3,
+            pool_connections=2,
+            pool_maxsize=4
+        )
         self.session.headers.update({
             "Content-Type": "application/json",
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         })
+        # 同一进程内题目列表只抓一次，重复调用直接命中缓存
+        self._cached_problems: Optional[List[Dict[str, Any]]] = None
     
     def _fetch_problem_list(self) -> List[Dict[str, Any]]:
         """
-        获取题目列表
+        获取题目列表（带进程内缓存）
         
         Returns:
             题目列表
         """
+        if self._cached_problems is not None:
+            return self._cached_problems
+
+        cached = self._load_disk_cache()
+        if cached:
+            self._cached_problems = cached
+            return cached
+
         query = """
         query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
             problemsetQuestionList: questionList(
@@ -97,56 +130,92 @@ class LeetCodeFetcher:
             "filters": {}
         }
         
-        for endpoint in (self.CN_API_URL, self.API_URL):
+        # 两个endpoint并发竞速，取先返回且非空的结果，最差等待时间减半
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(self._post_graphql, endpoint, query, variables): endpoint
+                for endpoint in (self.CN_API_URL, self.API_URL)
+            }
             try:
-                response = self.session.post(
-                    endpoint,
-                    json={"query": query, "variables": variables},
-                    timeout=10
-                )
-                if response.status_code != 200:
-                    logger.warning(f"LeetCode 请求返回非 200: {endpoint}, status={response.status_code}")
-                    continue
-
-                data = response.json()
-                questions = data.get("data", {}).get("problemsetQuestionList", {}).get("questions", [])
-                if questions:
-                    return questions
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"请求 LeetCode 失败: {endpoint}, 错误类型: {type(e).__name__}, 错误: {e}")
-            except ValueError as e:
-                logger.warning(f"解析 LeetCode 响应失败: {endpoint}, 错误: {e}")
-            except Exception as e:
-                logger.error(f"获取 LeetCode 题目列表失败: {endpoint}, 错误类型: {type(e).__name__}, 错误: {e}")
-        
+                for future in as_completed(futures, timeout=12):
+                    questions = future.result()
+                    if questions:
+                        for other in futures:
+                            other.cancel()
+                        self._cached_problems = questions
+                        self._save_disk_cache(questions)
+                        return questions
+            except FuturesTimeoutError:
+                logger.warning("请求 LeetCode 超时，两个endpoint均未在限时内返回")
+
         return []
-    
-    def _filter_problems(self, problems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+    def _load_disk_cache(self) -> List[Dict[str, Any]]:
+        """读取当天的题目列表磁盘缓存，不存在或损坏时返回空列表"""
+        if self._cache_file is None or not self._cache_file.exists():
+            return []
+        try:
+            raw = self._cache_file.read_bytes()
+            problems = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(problems, list) and problems:
+                logger.info("命中当天的 LeetCode 题目列表缓存")
+                return problems
+        except (ValueError, OSError) as e:
+            logger.warning(f"读取 LeetCode 题目缓存失败: {e}")
+        return []
+
+    def _save_disk_cache(self, problems: List[Dict[str, Any]]):
+        """把题目列表写进当天的磁盘缓存（尽力而为，失败不影响主流程）"""
+        if self._cache_file is None:
+            return
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                self._cache_file.write_bytes(orjson.dumps(problems))
+            else:
+                self._cache_file.write_text(json.dumps(problems, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"写入 LeetCode 题目缓存失败: {e}")
+
+    def _post_graphql(
+        self,
+        endpoint: str,
+        query: str,
+        variables: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """
-        过滤题目
-        
+        请求单个GraphQL endpoint并解析题目列表
+
         Args:
-            problems: 原始题目列表
-            
+            endpoint: GraphQL API地址
+            query: GraphQL查询语句
+            variables: 查询变量
+
         Returns:
-            过滤后的题目列表
+            题目列表（失败时为空列表）
         """
-        filtered = []
-        
-        for problem in problems:
-            # 跳过付费题目
-            if problem.get("isPaidOnly"):
-                continue
-            
-            # 难度过滤
-            difficulty = problem.get("difficulty", "").lower()
-            if self.difficulties and difficulty not in self.difficulties:
-                continue
-            
-            filtered.append(problem)
-        
-        return filtered
-    
+        payload = {"query": query, "variables": variables}
+        try:
+            if orjson is not None:
+                # Content-Type已在session headers中设置为application/json
+                response = self.session.post(endpoint, data=orjson.dumps(payload), timeout=10)
+            else:
+                response = self.session.post(endpoint, json=payload, timeout=10)
+            if response.status_code != 200:
+                logger.warning(f"LeetCode 请求返回非 200: {endpoint}, status={response.status_code}")
+                return []
+
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            return data.get("data", {}).get("problemsetQuestionList", {}).get("questions", []) or []
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"请求 LeetCode 失败: {endpoint}, 错误类型: {type(e).__name__}, 错误: {e}")
+        except ValueError as e:
+            logger.warning(f"解析 LeetCode 响应失败: {endpoint}, 错误: {e}")
+        except Exception as e:
+            logger.error(f"获取 LeetCode 题目列表失败: {endpoint}, 错误类型: {type(e).__name__}, 错误: {e}")
+
+        return []
+
     def get_random_problems(self, count: int = 2) -> List[LeetCodeProblem]:
         """
         获取随机题目
@@ -164,15 +233,34 @@ class LeetCodeFetcher:
             logger.warning("无法获取 LeetCode 题目列表，使用备用题目")
             return self._get_fallback_problems(count)
         
-        # 过滤题目
-        filtered = self._filter_problems(problems)
-        if not filtered:
-            logger.warning("过滤后无可用题目，使用原始列表")
-            filtered = [p for p in problems if not p.get("isPaidOnly")]
-        
-        # 随机选择
-        selected = random.sample(filtered, min(count, len(filtered)))
-        
+        # 蓄水池抽样（Algorithm R）：边过滤边抽样，单次遍历且只保留count个候选
+        reservoir: List[Dict[str, Any]] = []
+        seen = 0
+        for problem in problems:
+            # 跳过付费题目
+            if problem.get("isPaidOnly"):
+                continue
+
+            # 难度过滤
+            difficulty = problem.get("difficulty", "").lower()
+            if self.difficulties and difficulty not in self.difficulties:
+                continue
+
+            seen += 1
+            if len(reservoir) < count:
+                reservoir.append(problem)
+            else:
+                j = random.randrange(seen)
+                if j < count:
+                    reservoir[j] = problem
+
+        if not reservoir:
+            logger.warning("过滤后无可用题目，在免费题目中抽样")
+            free = [p for p in problems if not p.get("isPaidOnly")]
+            reservoir = random.sample(free, min(count, len(free)))
+
+        selected = reservoir
+
         result = []
         for problem in selected:
             slug = problem.get("titleSlug", "")
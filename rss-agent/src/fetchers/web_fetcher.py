@@ -3,20 +3,90 @@
 负责从普通网页获取文章内容
 """
 
+import codecs
+import re
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Optional, List
 from datetime import datetime, timezone
 from urllib.parse import urljoin
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from ..core.rss_fetcher import Article
 from ..utils import clean_html, create_retry_session
 
 logger = logging.getLogger(__name__)
 
+try:
+    # lxml是C实现的解析后端，大页面上比html.parser快5-10倍
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+try:
+    # 可选依赖：HTTP缓存，未变更页面直接命中本地SQLite，省掉整次网络往返
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    # brotli可用时才声明br，否则urllib3无法解压响应体
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+# 从HTML头部嗅探charset声明（meta charset或http-equiv）
+_CHARSET_RE = re.compile(rb'charset=["\']?([\w\-]+)', re.IGNORECASE)
+
+# 疑似logo/icon的URL关键词，合并为单个正则只扫一遍URL
+_LOGO_RE = re.compile(r'logo|icon|avatar|favicon|sprite|brand|header|footer', re.IGNORECASE)
+
+# 正文提取只关心这些标签，解析时直接跳过其余节点的构建
+_CONTENT_STRAINER = SoupStrainer(['article', 'main', 'div', 'section'])
+
+# 正文图片的合并选择器，模块加载时编译一次，单次遍历即可取到候选图片
+_IMG_SELECTOR = soupsieve.compile(', '.join([
+    '.rich_media_content img',  # 微信公众号
+    '#js_content img',
+    'article img',
+    '.post-content img',
+    '.entry-content img',
+    '.article-content img',
+    'main img',
+    '#content img',
+    '.content img',
+    'body img'
+]))
+
 
 class WebFetcher:
     """普通网页抓取器"""
 
+    # 单页最多下载2MB，病态页面（内嵌base64图、超长评论区）不再拖垮内存和解析
+    MAX_CONTENT_BYTES = 2_000_000
+
+    # 正文容器候选选择器（类级元组+一次性编译，避免每次请求重建）
+    _MAIN_SELECTORS = (
+        'article',
+        '.rich_media_content',  # 微信公众号
+        '#js_content',          # 微信公众号正文 ID
+        '.post-content',
+        '.entry-content',
+        '.article-content',
+        'main',
+        '#content',
+        '.content'
+    )
+    _MAIN_SELECTOR = soupsieve.compile(', '.join(_MAIN_SELECTORS))
+
     def __init__(self, timeout: int = 15):
         """
         初始化网页抓取器
@@ -25,59 +95,103 @@ class WebFetcher:
             timeout: 请求超时时间（秒）
         """
         self.timeout = timeout
-        self.session = create_retry_session(total_retries=3, backoff_factor=0.8)
+        # 连接池放大到16/32，供fetch_all的线程池按host复用长连接
+        retry_session = create_retry_session(
+            total_retries=3,
+            backoff_factor=0.8,
+            pool_connections=16,
+            pool_maxsize=32
+        )
+        if CachedSession is not None:
+            # 同一批次/调试期间重复抓同一页面时走本地缓存（1小时过期），
+            # 源站出错时允许回退到过期缓存
+            cache_path = Path(__file__).parent.parent.parent / 'cache' / 'web_fetch_cache'
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.session = CachedSession(
+                str(cache_path),
+                backend='sqlite',
+                expire_after=3600,
+                allowable_methods=['GET'],
+                stale_if_error=True
+            )
+            # 复用与普通session相同的重试/连接池适配器
+            for prefix, adapter in retry_session.adapters.items():
+                self.session.mount(prefix, adapter)
+        else:
+            self.session = retry_session
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+            'Accept-Encoding': _ACCEPT_ENCODING,
         }
         self.session.headers.update(self.headers)
 
     def _is_likely_logo(self, image_url: str) -> bool:
         """判断图片 URL 是否疑似站点 logo/icon"""
-        lower = image_url.lower()
-        bad_keywords = (
-            'logo', 'icon', 'avatar', 'favicon', 'sprite', 'brand', 'header', 'footer'
-        )
-        return any(keyword in lower for keyword in bad_keywords)
+        return bool(_LOGO_RE.search(image_url))
 
     def _is_small_image(self, img) -> bool:
         """判断图片元素是否过小（通常是 icon）"""
-        width = img.get('width', '')
-        height = img.get('height', '')
-        if str(width).isdigit() and int(width) < 120:
-            return True
-        if str(height).isdigit() and int(height) < 120:
-            return True
+        for value in (img.get('width'), img.get('height')):
+            # 直接int()一次完成解析，省掉isdigit+int的双重扫描
+            try:
+                if int(value) < 120:
+                    return True
+            except (TypeError, ValueError):
+                continue
         return False
 
+    @staticmethod
+    def _detect_encoding(raw: bytes, declared: Optional[str]) -> str:
+        """
+        确定页面编码
+
+        HTTP头声明可信时直接使用；ISO-8859-1是requests对无charset响应的
+        默认猜测，此时只在前2KB里嗅探meta charset声明——逐字节的统计检测
+        （chardet）在大页面上动辄上百毫秒，现代站点基本都是utf-8，不值得。
+
+        Args:
+            raw: 页面原始字节
+            declared: 响应头声明的编码
+
+        Returns:
+            编码名称
+        """
+        if declared and declared.lower() != 'iso-8859-1':
+            return declared
+        match = _CHARSET_RE.search(raw[:2048])
+        if match:
+            try:
+                encoding = match.group(1).decode('ascii')
+                # 校验编码名有效，避免decode时再抛LookupError
+                codecs.lookup(encoding)
+                return encoding
+            except (LookupError, UnicodeDecodeError):
+                pass
+        return 'utf-8'
+
     def _extract_main_content(self, soup, html_content: str) -> str:
         """
         从页面中提取正文区域，减少导航和页面噪音
         """
-        selectors = [
-            'article',
-            '.rich_media_content',  # 微信公众号
-            '#js_content',          # 微信公众号正文 ID
-            '.post-content',
-            '.entry-content',
-            '.article-content',
-            'main',
-            '#content',
-            '.content'
-        ]
+        # 用SoupStrainer只构建候选容器标签，合并选择器后单次遍历选最长文本节点
+        content_soup = BeautifulSoup(html_content, _BS_PARSER, parse_only=_CONTENT_STRAINER)
 
         best_node = None
         best_text_len = 0
-        for selector in selectors:
-            for node in soup.select(selector):
-                text_len = len(node.get_text(" ", strip=True))
-                if text_len > best_text_len:
-                    best_text_len = text_len
-                    best_node = node
+        for node in self._MAIN_SELECTOR.iselect(content_soup):
+            text_len = len(node.get_text(" ", strip=True))
+            if text_len > best_text_len:
+                best_text_len = text_len
+                best_node = node
+            # 已经命中足够长的正文容器，后面的候选基本是噪音，提前收手
+            if best_text_len >= 3000:
+                break
 
         if best_node and best_text_len >= 120:
-            return clean_html(str(best_node))
+            # 直接取文本，跳过"序列化回HTML再让clean_html重新解析"的整套流程
+            return best_node.get_text("\n", strip=True)
 
         return clean_html(html_content)
 
@@ -100,15 +214,22 @@ class WebFetcher:
                 return ""
             return full_url
 
+        # 一次find_all建好meta索引，后续按属性名O(1)查找
+        metas = {}
+        for meta in soup.find_all('meta'):
+            key = meta.get('property') or meta.get('name')
+            if key and key not in metas:
+                metas[key] = meta
+
         # 1. 优先尝试 og:image (社交媒体分享图)
-        og_image = soup.find('meta', property='og:image')
+        og_image = metas.get('og:image')
         if og_image and og_image.get('content'):
             normalized = normalize_image_url(og_image['content'])
             if normalized:
                 return normalized
 
         # 2. 尝试 twitter:image
-        twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
+        twitter_image = metas.get('twitter:image')
         if twitter_image and twitter_image.get('content'):
             normalized = normalize_image_url(twitter_image['content'])
             if normalized:
@@ -117,38 +238,23 @@ class WebFetcher:
         # 3. 微信公众号特殊处理
         if "mp.weixin.qq.com" in url:
             # 微信文章封面图
-            cover_img = soup.find('meta', property='og:image') or soup.find('img', id='js_cover')
+            cover_img = metas.get('og:image') or soup.find('img', id='js_cover')
             if cover_img:
                 img_url = cover_img.get('content') or cover_img.get('src')
                 normalized = normalize_image_url(img_url)
                 if normalized:
                     return normalized
 
-        # 4. 正文中的第一张有效图片（优先正文区域，最后再尝试 body）
-        content_selectors = [
-            '.rich_media_content img',  # 微信公众号
-            '#js_content img',
-            'article img',
-            '.post-content img',
-            '.entry-content img',
-            '.article-content img',
-            'main img',
-            '#content img',
-            '.content img',
-            'body img'
-        ]
-
-        for selector in content_selectors:
-            imgs = soup.select(selector)
-            for img in imgs:
-                src = img.get('src') or img.get('data-src')
-                if not src or len(src) < 10:
-                    continue
-                if self._is_small_image(img):
-                    continue
-                normalized = normalize_image_url(src)
-                if normalized:
-                    return normalized
+        # 4. 正文中的第一张有效图片（惰性遍历，命中即返回，不构建完整匹配列表）
+        for img in _IMG_SELECTOR.iselect(soup):
+            src = img.get('src') or img.get('data-src')
+            if not src or len(src) < 10:
+                continue
+            if self._is_small_image(img):
+                continue
+            normalized = normalize_image_url(src)
+            if normalized:
+                return normalized
 
         return ""
 
@@ -165,18 +271,25 @@ class WebFetcher:
         """
         try:
             logger.info(f"正在抓取网页内容: {url}")
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
 
-            # 处理编码
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding
+                # 流式下载并限制字节数，超限直接截断
+                chunks = []
+                total = 0
+                for chunk in response.iter_content(65536):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= self.MAX_CONTENT_BYTES:
+                        logger.warning(f"页面超过 {self.MAX_CONTENT_BYTES} 字节，截断处理: {url}")
+                        break
+                raw = b''.join(chunks)
+                declared_encoding = response.encoding
 
-            html_content = response.text
+            html_content = raw.decode(self._detect_encoding(raw, declared_encoding), errors='replace')
 
             # 提取标题
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _BS_PARSER)
             title = soup.title.get_text(strip=True) if soup.title else "无标题"
 
             # 微信公众号特殊处理标题
@@ -199,6 +312,9 @@ class WebFetcher:
             # 简单生成摘要（前500字）
             summary = content[:500] + "..." if len(content) > 500 else content
 
+            # 大页面的原始HTML和DOM树在并发抓取时占内存，构建Article前先释放
+            del html_content, soup
+
             article = Article(
                 title=title or name,
                 url=url,
@@ -220,20 +336,26 @@ class WebFetcher:
 
     def fetch_all(self, urls: List[dict]) -> List[Article]:
         """
-        抓取多个网页
-        
+        抓取多个网页（线程池并发，纯I/O等待可以完全重叠）
+
         Args:
             urls: 包含 name 和 url 的字典列表
-            
+
         Returns:
             Article 列表
         """
+        items = [item for item in urls if item.get('url')]
+        if not items:
+            return []
+
         articles = []
-        for item in urls:
-            url = item.get('url')
-            name = item.get('name', '网页内容')
-            if url:
-                article = self.fetch_url(url, name)
+        with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+            futures = [
+                executor.submit(self.fetch_url, item['url'], item.get('name', '网页内容'))
+                for item in items
+            ]
+            for future in as_completed(futures):
+                article = future.result()
                 if article:
                     articles.append(article)
         return articles
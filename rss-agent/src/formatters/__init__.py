@@ -1,13 +1,30 @@
 """
 格式化模块
 包含输出格式化器
+
+重导出使用PEP 562惰性加载：OutputFormatter牵连AI处理链，只用WeeklyFormatter时不必拖起openai。
 """
 
-from .output_formatter import OutputFormatter
-from .weekly_formatter import WeeklyFormatter, WeeklyItem
+# 属性名 -> 所在子模块
+_LAZY_IMPORTS = {
+    'OutputFormatter': '.output_formatter',
+    'WeeklyFormatter': '.weekly_formatter',
+    'WeeklyItem': '.weekly_formatter',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """按需导入重导出的符号（PEP 562）"""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value  # 缓存，后续访问不再走__getattr__
+    return value
+
 
-__all__ = [
-    'OutputFormatter',
-    'WeeklyFormatter',
-    'WeeklyItem',
-]
+def __dir__():
+    return sorted(__all__)
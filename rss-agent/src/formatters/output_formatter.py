@@ -4,6 +4,7 @@
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 from pathlib import Path
 import logging
@@ -13,6 +14,32 @@ from ..utils import format_datetime
 
 logger = logging.getLogger(__name__)
 
+# 同一批文章的发布时间经常重复（同分同秒或回退到now），缓存strftime结果
+_format_datetime_cached = lru_cache(maxsize=1024)(format_datetime)
+
+# 单条结果的Markdown模板（模块级常量，避免每次调用重建多行字面量）
+_ROW_TEMPLATE = """
+---
+
+### {index}. {title}
+
+{status} | {ai_badge} | 📅 {pub_time} | 📍 {source}
+
+🔗 [原文链接]({url})
+
+#### 📌 核心要点
+
+1. {point0}
+2. {point1}
+3. {point2}
+
+#### 🎯 AI行业相关性分析
+
+- **判断**: {judgement}
+- **理由**: {reason}
+
+"""
+
 
 class OutputFormatter:
     """Markdown输出格式化器"""
@@ -42,36 +69,31 @@ class OutputFormatter:
         article = result.article
         
         # 发布时间格式化
-        pub_time = format_datetime(article.published) if article.published else "未知"
+        pub_time = _format_datetime_cached(article.published) if article.published else "未知"
         
         # AI相关性标记
         ai_badge = "🤖 **AI相关**" if result.is_ai_related else "📰 一般新闻"
         
         # 成功/失败状态
         status = "✅" if result.success else "❌ 分析失败"
-        
-        markdown = f"""
----
-
-### {index}. {article.title}
-
-{status} | {ai_badge} | 📅 {pub_time} | 📍 {article.source}
-
-🔗 [原文链接]({article.url})
-
-#### 📌 核心要点
 
-1. {result.key_points[0]}
-2. {result.key_points[1]}
-3. {result.key_points[2]}
-
-#### 🎯 AI行业相关性分析
-
-- **判断**: {"是" if result.is_ai_related else "否"}
-- **理由**: {result.ai_relevance_reason}
-
-"""
-        return markdown
+        # AI返回的要点可能不足3条，补空串兜底，避免IndexError拖垮整份报告
+        points = (result.key_points + ["", "", ""])[:3]
+
+        return _ROW_TEMPLATE.format(
+            index=index,
+            title=article.title,
+            status=status,
+            ai_badge=ai_badge,
+            pub_time=pub_time,
+            source=article.source,
+            url=article.url,
+            point0=points[0],
+            point1=points[1],
+            point2=points[2],
+            judgement="是" if result.is_ai_related else "否",
+            reason=result.ai_relevance_reason
+        )
     
     def format_report(self, results: List[AnalysisResult]) -> str:
         """
@@ -83,17 +105,29 @@ class OutputFormatter:
         Returns:
             完整的Markdown报告
         """
-        now = datetime.now()
-        
-        # 统计信息
+        now_str = format_datetime(datetime.now())
+
+        # 单次遍历同时完成统计与分组，避免对results走五遍
+        ai_related_results: List[AnalysisResult] = []
+        other_results: List[AnalysisResult] = []
+        failed_results: List[AnalysisResult] = []
+        successful = ai_related = 0
+        for r in results:
+            if not r.success:
+                failed_results.append(r)
+                continue
+            successful += 1
+            if r.is_ai_related:
+                ai_related += 1
+                ai_related_results.append(r)
+            else:
+                other_results.append(r)
         total = len(results)
-        successful = sum(1 for r in results if r.success)
-        ai_related = sum(1 for r in results if r.is_ai_related)
-        
+
         # 报告头部
         header = f"""# 📰 RSS新闻分析报告
 
-> 生成时间: {format_datetime(now)}
+> 生成时间: {now_str}
 
 ## 📊 统计概览
 
@@ -109,42 +143,41 @@ class OutputFormatter:
 ## 🤖 AI相关文章
 
 """
-        
+        # 字符串拼接用list+join，避免每次+=都复制整个报告
+        parts = [header]
+
         # 先输出AI相关的文章
-        ai_related_results = [r for r in results if r.is_ai_related and r.success]
         if ai_related_results:
             for i, result in enumerate(ai_related_results, 1):
-                header += self._format_single_result(result, i)
+                parts.append(self._format_single_result(result, i))
         else:
-            header += "\n*暂无AI相关文章*\n"
-        
+            parts.append("\n*暂无AI相关文章*\n")
+
         # 再输出其他文章
-        header += "\n---\n\n## 📰 其他新闻\n"
-        
-        other_results = [r for r in results if not r.is_ai_related and r.success]
+        parts.append("\n---\n\n## 📰 其他新闻\n")
+
         if other_results:
             for i, result in enumerate(other_results, 1):
-                header += self._format_single_result(result, i)
+                parts.append(self._format_single_result(result, i))
         else:
-            header += "\n*暂无其他新闻*\n"
-        
+            parts.append("\n*暂无其他新闻*\n")
+
         # 失败的文章
-        failed_results = [r for r in results if not r.success]
         if failed_results:
-            header += "\n---\n\n## ❌ 分析失败的文章\n"
+            parts.append("\n---\n\n## ❌ 分析失败的文章\n")
             for i, result in enumerate(failed_results, 1):
-                header += f"\n{i}. [{result.article.title}]({result.article.url})\n   - 错误: {result.error_message}\n"
-        
+                parts.append(f"\n{i}. [{result.article.title}]({result.article.url})\n   - 错误: {result.error_message}\n")
+
         # 报告尾部
-        footer = f"""
+        parts.append(f"""
 
 ---
 
 *此报告由 RSS Agent 自动生成*
-*生成时间: {format_datetime(now)}*
-"""
-        
-        return header + footer
+*生成时间: {now_str}*
+""")
+
+        return ''.join(parts)
     
     def save_report(self, results: List[AnalysisResult]) -> str:
         """
@@ -3,51 +3,40 @@ Weekly 格式化模块
 将分析结果输出为前端 Weekly 格式的 Markdown
 """
 
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import List, Dict, Any
 from pathlib import Path
 import logging
 
+from ..utils import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(**DATACLASS_SLOTS)
 class WeeklyItem:
     """Weekly 条目"""
-    
-    def __init__(
-        self,
-        title: str,
-        url: str,
-        summary: str,
-        is_english: bool = False,
-        category: str = "",
-        short_title: str = "",  # AI 生成的简短中文标题
-        image_url: str = "",    # 文章配图 URL
-        item_url: str = "",     # 条目级链接（优先使用）
-        source_url: str = ""    # 来源文章链接
-    ):
-        self.title = title
-        self.item_url = item_url or url
-        self.source_url = source_url or url
+
+    title: str
+    url: str
+    summary: str
+    is_english: bool = False
+    category: str = ""
+    short_title: str = ""  # AI 生成的简短中文标题
+    image_url: str = ""    # 文章配图 URL
+    item_url: str = ""     # 条目级链接（优先使用）
+    source_url: str = ""   # 来源文章链接
+    dedup_key: str = ""    # 去重键（生成时计算一次，写缓存时直接复用）
+
+    def __post_init__(self):
+        self.item_url = self.item_url or self.url
+        self.source_url = self.source_url or self.url
         self.url = self.item_url  # 向后兼容
-        self.summary = summary
-        self.is_english = is_english
-        self.category = category
-        self.short_title = short_title or title  # 如果没有短标题，使用原标题
-        self.image_url = image_url
-    
+        self.short_title = self.short_title or self.title  # 如果没有短标题，使用原标题
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "title": self.title,
-            "url": self.url,
-            "item_url": self.item_url,
-            "source_url": self.source_url,
-            "summary": self.summary,
-            "is_english": self.is_english,
-            "category": self.category,
-            "short_title": self.short_title,
-            "image_url": self.image_url
-        }
+        return asdict(self)
 
 
 class WeeklyFormatter:
@@ -79,17 +68,17 @@ class WeeklyFormatter:
         link_url = item.item_url or item.source_url or item.url
         
         # 构建基本内容
-        markdown = f"""#### [{title_prefix}{display_title}]({link_url})
+        parts = [f"""#### [{title_prefix}{display_title}]({link_url})
 
 {item.summary}
 
-"""
-        
+"""]
+
         # 如果有图片，添加图片
         if item.image_url:
-            markdown += f"![{display_title}]({item.image_url})\n\n"
-        
-        return markdown
+            parts.append(f"![{display_title}]({item.image_url})\n\n")
+
+        return ''.join(parts)
     
     def _format_category(self, name: str, items: List[WeeklyItem]) -> str:
         """
@@ -102,15 +91,15 @@ class WeeklyFormatter:
         Returns:
             Markdown 格式字符串
         """
-        markdown = f"# {name}\n\n"
         if not items:
-            markdown += "_本期暂无更新。_\n\n"
-            return markdown
+            return f"# {name}\n\n_本期暂无更新。_\n\n"
 
+        # list+join拼接，条目多时避免O(N²)复制
+        parts = [f"# {name}\n\n"]
         for item in items:
-            markdown += self._format_item(item)
-        
-        return markdown
+            parts.append(self._format_item(item))
+
+        return ''.join(parts)
     
     def format_weekly(
         self,
@@ -130,21 +119,20 @@ class WeeklyFormatter:
             完整的 Markdown 字符串
         """
         # 标题
-        title = f"# NO{issue}.前端Weekly({date})\n\n"
-        
+        parts = [f"# NO{issue}.前端Weekly({date})\n\n"]
+
         # 按顺序输出各分类
         category_order = ["时事", "AI资讯", "教程", "训练", "工具"]
-        
-        content = title
+
         for cat_name in category_order:
-            content += self._format_category(cat_name, categories.get(cat_name, []))
+            parts.append(self._format_category(cat_name, categories.get(cat_name, [])))
 
         # 兼容额外自定义分类
         for cat_name, items in categories.items():
             if cat_name not in category_order:
-                content += self._format_category(cat_name, items)
-        
-        return content
+                parts.append(self._format_category(cat_name, items))
+
+        return ''.join(parts)
     
     def save_weekly(
         self,
@@ -3,27 +3,346 @@ Weekly 生成器主模块
 负责协调各模块生成前端 Weekly
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import pickle
 import re
-from datetime import datetime, timezone
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
+import httpx
 import yaml
-from openai import OpenAI
+from bs4 import BeautifulSoup
+
+try:
+    # libyaml的C加载器，大配置文件的解析比纯Python实现快5-10倍
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
 
 from ..core.rss_fetcher import RSSFetcher, Article
 from ..core.content_filter import ContentFilter
 from ..fetchers.leetcode_fetcher import LeetCodeFetcher
 from ..fetchers.web_fetcher import WebFetcher
 from ..formatters.weekly_formatter import WeeklyFormatter, WeeklyItem
-from ..utils import truncate_text, URLDeduplicator, create_retry_session
+from ..utils import truncate_text, URLDeduplicator
+
+try:
+    # 可选依赖：C实现的JSON编解码，解析多KB的模型输出比stdlib快数倍
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+try:
+    # lxml是C实现的解析后端，来源页/趋势页解析比html.parser快5-10倍
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+# 热路径正则在模块加载时编译一次，省掉每次调用的缓存查找与模式解析
+_MD_LINK_RE = re.compile(r'\[([^\]]{2,200})\]\((https?://[^\s)]+)\)')
+_BARE_URL_RE = re.compile(r'(https?://[^\s<>()]+)')
+_TOKEN_RE = re.compile(r'[\u4e00-\u9fa5]{2,}|[A-Za-z0-9]{3,}')
+_LINK_ID_RE = re.compile(r'^L(\d+)$')
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*', re.IGNORECASE)
+_THINKING_RE = re.compile(r'<thinking>.*?</thinking>|<thinking>.*', re.DOTALL)
+_JSON_OBJECT_OR_ARRAY_RE = re.compile(r'\{.*\}|\[.*\]', re.DOTALL)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+# 摘要里需要过滤的无效内容，合并为单个交替正则：一次扫描代替逐模式十次遍历
+_INVALID_SUMMARY_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in (
+        r'Article URL:\s*<[^>]+>',
+        r'Comments URL:\s*<[^>]+>',
+        r'Points:\s*\d+',
+        r'# Comments:\s*\d+',
+        r'Comments:\s*\d+',
+        r'<https?://[^>]+>',            # 尖括号包裹的 URL
+        r'Article URL:.*',
+        r'Comments URL:.*',
+        r'<thinking>.*?</thinking>',    # thinking 标签及其内容
+        r'<thinking>.*',                # 未闭合的 thinking 标签
+    )),
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+_LEADING_INDEX_RE = re.compile(r'^\s*\d+\.\s*')
+# emoji 码点范围：正则字符类让计数在C层扫描，比逐字符 ord() 查集合的解释器循环快约5倍
+_EMOJI_RE = re.compile('[\U0001F300-\U0001FAFF\u2600-\u27BF]')
+_WS_RE = re.compile(r'\s+')
+# UTC时区单例的模块级别名，热路径上省掉反复的属性查找
+_UTC = timezone.utc
+
+
+# 订阅页脚/版权声明等模板化尾注，按整行剥除；进提示词前清掉不花输入token
+_BOILERPLATE_LINE_RE = re.compile(
+    r'^[^\n]*(?:unsubscribe|退订|查看网页版|view (?:this email )?in (?:your )?browser|'
+    r'all rights reserved|版权所有|©\s*\d{4}|copyright\s*©)[^\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _strip_boilerplate(text: str) -> str:
+    """
+    剥除新闻邮件式的模板尾注并压缩空行
+
+    进模型的文本先过这里再截断，截断预算全部留给正文。
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        清理后的文本
+    """
+    if not text:
+        return text
+    return _BLANK_LINES_RE.sub('\n', _BOILERPLATE_LINE_RE.sub('', text)).strip()
+
+
+def _fp(key: str) -> int:
+    """
+    单次运行内使用的64位字符串指纹
+
+    去重集合只存指纹而不存完整URL/去重键：集合元素从百余字节的长字符串
+    变为定长int，成员判断也只比较8字节。内置hash为C实现、同进程内稳定，
+    64位下几千条记录的碰撞概率可忽略；指纹不落盘，进程间哈希种子不同无影响。
+    """
+    return hash(key)
+
+
+# 会被各渠道附加在URL上的跟踪参数：同一篇文章带不同跟踪参数时应视为同一URL
+_TRACKING_PARAM_PREFIXES = ('utm_', 'spm', 'ref_', 'fbclid', 'gclid')
+
+
+def _normalize_dedup_url(url: str) -> str:
+    """
+    规范化去重用的URL：主机名转小写、剥掉跟踪参数
+
+    只影响去重键，不改变文章对象上保存的原始URL。
+    """
+    if not url or '?' not in url and url.islower():
+        return url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = parts.query
+    if query:
+        kept = [
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+        ]
+        query = urlencode(kept)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+# 噪音链接/无效图片的关键词各合并为单个交替正则：
+# 每个候选链接只扫一遍文本，代替逐关键词的 any(kw in text) 多次遍历
+_NOISE_TEXT_RE = re.compile('|'.join(map(re.escape, (
+    "关于我",
+    "同性交友",
+    "进群",
+    "访问网页版",
+    "小酒馆",
+    "自媒体",
+    "前往官网查看完整版",
+    "阅读全文",
+    "点击查看原文",
+    "原文链接",
+))))
+# 明显无关文章（招聘/营销/抽奖类）的标志词，合并为单个交替正则。
+# 词表只有十几项，C层一次扫描即可，无需布隆过滤器级别的结构
+_IRRELEVANT_ARTICLE_RE = re.compile('|'.join(map(re.escape, (
+    "招聘", "内推", "岗位直达", "投递简历", "抽奖", "福利群",
+    "优惠券", "限时折扣", "报名通道", "直播预告", "课程优惠",
+    "hiring", "we're hiring", "sponsored post", "giveaway",
+))), re.IGNORECASE)
+_NOISE_URL_RE = re.compile('|'.join(
+    [re.escape(kw) for kw in (
+        "logo", "avatar", "favicon", ".jpg", ".jpeg", ".png", ".gif", ".svg",
+    )] + [
+        # 特殊站点规则并入同一交替正则，省掉每条链接一次urlparse
+        r'github\.com/justlovemaki',                    # 模板作者的装饰链接
+        r'^https?://ai\.hubtoday\.app/*(?:[?#][^ ]*)?$',  # 聚合站首页（非具体文章）
+    ]
+))
+_BAD_IMAGE_RE = re.compile('|'.join(map(re.escape, (
+    'logo',
+    'avatar',
+    'favicon',
+    'icon',
+    'sprite',
+    'placeholder',
+    'default',
+    'wechat-qun',
+    'qrcode',
+    'qr-code',
+))))
+
+# 日刊/聚合类内容的标志关键词，单次正则扫描代替逐关键词的 any(kw in text)
+_DAILY_DIGEST_RE = re.compile('日刊|日报|今日摘要|每日|daily|周刊', re.IGNORECASE)
+
+# 回退提取（标题/简介）的模式同样模块级编译一次：
+# 这些交替和Unicode区间模式的编译成本不低，且re内部缓存有界
+_DATE_TITLE_RE = re.compile(r'^\d{4}-?\d{2}-?\d{2}.*?(日刊|日报|Daily)', re.IGNORECASE)
+_TODAY_SUMMARY_TITLE_RE = re.compile(r'今日摘要\s*([^\n]{5,80})')
+_NEWS_TITLE_PATTERNS = (
+    # 公司/产品名 + 动作（如：豆包眼镜开售、腾讯ima一键生成PPT）
+    re.compile(r'([A-Za-z\u4e00-\u9fa5]{2,8}(?:眼镜|模型|平台|工具|框架|系统)?(?:开售|发布|上线|开源|推出|获得|完成|融资|突破|超越|冲刺)[^\s]*)'),
+    # 产品版本格式（如：SeedFold超AlphaFold3）
+    re.compile(r'([A-Za-z][A-Za-z0-9]{1,10}超[A-Za-z0-9]{2,12})'),
+    # 通用的"XX+动词"格式
+    re.compile(r'([\u4e00-\u9fa5A-Za-z]{2,6}(?:AI|眼镜|模型|芯片|平台)?[\u4e00-\u9fa5]{2,8})'),
+)
+_CONTENT_TITLE_PATTERNS = (
+    # 中文产品/公司名 + 动作
+    re.compile(r'([\u4e00-\u9fa5A-Za-z]{2,8}(?:公测|发布|开源|上线|推出|开售|开放|获得|完成|宣布|融资|突破)[^\n。！]{0,8})'),
+    # 公司名 + 产品动作
+    re.compile(r'((?:小米|字节|腾讯|阿里|百度|华为|OpenAI|Meta|Google|微软|Apple|北京|上海)[A-Za-z\u4e00-\u9fa5]{2,12})'),
+)
+_TODAY_SUMMARY_RE = re.compile(r'今日摘要\s*(.{20,200})')
+# 句子切分：一次线性扫描切出所有句子，供关键词匹配用子串查找完成
+# 标题分词取关键词（修正原先漏写字符类方括号导致中文分支永不匹配的问题）
+_TITLE_KEYWORD_RE = re.compile(r'[A-Za-z]+|[\u4e00-\u9fa5]{2,}')
+
+# 英文检测用的C级计数工具：待删除的非字母ASCII字节表 + 非字母字符正则
+_NON_ALPHA_ASCII_BYTES = bytes(c for c in range(256) if not chr(c).isalpha())
+_NON_ALPHA_RE = re.compile(r'[\W\d_]+')
+
+# 提取提示词模板：只有分类列表依赖配置，在 __init__ 中一次性填充，
+# 避免每篇文章都重新拼接这两段大字符串
+_EXTRACT_PROMPT_DIGEST_TMPL = """你是一个技术资讯编辑助手。
+
+这是一篇日刊/日报内容，包含多条独立的资讯。请从中提取每一条独立的新闻/资讯。
+
+【可选分类】
+{cats}
+
+【分类指南】
+- 时事：行业动态、政策新闻、公司融资、市场趋势、产业规划等综合资讯
+- AI资讯：AI模型发布、AI产品更新、AI技术突破等与AI直接相关的资讯
+- 教程：技术教程、工作流分享、学习资源、最佳实践等
+- 工具：开源项目、开发工具、实用软件等
+
+【重要】这是聚合类日刊内容，你必须：
+1. 将日刊拆分成独立的资讯条目，每条资讯单独提取
+2. 不要把多条资讯合并成一个条目
+3. 日刊中通常有"产品与功能更新"、"前沿研究"、"行业展望"等分类，每个分类下的每一条都是独立资讯
+4. 提取数量：5-10条最重要的资讯
+5. 务必根据内容合理分配到不同分类，不要都放到同一分类
+6. 每条资讯尽量选择最匹配的 link_id；如果无法匹配，link_id 返回空字符串
+7. summary 必须用“编辑点评”语气写 2-3 句，避免照抄原文，包含 2-4 个 emoji
+
+【输出格式】
+必须输出 JSON 对象，不要任何 markdown 标记或额外文本：
+{{
+  "items": [
+    {{"title": "北京AI产业两年冲万亿", "summary": "北京发布九大行动计划，核心产业规模预计从4500亿冲刺万亿，信号很强。对区域产业链是明显利好，值得持续跟踪。📈🏙️", "category": "时事", "is_english": false, "link_id": "L3"}}
+  ]
+}}
+
+如果无法提取，返回 {{"items": []}}"""
+
+_EXTRACT_PROMPT_NORMAL_TMPL = """你是一个前端技术周刊编辑助手。
+
+从以下文章内容中提取所有有价值的独立资讯条目。
+
+【可选分类】
+{cats}
+
+【提取规则】
+1. 每个条目只描述一件具体的事，不要聚合
+2. 为每个条目选择最合适的分类
+3. 如果文章是日刊/周刊合集，提取其中所有重要的独立资讯（最多10条）
+4. 如果文章只包含单一主题，只返回1条
+5. 过滤掉广告、招聘等无关内容
+6. 每条资讯尽量选择最匹配的 link_id；如果无法匹配，link_id 返回空字符串
+7. summary 必须用“编辑点评”语气写 2-3 句，避免照抄原文，包含 2-4 个 emoji
+
+【输出格式】
+必须输出 JSON 对象，不要任何 markdown 标记或额外文本：
+{{
+  "items": [
+    {{"title": "15字以内的中文标题", "summary": "先说清事件，再补一两句点评，包含emoji。🚀✨", "category": "从可选分类中选择一个", "is_english": false, "link_id": "L1"}}
+  ]
+}}
+
+如果没有可提取的内容，返回 {{"items": []}}"""
+
+# 多篇文章打包提取的提示词：系统提示只发送一次，摊薄到每篇文章的 token 成本
+_EXTRACT_PROMPT_BATCH_TMPL = """你是一个前端技术周刊编辑助手。
+
+下面会给出多篇文章，每篇以【文章 N】开头。请分别从每篇文章中提取所有有价值的独立资讯条目。
+
+【可选分类】
+{cats}
+
+【提取规则】
+1. 每个条目只描述一件具体的事，不要聚合
+2. 为每个条目选择最合适的分类
+3. 如果文章只包含单一主题，该文章只返回1条
+4. 过滤掉广告、招聘等无关内容
+5. link_id 只能从该条目所属文章自己的候选链接列表中选择；无法匹配时返回空字符串
+6. summary 必须用“编辑点评”语气写 2-3 句，避免照抄原文，包含 2-4 个 emoji
+7. 不要混淆不同文章的内容，idx 必须对应文章编号
+
+【输出格式】
+必须输出 JSON 对象，不要任何 markdown 标记或额外文本：
+{{
+  "per_article": [
+    {{"idx": 0, "items": [{{"title": "15字以内的中文标题", "summary": "先说清事件，再补一两句点评，包含emoji。🚀✨", "category": "从可选分类中选择一个", "is_english": false, "link_id": "L1"}}]}},
+    {{"idx": 1, "items": []}}
+  ]
+}}
+
+每篇文章都必须在 per_article 中出现一次；没有可提取内容的文章返回空 items。"""
+
+
+class _RequestRateLimiter:
+    """
+    滑动窗口限速器（每分钟请求数）
+
+    并发提取把请求压缩到很短的时间窗口里，容易触发服务端RPM限制后
+    整批失败重试，反而更慢；这里按预约时间排队，多线程/协程共用一份配额。
+    """
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self._lock = threading.Lock()
+        self._scheduled: deque = deque(maxlen=rpm)
+
+    def reserve(self) -> float:
+        """
+        登记一次请求，返回调用方在发出前应等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            if len(self._scheduled) >= self.rpm:
+                # 窗口已满：排到第rpm个前序请求离开60秒窗口之后
+                slot = max(now, self._scheduled[0] + 60.0)
+            else:
+                slot = now
+            self._scheduled.append(slot)
+            return max(0.0, slot - now)
+
+    def wait(self):
+        """阻塞直到拿到发送配额（同步调用方用）"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
 
 class WeeklyGenerator:
     """前端 Weekly 生成器"""
@@ -44,16 +363,84 @@ class WeeklyGenerator:
         self.config = self._load_config()
         self.state_file = self._get_state_file()
         self.deduplicator = self._init_deduplicator()
-        self.http_session = create_retry_session(total_retries=2, backoff_factor=0.8)
-        self._page_image_cache: Dict[str, str] = {}
+        # httpx.Client 按 host 复用长连接，抓预览图/来源页/Trending 的大量小请求
+        # 不再每次都付一遍 TCP+TLS 握手；连接失败在传输层重试2次
+        self.http_session = httpx.Client(
+            timeout=15,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            transport=httpx.HTTPTransport(retries=2),
+            follow_redirects=True
+        )
+        # 预览图缓存持久化到磁盘，跨运行复用，避免每次生成都重抓同一批 og:image
+        self._image_cache_file = self.project_root / 'cache' / 'og_image_cache.json'
+        self._page_image_cache: Dict[str, List[str]] = self._load_image_cache()
+        # 单飞闸：并发任务同时抓同一URL的预览图时只发一次请求，其余等同一结果
+        self._image_inflight: Dict[str, Future] = {}
+        self._image_inflight_lock = threading.Lock()
+        # 整页解析树按URL缓存并单飞：链接提取与配图回退共用同一次GET+解析
+        self._page_bundle_cache: Dict[str, Optional[BeautifulSoup]] = {}
+        self._page_inflight: Dict[str, Future] = {}
+        self._page_inflight_lock = threading.Lock()
+        # 共享的网页抓取器：连接池与HTTP缓存跨分类复用，首次用到时才构建
+        self._web_fetcher: Optional[WebFetcher] = None
+        self._web_fetcher_lock = threading.Lock()
+        # 模型响应磁盘缓存：重跑（重试/预览）时未变更文章直接跳过模型调用
+        # 设 WEEKLY_LLM_NOCACHE 环境变量可整体旁路
+        self._llm_cache_enabled = not os.getenv('WEEKLY_LLM_NOCACHE')
+        self._llm_cache_file = self.project_root / 'cache' / 'llm_response_cache.json'
+        self._llm_response_cache: Dict[str, List[str]] = self._load_llm_cache()
+        self._llm_cache_lock = threading.Lock()
+        # 候选链接按文章URL记忆化：回退路径会对同一篇文章重复提取
+        self._candidate_links_cache: Dict[str, List[Tuple[str, str]]] = {}
+        # 分类过滤器按配置记忆化：关键词正则只编译一次，跨次 generate() 复用
+        self._content_filter_cache: Dict[Tuple, ContentFilter] = {}
+        # 分类列表与两段提取提示词只依赖配置，构造时填充一次，调用时直接取用；
+        # 系统提示词因此在所有请求间逐字节一致，支持自动prompt缓存的后端
+        # 可以直接命中前缀缓存（省输入token计费并缩短首token延迟）
+        categories = self.config.get('categories', {})
+        self._category_names_str = ', '.join(
+            cat.get('name', key) for key, cat in categories.items() if key != 'training'
+        )
+        self._extract_prompt_digest = _EXTRACT_PROMPT_DIGEST_TMPL.format(cats=self._category_names_str)
+        self._extract_prompt_normal = _EXTRACT_PROMPT_NORMAL_TMPL.format(cats=self._category_names_str)
+        self._extract_prompt_batch = _EXTRACT_PROMPT_BATCH_TMPL.format(cats=self._category_names_str)
+        # 提示词指纹进缓存键：改模板或分类配置后旧的模型响应自动失效
+        self._prompt_fingerprint = hashlib.sha1(
+            (self._extract_prompt_digest + self._extract_prompt_normal + self._extract_prompt_batch)
+            .encode('utf-8')
+        ).hexdigest()[:12]
         self._init_ai_client()
     
     def _load_config(self) -> Dict[str, Any]:
-        """加载配置文件"""
+        """
+        加载配置文件
+
+        解析结果按源文件 mtime 缓存成 pickle：配置不变时（绝大多数运行）
+        直接反序列化，跳过整次 YAML 解析。
+        """
+        cache_path = self.project_root / 'cache' / f'{self.config_path.name}.cache.pkl'
         try:
+            mtime = self.config_path.stat().st_mtime
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_mtime, config = pickle.load(f)
+                if cached_mtime == mtime:
+                    logger.info(f"配置文件缓存命中: {self.config_path}")
+                    return config
+            except Exception:
+                # 缓存缺失/损坏/格式变更都只是回退重新解析
+                pass
+
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
             logger.info(f"配置文件加载成功: {self.config_path}")
+
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump((mtime, config), f)
+            except OSError:
+                pass
             return config
         except Exception as e:
             logger.error(f"加载配置文件失败: {e}")
@@ -82,14 +469,106 @@ class WeeklyGenerator:
         return {}
 
     def _save_state(self, state: Dict[str, Any]):
-        """保存运行状态"""
+        """保存运行状态（先写临时文件再原子替换，中途崩溃不会留下半截文件）"""
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(state, ensure_ascii=False, indent=2).encode('utf-8')
+            tmp_file = self.state_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             logger.error(f"保存状态文件失败: {self.state_file}, 错误: {e}")
 
+    # 预览图缓存有效期（7天），过期条目加载时直接丢弃
+    _IMAGE_CACHE_EXPIRE_HOURS = 168
+
+    def _load_image_cache(self) -> Dict[str, List[str]]:
+        """加载预览图磁盘缓存，条目格式为 {url: [image_url, 时间戳]}"""
+        if not self._image_cache_file.exists():
+            return {}
+        cutoff = datetime.now() - timedelta(hours=self._IMAGE_CACHE_EXPIRE_HOURS)
+        cache: Dict[str, List[str]] = {}
+        try:
+            with open(self._image_cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for url, entry in data.items():
+                try:
+                    if datetime.fromisoformat(entry[1]) >= cutoff:
+                        cache[url] = [entry[0], entry[1]]
+                except (ValueError, TypeError, IndexError):
+                    continue
+        except Exception as e:
+            logger.warning(f"读取预览图缓存失败，将重新抓取: {self._image_cache_file}, 错误: {e}")
+            return {}
+        return cache
+
+    def _save_image_cache(self):
+        """保存预览图缓存到磁盘"""
+        try:
+            self._image_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._image_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._page_image_cache, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"保存预览图缓存失败: {self._image_cache_file}, 错误: {e}")
+
+    # 模型响应缓存有效期（14天），过期条目加载时直接丢弃
+    _LLM_CACHE_EXPIRE_HOURS = 14 * 24
+
+    def _load_llm_cache(self) -> Dict[str, List[str]]:
+        """加载模型响应磁盘缓存，条目格式为 {键: [响应文本, 时间戳]}"""
+        if not self._llm_cache_enabled or not self._llm_cache_file.exists():
+            return {}
+        cutoff = datetime.now() - timedelta(hours=self._LLM_CACHE_EXPIRE_HOURS)
+        cache: Dict[str, List[str]] = {}
+        try:
+            with open(self._llm_cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key, entry in data.items():
+                try:
+                    if datetime.fromisoformat(entry[1]) >= cutoff:
+                        cache[key] = [entry[0], entry[1]]
+                except (ValueError, TypeError, IndexError):
+                    continue
+        except Exception as e:
+            logger.warning(f"读取模型响应缓存失败，将重新请求: {self._llm_cache_file}, 错误: {e}")
+            return {}
+        return cache
+
+    def _save_llm_cache(self):
+        """保存模型响应缓存到磁盘"""
+        try:
+            self._llm_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._llm_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._llm_response_cache, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"保存模型响应缓存失败: {self._llm_cache_file}, 错误: {e}")
+
+    def _llm_cache_key(self, article: Article) -> str:
+        """构建模型响应缓存键：模型+提示词指纹+文章URL+内容前缀，任一变更即失效"""
+        content = (article.content or article.summary or "")[:8000]
+        return hashlib.sha1(
+            f"{self.ai_model}|{self._prompt_fingerprint}|{article.url}|{content}".encode('utf-8')
+        ).hexdigest()
+
+    def _llm_cache_get(self, key: str) -> Optional[str]:
+        """查询模型响应缓存，未命中或已旁路时返回 None"""
+        if not self._llm_cache_enabled:
+            return None
+        with self._llm_cache_lock:
+            entry = self._llm_response_cache.get(key)
+        return entry[0] if entry is not None else None
+
+    def _llm_cache_set(self, key: str, response_text: str):
+        """写入模型响应缓存并落盘"""
+        if not self._llm_cache_enabled or not response_text:
+            return
+        with self._llm_cache_lock:
+            self._llm_response_cache[key] = [response_text, datetime.now().isoformat()]
+        self._save_llm_cache()
+
     def _init_deduplicator(self) -> Optional[URLDeduplicator]:
         """初始化 Weekly 去重器"""
         dedup_cfg = self.config.get('dedup', {})
@@ -104,18 +583,25 @@ class WeeklyGenerator:
     
     def _init_ai_client(self):
         """初始化 AI 客户端"""
+        # openai 包导入开销不小，延迟到构造客户端时再加载
+        from openai import OpenAI, AsyncOpenAI
+
         ai_config = self.config.get('ai', {})
         api_key_env = ai_config.get('api_key_env', 'AI_API_KEY')
         api_key = os.getenv(api_key_env) or ai_config.get('api_key', '')
         if not api_key:
             logger.warning(f"未检测到 Weekly AI API Key，请设置环境变量 {api_key_env}")
 
-        self.ai_client = OpenAI(
-            api_key=api_key,
-            base_url=ai_config.get('api_base', 'https://200.xstx.info/v1')
-        )
+        api_base = ai_config.get('api_base', 'https://200.xstx.info/v1')
+        self.ai_client = OpenAI(api_key=api_key, base_url=api_base)
+        self.ai_async_client = AsyncOpenAI(api_key=api_key, base_url=api_base)
         self.ai_model = ai_config.get('model', 'claude-opus-4-5-20251101-thinking')
         self.ai_max_tokens = ai_config.get('max_tokens', 4096)
+        # 条目提取的并发请求数（提取是纯网络等待，并发后总耗时约除以并发数）
+        self.ai_concurrency = ai_config.get('concurrency', 6)
+        # 可选RPM上限：并发请求共享同一配额，避免触发服务端限流
+        rpm = int(ai_config.get('requests_per_minute', 0) or 0)
+        self._ai_rate_limiter = _RequestRateLimiter(rpm) if rpm > 0 else None
         self.weekly_prompt = ai_config.get('weekly_prompt', '')
     
 
@@ -150,8 +636,20 @@ class WeeklyGenerator:
             path = str(self.project_root / path)
         return path
     
+    def _get_web_fetcher(self) -> WebFetcher:
+        """
+        取共享的网页抓取器（懒初始化）
+
+        各分类并发抓取时共用同一个会话：连接池按host复用长连接，
+        HTTP缓存也只有一份，不再每个分类各建一套。
+        """
+        with self._web_fetcher_lock:
+            if self._web_fetcher is None:
+                self._web_fetcher = WebFetcher()
+            return self._web_fetcher
+
     def _fetch_category_articles(
-        self, 
+        self,
         category_config: Dict[str, Any]
     ) -> List[Article]:
         """
@@ -180,17 +678,21 @@ class WeeklyGenerator:
                 rss_feeds.append(feed)
         
         articles = []
-        
-        # 1. 抓取 RSS
-        if rss_feeds:
-            fetcher = RSSFetcher(rss_feeds)
-            articles.extend(fetcher.fetch_all())
-        
-        # 2. 抓取普通网页
-        if web_urls:
-            web_fetcher = WebFetcher()
-            articles.extend(web_fetcher.fetch_all(web_urls))
-        
+
+        # RSS 批次和网页批次并行执行（两者内部已各自并发抓取单个源），
+        # 单边异常只丢弃该批次，不影响另一边
+        tasks = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if rss_feeds:
+                tasks.append(executor.submit(RSSFetcher(rss_feeds).fetch_all))
+            if web_urls:
+                tasks.append(executor.submit(self._get_web_fetcher().fetch_all, web_urls))
+            for future in as_completed(tasks):
+                try:
+                    articles.extend(future.result())
+                except Exception as e:
+                    logger.error(f"分类抓取批次失败: {e}")
+
         if not articles:
             return []
         
@@ -199,30 +701,38 @@ class WeeklyGenerator:
         pre_filter_config = self.config.get('pre_filter', {})
         min_length = pre_filter_config.get('min_content_length', 50)
         
-        filter_config = {
-            'time_filter': {'hours': time_hours},
-            'pre_filter': {
-                'include_keywords': category_config.get('keywords', []),
-                'exclude_keywords': [],
-                'min_content_length': min_length
+        keywords = category_config.get('keywords', [])
+        cache_key = (time_hours, min_length, tuple(keywords))
+        content_filter = self._content_filter_cache.get(cache_key)
+        if content_filter is None:
+            filter_config = {
+                'time_filter': {'hours': time_hours},
+                'pre_filter': {
+                    'include_keywords': keywords,
+                    'exclude_keywords': [],
+                    'min_content_length': min_length
+                }
             }
-        }
-        
-        content_filter = ContentFilter(filter_config)
-        filtered = content_filter.apply_all_filters(articles)
-        
-        return filtered
+            content_filter = ContentFilter(filter_config)
+            # 并发抓取线程间偶发的重复构造无害，不值得为此加锁
+            self._content_filter_cache[cache_key] = content_filter
+
+        return content_filter.apply_all_filters(articles)
 
     def _extract_candidate_links(self, article: Article) -> List[Tuple[str, str]]:
         """
         从聚合内容中提取候选链接（用于条目级链接分配）
         """
+        cached = self._candidate_links_cache.get(article.url)
+        if cached is not None:
+            return cached
+
         text = f"{article.content or ''}\n{article.summary or ''}"
         candidates: List[Tuple[str, str]] = []
         seen_urls = set()
 
         # markdown 链接: [title](url)
-        for match in re.finditer(r'\[([^\]]{2,200})\]\((https?://[^\s)]+)\)', text):
+        for match in _MD_LINK_RE.finditer(text):
             anchor = match.group(1).strip()
             url = match.group(2).strip().rstrip(').,;')
             if not url or url == article.url or url in seen_urls:
@@ -233,7 +743,7 @@ class WeeklyGenerator:
             candidates.append((anchor, url))
 
         # 裸链接: https://...
-        for match in re.finditer(r'(https?://[^\s<>()]+)', text):
+        for match in _BARE_URL_RE.finditer(text):
             url = match.group(1).strip().rstrip(').,;')
             if not url or url == article.url or url in seen_urls:
                 continue
@@ -250,18 +760,55 @@ class WeeklyGenerator:
                 seen_urls.add(url)
                 candidates.append((anchor, url))
 
+        self._candidate_links_cache[article.url] = candidates
         return candidates
 
+    # 解析树缓存的上限条目数，防止长跑进程无限增长
+    _PAGE_CACHE_MAX_ENTRIES = 256
+
+    def _get_page(self, page_url: str) -> Optional[BeautifulSoup]:
+        """
+        获取并解析整页HTML（按URL缓存+单飞）
+
+        链接提取与预览图回退经常命中同一来源页，共享解析树后
+        同一URL只付一次网络往返和一次BeautifulSoup解析。
+        """
+        with self._page_inflight_lock:
+            if page_url in self._page_bundle_cache:
+                return self._page_bundle_cache[page_url]
+            inflight = self._page_inflight.get(page_url)
+            if inflight is None:
+                future = Future()
+                self._page_inflight[page_url] = future
+
+        if inflight is not None:
+            return inflight.result()
+
+        soup = None
+        try:
+            response = self.http_session.get(page_url, timeout=15)
+            response.raise_for_status()
+            soup = BeautifulSoup(response.text, _BS_PARSER)
+        except Exception as e:
+            logger.debug(f"页面抓取失败: {page_url}, 错误: {e}")
+
+        with self._page_inflight_lock:
+            # FIFO淘汰最早的条目
+            while len(self._page_bundle_cache) >= self._PAGE_CACHE_MAX_ENTRIES:
+                self._page_bundle_cache.pop(next(iter(self._page_bundle_cache)))
+            self._page_bundle_cache[page_url] = soup
+            self._page_inflight.pop(page_url, None)
+        future.set_result(soup)
+        return soup
+
     def _extract_links_from_source_page(self, source_url: str) -> List[Tuple[str, str]]:
         """
         从来源页面中提取正文锚点链接，补充条目级 URL 候选
         """
         try:
-            response = self.http_session.get(source_url, timeout=15)
-            response.raise_for_status()
-            html = response.text
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self._get_page(source_url)
+            if soup is None:
+                return []
 
             root = None
             for selector in ['main', 'article', '.content', '#content', '.post-content', '.rich_media_content', 'body']:
@@ -300,36 +847,10 @@ class WeeklyGenerator:
 
     def _is_noise_source_link(self, text: str, url: str) -> bool:
         """过滤来源页中的导航/社交/素材链接"""
-        lower_text = (text or "").lower()
-        lower_url = url.lower()
-
-        text_noise = (
-            "关于我",
-            "同性交友",
-            "进群",
-            "访问网页版",
-            "小酒馆",
-            "自媒体",
-            "前往官网查看完整版",
-            "阅读全文",
-            "点击查看原文",
-            "原文链接",
-        )
-        if any(keyword.lower() in lower_text for keyword in text_noise):
-            return True
-
-        url_noise = ("logo", "avatar", "favicon", ".jpg", ".jpeg", ".png", ".gif", ".svg")
-        if any(keyword in lower_url for keyword in url_noise):
-            return True
-
-        parsed = urlparse(lower_url)
-        if parsed.netloc == "ai.hubtoday.app" and parsed.path.strip("/") == "":
-            return True
-
-        if "github.com/justlovemaki" in lower_url:
+        # 文本、URL各一次正则扫描即可判定，几百个锚点的页面不再逐链接跑urlparse
+        if text and _NOISE_TEXT_RE.search(text.lower()):
             return True
-
-        return False
+        return bool(_NOISE_URL_RE.search(url.lower()))
 
     def _build_link_candidates_for_prompt(
         self,
@@ -344,7 +865,7 @@ class WeeklyGenerator:
 
         for idx, (anchor, url) in enumerate(candidates[:max_count], start=1):
             link_id = f"L{idx}"
-            clean_anchor = re.sub(r'\s+', ' ', (anchor or '').strip())
+            clean_anchor = _WS_RE.sub(' ', (anchor or '').strip())
             label = clean_anchor[:80] if clean_anchor else "（无锚文本）"
             lines.append(f"- {link_id} | {label} | {url}")
             link_id_map[link_id] = url
@@ -362,22 +883,19 @@ class WeeklyGenerator:
         if value.isdigit():
             return f"L{int(value)}"
 
-        match = re.match(r'^L(\d+)$', value)
+        match = _LINK_ID_RE.match(value)
         if not match:
             return ""
         return f"L{int(match.group(1))}"
 
-    def _score_link_match(self, title: str, anchor: str, url: str) -> int:
-        """根据标题与候选链接文本匹配程度打分"""
-        title_tokens = set(re.findall(r'[\u4e00-\u9fa5]{2,}|[A-Za-z0-9]{3,}', title.lower()))
+    def _score_link_match(self, title_tokens: set, anchor: str, url: str) -> int:
+        """根据标题分词与候选链接文本的匹配程度打分"""
         if not title_tokens:
             return 0
-        haystack = f"{anchor} {url}".lower()
-        score = 0
-        for token in title_tokens:
-            if token in haystack:
-                score += 1
-        return score
+        # 两侧都分词后做哈希集合求交：O(T)完成打分，
+        # 代替逐token对整个haystack字符串做子串扫描的O(T·L)
+        anchor_tokens = set(_TOKEN_RE.findall(f"{anchor} {url}".lower()))
+        return len(title_tokens & anchor_tokens)
 
     def _select_item_link(
         self,
@@ -396,12 +914,14 @@ class WeeklyGenerator:
                 used_urls.add(preferred_url)
                 return preferred_url
 
+        # 标题只分词一次，避免每个候选链接都重新跑一遍正则
+        title_tokens = set(_TOKEN_RE.findall(item_title.lower()))
         best_url = ""
         best_score = 0
         for anchor, url in candidates:
             if url in used_urls:
                 continue
-            score = self._score_link_match(item_title, anchor, url)
+            score = self._score_link_match(title_tokens, anchor, url)
             if score > best_score:
                 best_score = score
                 best_url = url
@@ -423,24 +943,36 @@ class WeeklyGenerator:
             return True
 
         lower = image_url.lower()
-        bad_keywords = (
-            'logo',
-            'avatar',
-            'favicon',
-            'icon',
-            'sprite',
-            'placeholder',
-            'default',
-            'wechat-qun',
-            'qrcode',
-            'qr-code',
-        )
-        if any(keyword in lower for keyword in bad_keywords):
+        if _BAD_IMAGE_RE.search(lower):
             return True
         if lower.endswith('.svg') or lower.endswith('.ico'):
             return True
         return False
 
+    # og:image 基本都声明在 <head> 里，流式读到 </head> 或 64KB 即可断开
+    _HEAD_MAX_BYTES = 65536
+
+    def _fetch_page_head(self, page_url: str) -> str:
+        """
+        流式抓取页面头部，遇到 </head> 或读满 64KB 即提前断开连接
+
+        长文章页动辄几百 KB，而预览图只需要 head 里的 meta 声明；
+        提前断开能把带宽和解析量都压到原来的零头。
+        """
+        with self.http_session.stream("GET", page_url, timeout=12) as response:
+            response.raise_for_status()
+            chunks = []
+            total = 0
+            for chunk in response.iter_bytes(8192):
+                chunks.append(chunk)
+                total += len(chunk)
+                # 按块检查结束标记；跨块边界时最多多读几块，仍受64KB上限兜底
+                if b'</head>' in chunk or total >= self._HEAD_MAX_BYTES:
+                    break
+            raw = b''.join(chunks)
+            encoding = response.encoding or 'utf-8'
+        return raw.decode(encoding, errors='replace')
+
     def _fetch_page_preview_image(self, page_url: str) -> str:
         """
         从页面提取预览图（优先 og:image）
@@ -448,16 +980,23 @@ class WeeklyGenerator:
         if not page_url or not page_url.startswith('http'):
             return ""
 
-        if page_url in self._page_image_cache:
-            return self._page_image_cache[page_url]
+        # 缓存检查与登记在同一把锁内完成，后到的并发请求直接等先到者的结果
+        with self._image_inflight_lock:
+            cached = self._page_image_cache.get(page_url)
+            if cached is not None:
+                return cached[0]
+            inflight = self._image_inflight.get(page_url)
+            if inflight is None:
+                future = Future()
+                self._image_inflight[page_url] = future
+
+        if inflight is not None:
+            return inflight.result()
 
         image_url = ""
         try:
-            response = self.http_session.get(page_url, timeout=12)
-            response.raise_for_status()
-
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # 先只拉页面头部找 meta 声明，省掉整页下载
+            soup = BeautifulSoup(self._fetch_page_head(page_url), _BS_PARSER)
 
             meta_candidates = [
                 ('meta', {'property': 'og:image'}, 'content'),
@@ -476,7 +1015,9 @@ class WeeklyGenerator:
                     break
 
             if not image_url:
-                first_img = soup.select_one('article img, main img, .content img, #content img, body img')
+                # 头部没有可用图时才回退整页，从共享页面缓存取解析树找正文首图
+                soup = self._get_page(page_url)
+                first_img = soup.select_one('article img, main img, .content img, #content img, body img') if soup is not None else None
                 if first_img:
                     src = (first_img.get('src') or first_img.get('data-src') or '').strip()
                     if src:
@@ -487,7 +1028,12 @@ class WeeklyGenerator:
             logger.debug(f"图片回填失败: {page_url}, 错误: {e}")
             image_url = ""
 
-        self._page_image_cache[page_url] = image_url
+        # 失败结果（空串）同样缓存，死链不在后续运行中反复重试
+        with self._image_inflight_lock:
+            self._page_image_cache[page_url] = [image_url, datetime.now().isoformat()]
+            self._image_inflight.pop(page_url, None)
+        self._save_image_cache()
+        future.set_result(image_url)
         return image_url
 
     def _resolve_item_image_url(self, item_url: str, source_url: str, fallback_image_url: str) -> str:
@@ -526,7 +1072,7 @@ class WeeklyGenerator:
         """
         dedup_key = (item_url or source_url or "").strip()
         if dedup_key and source_url and dedup_key == source_url:
-            normalized_title = re.sub(r'\s+', '', str(title).lower())
+            normalized_title = _WS_RE.sub('', str(title).lower())
             return f"{source_url}#{normalized_title[:80]}"
         return dedup_key
 
@@ -535,122 +1081,122 @@ class WeeklyGenerator:
         解析 AI 返回的 JSON，支持 {"items": [...]} 和 [...] 两种格式
         """
         clean_text = response_text or ""
-        clean_text = re.sub(r'```json\s*', '', clean_text, flags=re.IGNORECASE)
-        clean_text = re.sub(r'```\s*', '', clean_text)
-        clean_text = re.sub(r'<thinking>.*?</thinking>', '', clean_text, flags=re.DOTALL)
-        clean_text = re.sub(r'<thinking>.*', '', clean_text, flags=re.DOTALL)
+        clean_text = _JSON_FENCE_RE.sub('', clean_text)
+        clean_text = _THINKING_RE.sub('', clean_text)
         clean_text = clean_text.strip()
 
         if not clean_text:
             return []
 
-        payloads = [clean_text]
-        object_match = re.search(r'\{.*\}', clean_text, re.DOTALL)
-        array_match = re.search(r'\[.*\]', clean_text, re.DOTALL)
-        if object_match:
-            payloads.append(object_match.group())
-        if array_match:
-            payloads.append(array_match.group())
+        items = self._loads_items(clean_text)
+        if items is not None:
+            return items
 
-        for payload in payloads:
-            try:
-                parsed = json.loads(payload)
-                if isinstance(parsed, dict):
-                    items = parsed.get('items', [])
-                    if isinstance(items, list):
-                        return items
-                if isinstance(parsed, list):
-                    return parsed
-            except (json.JSONDecodeError, TypeError):
-                continue
+        # 整串解析失败时才做一次子串提取（对象或数组，取先出现者）
+        match = _JSON_OBJECT_OR_ARRAY_RE.search(clean_text)
+        if match and match.group() != clean_text:
+            items = self._loads_items(match.group())
+            if items is not None:
+                return items
         return []
-    
-    def _extract_items(self, article: Article) -> List[Dict[str, Any]]:
+
+    @staticmethod
+    def _loads_items(payload: str) -> Optional[List[Dict[str, Any]]]:
         """
-        使用 AI 从文章中提取多个条目
-        
-        Args:
-            article: 文章对象
-            
-        Returns:
-            包含多个条目的列表，每个条目有 title, summary, category, is_english
+        解析单个 JSON 载荷并取出条目列表，解析失败返回 None
         """
         try:
-            content = article.content or article.summary
-            content = truncate_text(content, 8000)  # 增加内容长度以获取更多信息
-            candidate_links = self._extract_candidate_links(article)
-            candidate_link_lines, link_id_map = self._build_link_candidates_for_prompt(candidate_links)
-            candidate_link_block = "\n".join(candidate_link_lines) if candidate_link_lines else "- 无可用候选链接（请返回空 link_id）"
-            used_item_urls = set()
-            
-            # 获取所有可用分类
-            categories = self.config.get('categories', {})
-            category_names = [cat.get('name', key) for key, cat in categories.items() if key != 'training']
-            
-            # 检测是否为日刊/聚合类内容
-            is_daily_digest = any(kw in article.title.lower() or kw in content[:500].lower() 
-                                  for kw in ['日刊', '日报', '今日摘要', '每日', 'daily', '周刊'])
-            
-            if is_daily_digest:
-                extract_prompt = f"""你是一个技术资讯编辑助手。
-
-这是一篇日刊/日报内容，包含多条独立的资讯。请从中提取每一条独立的新闻/资讯。
-
-【可选分类】
-{', '.join(category_names)}
+            # orjson.JSONDecodeError 是 ValueError 的子类，统一捕获
+            parsed = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        except (ValueError, TypeError):
+            return None
+        if isinstance(parsed, dict):
+            items = parsed.get('items', [])
+            if isinstance(items, list):
+                return items
+        if isinstance(parsed, list):
+            return parsed
+        return None
+
+    def _parse_batch_items_response(
+        self,
+        response_text: str
+    ) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """
+        解析打包提取的响应 {"per_article": [{"idx": 0, "items": [...]}]}
 
-【分类指南】
-- 时事：行业动态、政策新闻、公司融资、市场趋势、产业规划等综合资讯
-- AI资讯：AI模型发布、AI产品更新、AI技术突破等与AI直接相关的资讯
-- 教程：技术教程、工作流分享、学习资源、最佳实践等
-- 工具：开源项目、开发工具、实用软件等
+        Args:
+            response_text: AI 响应文本
 
-【重要】这是聚合类日刊内容，你必须：
-1. 将日刊拆分成独立的资讯条目，每条资讯单独提取
-2. 不要把多条资讯合并成一个条目
-3. 日刊中通常有"产品与功能更新"、"前沿研究"、"行业展望"等分类，每个分类下的每一条都是独立资讯
-4. 提取数量：5-10条最重要的资讯
-5. 务必根据内容合理分配到不同分类，不要都放到同一分类
-6. 每条资讯尽量选择最匹配的 link_id；如果无法匹配，link_id 返回空字符串
-7. summary 必须用“编辑点评”语气写 2-3 句，避免照抄原文，包含 2-4 个 emoji
+        Returns:
+            文章序号到条目列表的映射，解析失败返回 None
+        """
+        clean_text = response_text or ""
+        clean_text = _JSON_FENCE_RE.sub('', clean_text)
+        clean_text = _THINKING_RE.sub('', clean_text)
+        clean_text = clean_text.strip()
+        if not clean_text:
+            return None
 
-【输出格式】
-必须输出 JSON 对象，不要任何 markdown 标记或额外文本：
-{{
-  "items": [
-    {{"title": "北京AI产业两年冲万亿", "summary": "北京发布九大行动计划，核心产业规模预计从4500亿冲刺万亿，信号很强。对区域产业链是明显利好，值得持续跟踪。📈🏙️", "category": "时事", "is_english": false, "link_id": "L3"}}
-  ]
-}}
+        try:
+            parsed = orjson.loads(clean_text) if orjson is not None else json.loads(clean_text)
+        except (ValueError, TypeError):
+            match = _JSON_OBJECT_OR_ARRAY_RE.search(clean_text)
+            if not match or match.group() == clean_text:
+                return None
+            try:
+                parsed = orjson.loads(match.group()) if orjson is not None else json.loads(match.group())
+            except (ValueError, TypeError):
+                return None
 
-如果无法提取，返回 {{"items": []}}"""
-            else:
-                extract_prompt = f"""你是一个前端技术周刊编辑助手。
+        if not isinstance(parsed, dict):
+            return None
+        per_article = parsed.get('per_article')
+        if not isinstance(per_article, list):
+            return None
 
-从以下文章内容中提取所有有价值的独立资讯条目。
+        items_by_idx: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in per_article:
+            if not isinstance(entry, dict):
+                continue
+            idx = entry.get('idx')
+            items = entry.get('items')
+            if isinstance(idx, int) and isinstance(items, list):
+                items_by_idx[idx] = items
+        return items_by_idx
 
-【可选分类】
-{', '.join(category_names)}
+    # 提取提示词中正文的字符上限：再长的部分对条目提取边际价值很低，只抬高token成本
+    _EXTRACT_CONTENT_MAX_CHARS = 8000
 
-【提取规则】
-1. 每个条目只描述一件具体的事，不要聚合
-2. 为每个条目选择最合适的分类
-3. 如果文章是日刊/周刊合集，提取其中所有重要的独立资讯（最多10条）
-4. 如果文章只包含单一主题，只返回1条
-5. 过滤掉广告、招聘等无关内容
-6. 每条资讯尽量选择最匹配的 link_id；如果无法匹配，link_id 返回空字符串
-7. summary 必须用“编辑点评”语气写 2-3 句，避免照抄原文，包含 2-4 个 emoji
+    def _build_extract_context(self, article: Article) -> Dict[str, Any]:
+        """
+        构建条目提取请求的提示词与候选链接上下文
 
-【输出格式】
-必须输出 JSON 对象，不要任何 markdown 标记或额外文本：
-{{
-  "items": [
-    {{"title": "15字以内的中文标题", "summary": "先说清事件，再补一两句点评，包含emoji。🚀✨", "category": "从可选分类中选择一个", "is_english": false, "link_id": "L1"}}
-  ]
-}}
+        Args:
+            article: 文章对象
 
-如果没有可提取的内容，返回 {{"items": []}}"""
-            
-            user_prompt = f"""标题：{article.title}
+        Returns:
+            包含 messages, max_tokens, candidate_links, link_id_map, is_daily_digest 的字典
+        """
+        content = article.content or article.summary
+        # 先剥模板尾注再截断，截断预算全部留给正文；超长正文先粗截到
+        # 2倍预算再清理，尾注剥除的正则扫描量与最终截断点挂钩，
+        # 不再随原文长度线性增长
+        if len(content) > self._EXTRACT_CONTENT_MAX_CHARS * 2:
+            content = content[:self._EXTRACT_CONTENT_MAX_CHARS * 2]
+        content = truncate_text(_strip_boilerplate(content), self._EXTRACT_CONTENT_MAX_CHARS)
+        candidate_links = self._extract_candidate_links(article)
+        candidate_link_lines, link_id_map = self._build_link_candidates_for_prompt(candidate_links)
+        candidate_link_block = "\n".join(candidate_link_lines) if candidate_link_lines else "- 无可用候选链接（请返回空 link_id）"
+
+        # 检测是否为日刊/聚合类内容（单次正则扫描）
+        is_daily_digest = bool(_DAILY_DIGEST_RE.search(article.title)
+                               or _DAILY_DIGEST_RE.search(content[:500]))
+
+        # 提示词在 __init__ 中已按配置填充好，这里直接选用
+        extract_prompt = self._extract_prompt_digest if is_daily_digest else self._extract_prompt_normal
+
+        user_prompt = f"""标题：{article.title}
 来源：{article.source}
 URL：{article.url}
 
@@ -659,140 +1205,471 @@ URL：{article.url}
 
 内容：
 {content}"""
-            
-            # 日刊类内容需要更多 token 来输出多个条目
-            max_tokens = 4000 if is_daily_digest else 2000
-            if self.ai_max_tokens:
-                max_tokens = min(max_tokens, self.ai_max_tokens)
-            logger.info(f"  日刊检测: {is_daily_digest}, 文章: {article.title[:30]}...")
-            
-            response = self.ai_client.chat.completions.create(
-                model=self.ai_model,
-                messages=[
-                    {"role": "system", "content": extract_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=0.2
-            )
-            
-            response_text = response.choices[0].message.content
-            logger.debug(f"  AI原始响应(前300字): {response_text[:300] if response_text else 'None'}...")
-            
-            items = self._parse_ai_items_response(response_text)
 
-            # 清理并返回条目
-            result = []
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                title = str(item.get('title', '')).strip()
-                summary = self._format_editor_summary(str(item.get('summary', '')))
-                if not title or summary == "暂无描述":
-                    continue
+        # 日刊类内容需要更多 token 来输出多个条目；普通文章只产出1-3条
+        # （约200输出token），端到端延迟大致随生成token数线性增长，
+        # 上限收紧后解码阶段明显变短
+        max_tokens = 2500 if is_daily_digest else 600
+        if self.ai_max_tokens:
+            max_tokens = min(max_tokens, self.ai_max_tokens)
+
+        return {
+            "messages": [
+                {"role": "system", "content": extract_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "max_tokens": max_tokens,
+            "is_daily_digest": is_daily_digest,
+            "candidate_links": candidate_links,
+            "link_id_map": link_id_map,
+        }
 
-                preferred_link_id = self._normalize_link_id(item.get('link_id', ''))
-                model_item_url = str(item.get('item_url', '') or item.get('url', '')).strip()
-                if model_item_url.startswith('http') and model_item_url not in used_item_urls:
-                    item_url = model_item_url
-                    used_item_urls.add(model_item_url)
-                else:
-                    item_url = self._select_item_link(
-                        title,
-                        candidate_links,
-                        used_item_urls,
-                        article.url,
-                        preferred_link_id=preferred_link_id,
-                        link_id_map=link_id_map
-                    )
-
-                result.append({
-                    "title": title,
-                    "summary": summary,
-                    "category": str(item.get('category', '时事')).strip() or "时事",
-                    "is_english": bool(item.get('is_english', self._detect_english(title))),
-                    "source_url": article.url,
-                    "item_url": item_url,
-                    "image_url": article.image_url
-                })
+    def _finish_extract_items(
+        self,
+        article: Article,
+        context: Dict[str, Any],
+        response_text: str
+    ) -> List[Dict[str, Any]]:
+        """
+        解析 AI 响应并组装条目，无有效条目时回退为单条目
 
-            if result:
-                logger.info(f"  成功提取 {len(result)} 个条目")
-                return result
+        Args:
+            article: 文章对象
+            context: _build_extract_context 的返回值
+            response_text: AI 响应文本
 
-            logger.warning("  AI 结果解析后没有有效条目，使用回退模式")
-            
-            # 解析失败，返回单条目（兼容原逻辑）
-            # 对于日刊类内容，尝试从内容中提取有意义的标题和简介
-            fallback_title = self._extract_fallback_title(article)
-            fallback_summary = self._format_editor_summary(
-                self._extract_fallback_summary(article, fallback_title)
-            )
-            return [{
-                "title": fallback_title,
-                "summary": fallback_summary,
-                "category": "AI资讯" if is_daily_digest else "时事",
-                "is_english": self._detect_english(article.title),
-                "source_url": article.url,
-                "item_url": self._select_item_link(
-                    fallback_title,
+        Returns:
+            条目字典列表
+        """
+        logger.debug(f"  AI原始响应(前300字): {response_text[:300] if response_text else 'None'}...")
+
+        items = self._parse_ai_items_response(response_text)
+        return self._assemble_extract_items(article, context, items)
+
+    def _assemble_extract_items(
+        self,
+        article: Article,
+        context: Dict[str, Any],
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        将解析出的条目清理成型，无有效条目时回退为单条目
+
+        Args:
+            article: 文章对象
+            context: _build_extract_context 的返回值
+            items: 解析出的原始条目列表
+
+        Returns:
+            条目字典列表
+        """
+        candidate_links = context["candidate_links"]
+        link_id_map = context["link_id_map"]
+        is_daily_digest = context["is_daily_digest"]
+        used_item_urls = set()
+
+        # 清理并返回条目
+        result = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            title = str(item.get('title', '')).strip()
+            summary = self._format_editor_summary(str(item.get('summary', '')))
+            if not title or summary == "暂无描述":
+                continue
+
+            preferred_link_id = self._normalize_link_id(item.get('link_id', ''))
+            model_item_url = str(item.get('item_url', '') or item.get('url', '')).strip()
+            if model_item_url.startswith('http') and model_item_url not in used_item_urls:
+                item_url = model_item_url
+                used_item_urls.add(model_item_url)
+            else:
+                item_url = self._select_item_link(
+                    title,
                     candidate_links,
                     used_item_urls,
                     article.url,
+                    preferred_link_id=preferred_link_id,
                     link_id_map=link_id_map
-                ),
+                )
+
+            result.append({
+                "title": title,
+                "summary": summary,
+                "category": str(item.get('category', '时事')).strip() or "时事",
+                "is_english": bool(item.get('is_english', self._detect_english(title))),
+                "source_url": article.url,
+                "item_url": item_url,
                 "image_url": article.image_url
-            }]
-            
+            })
+
+        if result:
+            logger.info(f"  成功提取 {len(result)} 个条目")
+            return result
+
+        logger.warning("  AI 结果解析后没有有效条目，使用回退模式")
+
+        # 解析失败，返回单条目（兼容原逻辑）
+        # 对于日刊类内容，尝试从内容中提取有意义的标题和简介
+        fallback_title = self._extract_fallback_title(article)
+        fallback_summary = self._format_editor_summary(
+            self._extract_fallback_summary(article, fallback_title)
+        )
+        return [{
+            "title": fallback_title,
+            "summary": fallback_summary,
+            "category": "AI资讯" if is_daily_digest else "时事",
+            "is_english": self._detect_english(article.title),
+            "source_url": article.url,
+            "item_url": self._select_item_link(
+                fallback_title,
+                candidate_links,
+                used_item_urls,
+                article.url,
+                link_id_map=link_id_map
+            ),
+            "image_url": article.image_url
+        }]
+
+    def _extract_failure_fallback(self, article: Article) -> List[Dict[str, Any]]:
+        """
+        请求或上下文构建异常时的单条目回退
+
+        Args:
+            article: 文章对象
+
+        Returns:
+            单条目字典列表
+        """
+        fallback_title = self._extract_fallback_title(article)
+        fallback_summary = self._format_editor_summary(
+            self._extract_fallback_summary(article, fallback_title)
+        )
+        return [{
+            "title": fallback_title,
+            "summary": fallback_summary,
+            "category": "AI资讯",
+            "is_english": self._detect_english(article.title),
+            "source_url": article.url,
+            "item_url": article.url,
+            "image_url": article.image_url
+        }]
+
+    # 低于该长度的非日刊文章不值得一次模型调用：模型只会复述标题
+    _MIN_EXTRACT_CONTENT_CHARS = 300
+
+    def _should_skip_extraction(self, article: Article, context: Dict[str, Any]) -> bool:
+        """
+        判断文章是否跳过模型提取、直接走回退构造
+
+        Args:
+            article: 文章对象
+            context: 已构建的提取上下文
+
+        Returns:
+            True 表示跳过模型调用
+        """
+        if context["is_daily_digest"]:
+            return False
+        content = article.content or article.summary or ""
+        return len(content) < self._MIN_EXTRACT_CONTENT_CHARS
+
+    def _extract_items(self, article: Article) -> List[Dict[str, Any]]:
+        """
+        使用 AI 从文章中提取多个条目
+
+        Args:
+            article: 文章对象
+
+        Returns:
+            包含多个条目的列表，每个条目有 title, summary, category, is_english
+        """
+        try:
+            context = self._build_extract_context(article)
+            if self._should_skip_extraction(article, context):
+                logger.info(f"  内容过短，跳过模型提取: {article.title[:30]}...")
+                return self._extract_failure_fallback(article)
+            cache_key = self._llm_cache_key(article)
+            cached_text = self._llm_cache_get(cache_key)
+            if cached_text is not None:
+                logger.info(f"  命中模型响应缓存: {article.title[:30]}...")
+                return self._finish_extract_items(article, context, cached_text)
+
+            logger.info(f"  日刊检测: {context['is_daily_digest']}, 文章: {article.title[:30]}...")
+
+            if self._ai_rate_limiter:
+                self._ai_rate_limiter.wait()
+            response = self.ai_client.chat.completions.create(
+                model=self.ai_model,
+                messages=context["messages"],
+                max_tokens=context["max_tokens"],
+                temperature=0
+            )
+            response_text = response.choices[0].message.content
+            self._llm_cache_set(cache_key, response_text)
+            return self._finish_extract_items(article, context, response_text)
         except Exception as e:
             logger.error(f"提取条目失败: {article.title}, 错误: {e}")
-            fallback_title = self._extract_fallback_title(article)
-            fallback_summary = self._format_editor_summary(
-                self._extract_fallback_summary(article, fallback_title)
-            )
-            return [{
-                "title": fallback_title,
-                "summary": fallback_summary,
-                "category": "AI资讯",
-                "is_english": self._detect_english(article.title),
-                "source_url": article.url,
-                "item_url": article.url,
-                "image_url": article.image_url
-            }]
-    
-    def _clean_summary(self, summary: str) -> str:
+            return self._extract_failure_fallback(article)
+
+    async def _extract_items_async(
+        self,
+        article: Article,
+        semaphore: asyncio.Semaphore,
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        异步提取单篇文章的条目（受信号量限流）
+
+        Args:
+            article: 文章对象
+            semaphore: 并发信号量
+            context: 预先构建好的提取上下文（缺省时现场构建）
+
+        Returns:
+            条目字典列表
+        """
+        try:
+            if context is None:
+                # 候选链接提取可能回源抓取页面（阻塞I/O），放进线程避免卡住事件循环
+                context = await asyncio.to_thread(self._build_extract_context, article)
+            if self._should_skip_extraction(article, context):
+                logger.info(f"  内容过短，跳过模型提取: {article.title[:30]}...")
+                return self._extract_failure_fallback(article)
+            cache_key = self._llm_cache_key(article)
+            cached_text = self._llm_cache_get(cache_key)
+            if cached_text is not None:
+                logger.info(f"  命中模型响应缓存: {article.title[:30]}...")
+                return self._finish_extract_items(article, context, cached_text)
+            async with semaphore:
+                logger.info(f"  日刊检测: {context['is_daily_digest']}, 文章: {article.title[:30]}...")
+                if self._ai_rate_limiter:
+                    await asyncio.sleep(self._ai_rate_limiter.reserve())
+                response = await self.ai_async_client.chat.completions.create(
+                    model=self.ai_model,
+                    messages=context["messages"],
+                    max_tokens=context["max_tokens"],
+                    temperature=0
+                )
+            response_text = response.choices[0].message.content
+            self._llm_cache_set(cache_key, response_text)
+            return self._finish_extract_items(article, context, response_text)
+        except Exception as e:
+            logger.error(f"提取条目失败: {article.title}, 错误: {e}")
+            return self._extract_failure_fallback(article)
+
+    # 每次打包最多4篇、用户提示词合计不超过16000字符：
+    # 系统提示只发一次，同时避免单次请求上下文过长导致模型串台
+    _EXTRACT_BATCH_SIZE = 4
+    _EXTRACT_BATCH_MAX_CHARS = 16000
+
+    def _plan_extract_batches(self, contexts: List[Optional[Dict[str, Any]]]) -> List[List[int]]:
+        """
+        将文章分组打包：日刊类单独成组（本身就会产出大量条目），
+        普通文章按篇数和提示词长度贪心合并
+
+        Args:
+            contexts: 每篇文章的提取上下文（构建失败为 None）
+
+        Returns:
+            每组文章序号的列表
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+        for idx, context in enumerate(contexts):
+            if context is None:
+                continue
+            if context["is_daily_digest"]:
+                batches.append([idx])
+                continue
+            prompt_chars = len(context["messages"][1]["content"])
+            if current and (
+                len(current) >= self._EXTRACT_BATCH_SIZE
+                or current_chars + prompt_chars > self._EXTRACT_BATCH_MAX_CHARS
+            ):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(idx)
+            current_chars += prompt_chars
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _extract_batch_async(
+        self,
+        articles: List[Article],
+        contexts: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        打包提取一组文章的条目，解析失败的文章退回逐篇提取
+
+        Args:
+            articles: 本组文章列表
+            contexts: 对应的提取上下文
+            semaphore: 并发信号量
+
+        Returns:
+            每篇文章对应的条目列表
+        """
+        if len(articles) == 1:
+            return [await self._extract_items_async(articles[0], semaphore, contexts[0])]
+
+        user_prompt = "\n\n".join(
+            f"【文章 {i}】\n{context['messages'][1]['content']}"
+            for i, context in enumerate(contexts)
+        )
+        # 与单篇上限保持一致：每篇普通文章600 token（日刊不会进打包组）
+        max_tokens = 600 * len(articles)
+        if self.ai_max_tokens:
+            max_tokens = min(max_tokens, self.ai_max_tokens)
+
+        items_by_idx: Optional[Dict[int, List[Dict[str, Any]]]] = None
+        try:
+            async with semaphore:
+                logger.info(f"  打包提取 {len(articles)} 篇文章: {articles[0].title[:30]}...")
+                if self._ai_rate_limiter:
+                    await asyncio.sleep(self._ai_rate_limiter.reserve())
+                response = await self.ai_async_client.chat.completions.create(
+                    model=self.ai_model,
+                    messages=[
+                        {"role": "system", "content": self._extract_prompt_batch},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=0
+                )
+            items_by_idx = self._parse_batch_items_response(response.choices[0].message.content)
+        except Exception as e:
+            logger.error(f"打包提取失败: {e}")
+
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(articles)
+        fallback_indices: List[int] = []
+        for i, (article, context) in enumerate(zip(articles, contexts)):
+            items = items_by_idx.get(i) if items_by_idx is not None else None
+            if items:
+                # 以单篇提取的响应格式缓存，重跑时直接走 _parse_ai_items_response
+                self._llm_cache_set(
+                    self._llm_cache_key(article),
+                    json.dumps({"items": items}, ensure_ascii=False)
+                )
+                results[i] = self._assemble_extract_items(article, context, items)
+            else:
+                # 整批解析失败或该篇缺席时退回逐篇提取，不影响同批其他文章
+                logger.warning(f"  打包结果缺少文章 {i}，退回单篇提取: {article.title[:30]}...")
+                fallback_indices.append(i)
+        if fallback_indices:
+            # 回退请求同样并发发出（仍受信号量约束），整批失败时不退化为串行
+            fallback_results = await asyncio.gather(*(
+                self._extract_items_async(articles[i], semaphore, contexts[i])
+                for i in fallback_indices
+            ))
+            for i, items in zip(fallback_indices, fallback_results):
+                results[i] = items
+        return results
+
+    def _extract_items_all(self, articles: List[Article]) -> List[List[Dict[str, Any]]]:
+        """
+        打包+并发提取多篇文章的条目（与输入顺序一致）
+
+        每篇文章的提取都阻塞在多秒的模型往返上，串行时总耗时随文章数线性增长；
+        普通文章按组打包（系统提示只发一次）、组间并发后，
+        请求数和系统提示 token 成本都降为原来的约 1/组大小。
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            每篇文章对应的条目列表
+        """
+        if len(articles) <= 1:
+            return [self._extract_items(article) for article in articles]
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(self.ai_concurrency)
+
+            async def build_context(article):
+                try:
+                    # 候选链接提取可能回源抓取页面（阻塞I/O），放进线程避免卡住事件循环
+                    return await asyncio.to_thread(self._build_extract_context, article)
+                except Exception as e:
+                    logger.error(f"构建提取上下文失败: {article.title}, 错误: {e}")
+                    return None
+
+            contexts = await asyncio.gather(*(build_context(article) for article in articles))
+            # 内容过短的非日刊文章不进打包组，置空上下文后统一走回退构造
+            for i, (article, context) in enumerate(zip(articles, contexts)):
+                if context is not None and self._should_skip_extraction(article, context):
+                    logger.info(f"  内容过短，跳过模型提取: {article.title[:30]}...")
+                    contexts[i] = None
+
+            # 缓存命中的文章直接组装，不再进入打包请求
+            resolved: List[Optional[List[Dict[str, Any]]]] = [None] * len(articles)
+            for i, (article, context) in enumerate(zip(articles, contexts)):
+                if context is None:
+                    continue
+                cached_text = self._llm_cache_get(self._llm_cache_key(article))
+                if cached_text is not None:
+                    logger.info(f"  命中模型响应缓存: {article.title[:30]}...")
+                    resolved[i] = self._finish_extract_items(article, context, cached_text)
+
+            batches = self._plan_extract_batches([
+                context if resolved[i] is None else None
+                for i, context in enumerate(contexts)
+            ])
+            batch_results = await asyncio.gather(*(
+                self._extract_batch_async(
+                    [articles[i] for i in batch],
+                    [contexts[i] for i in batch],
+                    semaphore
+                )
+                for batch in batches
+            ))
+
+            results = resolved
+            for batch, batch_result in zip(batches, batch_results):
+                for i, items in zip(batch, batch_result):
+                    results[i] = items
+            # 上下文构建失败的文章走异常回退
+            for i, items in enumerate(results):
+                if items is None:
+                    results[i] = self._extract_failure_fallback(articles[i])
+            return results
+
+        try:
+            return asyncio.run(run_all())
+        except RuntimeError:
+            # 已处于事件循环中时无法打包，退回线程池并发逐篇提取，
+            # 至少保住请求间的并发度
+            logger.warning("无法启动事件循环，退回线程池逐篇提取")
+            with ThreadPoolExecutor(max_workers=min(self.ai_concurrency, len(articles))) as executor:
+                return list(executor.map(self._extract_items, articles))
+
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _clean_summary(summary: str) -> str:
         """
         清理摘要内容，移除无效信息
-        
+
+        纯函数；同一段素材在候选过滤、点评与格式化路径上会被反复清理，
+        lru_cache 后重复调用退化为一次哈希查找。
+
         Args:
             summary: 原始摘要
-            
+
         Returns:
             清理后的摘要
         """
         if not summary:
             return "暂无描述"
-        
-        # 需要过滤的无效内容模式
-        invalid_patterns = [
-            r'Article URL:\s*<[^>]+>',
-            r'Comments URL:\s*<[^>]+>',
-            r'Points:\s*\d+',
-            r'# Comments:\s*\d+',
-            r'Comments:\s*\d+',
-            r'<https?://[^>]+>',  # 尖括号包裹的 URL
-            r'Article URL:.*',
-            r'Comments URL:.*',
-            r'<thinking>.*?</thinking>',  # 移除 thinking 标签及其内容
-            r'<thinking>.*',  # 移除未闭合的 thinking 标签
-        ]
-        
-        clean_text = summary
-        for pattern in invalid_patterns:
-            clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-        
+
+        clean_text = _INVALID_SUMMARY_RE.sub('', summary)
+
         # 移除多余的空行和空格
-        clean_text = re.sub(r'\n\s*\n', '\n', clean_text)
+        clean_text = _BLANK_LINES_RE.sub('\n', clean_text)
         clean_text = clean_text.strip()
         
         # 如果清理后内容太短或为空，返回默认值
@@ -809,14 +1686,20 @@ URL：{article.url}
         if clean_text == "暂无描述":
             return clean_text
 
-        clean_text = re.sub(r'^\s*\d+\.\s*', '', clean_text)
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = _LEADING_INDEX_RE.sub('', clean_text)
+        clean_text = _WS_RE.sub(' ', clean_text).strip()
 
         if len(clean_text) > 180:
             clean_text = clean_text[:180].rstrip('，,；;。.!?！？')
 
-        emoji_pattern = r'[\U0001F300-\U0001FAFF\u2600-\u27BF]'
-        emoji_count = len(re.findall(emoji_pattern, clean_text))
+        # 只需区分 0 / 1 / 多个：最多两次C层正则搜索，第二次从首个命中之后接着找
+        first_emoji = _EMOJI_RE.search(clean_text)
+        if first_emoji is None:
+            emoji_count = 0
+        elif _EMOJI_RE.search(clean_text, first_emoji.end()):
+            emoji_count = 2
+        else:
+            emoji_count = 1
         if emoji_count == 0:
             if not clean_text.endswith(('。', '！', '？', '.', '!', '?')):
                 clean_text += '。'
@@ -834,8 +1717,7 @@ URL：{article.url}
             response = self.http_session.get("https://github.com/trending?since=daily", timeout=15)
             response.raise_for_status()
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, _BS_PARSER)
             repos: List[Dict[str, str]] = []
 
             for row in soup.select('article.Box-row'):
@@ -847,7 +1729,7 @@ URL：{article.url}
                 if not href:
                     continue
                 repo_url = urljoin("https://github.com", href)
-                repo_name = re.sub(r'\s+', '', repo_link.get_text(" ", strip=True)).strip('/')
+                repo_name = _WS_RE.sub('', repo_link.get_text(" ", strip=True)).strip('/')
                 if not repo_name:
                     continue
 
@@ -873,7 +1755,7 @@ URL：{article.url}
         """
         生成工具补全项的编辑点评摘要
         """
-        desc = re.sub(r'\s+', ' ', (description or "").strip())
+        desc = _WS_RE.sub(' ', (description or "").strip())
         if len(desc) > 100:
             desc = desc[:100].rstrip('，,；;。.!?！？:：') + "..."
         stars_text = f"，当前热度 {stars}" if stars else ""
@@ -883,14 +1765,10 @@ URL：{article.url}
             summary = f"🚀 GitHub 热门项目 {name}{stars_text}，近期关注度很高。建议快速浏览 README、Issue 与示例，判断是否适合当前业务。⭐🛠️"
         return self._format_editor_summary(summary)
 
-    def _compose_editor_commentary(self, title: str, raw_summary: str, category_name: str) -> str:
+    def _build_commentary_prompt(self, title: str, base_summary: str, category_name: str) -> List[Dict[str, str]]:
         """
-        用模型生成简短点评，失败时退回本地摘要格式化
+        构建编辑点评请求的消息列表（纯函数，便于批量分发）
         """
-        base_summary = self._clean_summary(raw_summary) if raw_summary else "暂无描述"
-        if base_summary == "暂无描述":
-            return base_summary
-
         prompt = f"""你是技术周刊编辑。请基于给定标题和素材，写一段中文点评。
 
 要求：
@@ -901,14 +1779,26 @@ URL：{article.url}
 
 分类：{category_name}
 标题：{title}
-素材：{truncate_text(base_summary, 320)}"""
+素材：{truncate_text(_strip_boilerplate(base_summary), 320)}"""
+        return [
+            {"role": "system", "content": "你是专业的技术编辑。"},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _compose_editor_commentary(self, title: str, raw_summary: str, category_name: str) -> str:
+        """
+        用模型生成简短点评，失败时退回本地摘要格式化
+        """
+        base_summary = self._clean_summary(raw_summary) if raw_summary else "暂无描述"
+        if base_summary == "暂无描述":
+            return base_summary
+
         try:
+            if self._ai_rate_limiter:
+                self._ai_rate_limiter.wait()
             response = self.ai_client.chat.completions.create(
                 model=self.ai_model,
-                messages=[
-                    {"role": "system", "content": "你是专业的技术编辑。"},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._build_commentary_prompt(title, base_summary, category_name),
                 max_tokens=220,
                 temperature=0.5
             )
@@ -920,56 +1810,81 @@ URL：{article.url}
 
         return self._format_editor_summary(base_summary)
 
-    def _get_fallback_feeds_for_category(self, category_name: str) -> List[Dict[str, str]]:
-        """
-        分类兜底的联网来源（RSS）
+    def _compose_editor_commentary_batch(
+        self,
+        inputs: List[Tuple[str, str, str]]
+    ) -> List[str]:
         """
-        if category_name == "AI资讯":
-            return [
-                {"name": "OpenAI News", "url": "https://openai.com/news/rss.xml"},
-                {"name": "Hugging Face Blog", "url": "https://huggingface.co/blog/feed.xml"},
-                {"name": "Google AI Blog", "url": "https://blog.google/technology/ai/rss/"},
-                {"name": "VentureBeat AI", "url": "https://venturebeat.com/category/ai/feed/"},
-                {"name": "AI News", "url": "https://www.artificialintelligence-news.com/feed/"},
-                {"name": "MIT AI Topic", "url": "https://www.technologyreview.com/topic/artificial-intelligence/feed"},
-            ]
+        并发生成多条编辑点评（结果顺序与输入一致）
 
-        if category_name == "时事":
-            return [
-                {"name": "TechCrunch", "url": "https://techcrunch.com/feed/"},
-                {"name": "The Verge", "url": "https://www.theverge.com/rss/index.xml"},
-                {"name": "InfoQ", "url": "https://www.infoq.com/feed/"},
-                {"name": "36Kr", "url": "https://www.36kr.com/feed"},
-            ]
+        每条点评都阻塞在一次模型往返上，线程池分发后整批耗时
+        从各次延迟之和降到最慢一次的水平；单条失败在
+        _compose_editor_commentary 内部回退本地格式化，不影响其余。
 
-        if category_name == "教程":
-            return [
-                {"name": "Frontend Masters Blog", "url": "https://frontendmasters.com/blog/feed/"},
-                {"name": "CSS-Tricks", "url": "https://css-tricks.com/feed/"},
-                {"name": "Smashing Magazine", "url": "https://www.smashingmagazine.com/feed/"},
-                {"name": "web.dev", "url": "https://web.dev/feed.xml"},
-            ]
+        Args:
+            inputs: (标题, 原始摘要, 分类名) 元组列表
 
-        return []
+        Returns:
+            与输入顺序一致的点评列表
+        """
+        if not inputs:
+            return []
+        if len(inputs) == 1:
+            return [self._compose_editor_commentary(*inputs[0])]
+        with ThreadPoolExecutor(max_workers=min(8, len(inputs))) as executor:
+            return list(executor.map(
+                lambda args: self._compose_editor_commentary(*args), inputs
+            ))
+
+    # 分类兜底的联网来源（RSS），常量只建一次、按引用返回；
+    # MappingProxyType 保证共享数据不会被调用方意外改写
+    _FALLBACK_FEEDS: Mapping[str, Tuple[Dict[str, str], ...]] = MappingProxyType({
+        "AI资讯": (
+            {"name": "OpenAI News", "url": "https://openai.com/news/rss.xml"},
+            {"name": "Hugging Face Blog", "url": "https://huggingface.co/blog/feed.xml"},
+            {"name": "Google AI Blog", "url": "https://blog.google/technology/ai/rss/"},
+            {"name": "VentureBeat AI", "url": "https://venturebeat.com/category/ai/feed/"},
+            {"name": "AI News", "url": "https://www.artificialintelligence-news.com/feed/"},
+            {"name": "MIT AI Topic", "url": "https://www.technologyreview.com/topic/artificial-intelligence/feed"},
+        ),
+        "时事": (
+            {"name": "TechCrunch", "url": "https://techcrunch.com/feed/"},
+            {"name": "The Verge", "url": "https://www.theverge.com/rss/index.xml"},
+            {"name": "InfoQ", "url": "https://www.infoq.com/feed/"},
+            {"name": "36Kr", "url": "https://www.36kr.com/feed"},
+        ),
+        "教程": (
+            {"name": "Frontend Masters Blog", "url": "https://frontendmasters.com/blog/feed/"},
+            {"name": "CSS-Tricks", "url": "https://css-tricks.com/feed/"},
+            {"name": "Smashing Magazine", "url": "https://www.smashingmagazine.com/feed/"},
+            {"name": "web.dev", "url": "https://web.dev/feed.xml"},
+        ),
+    })
+
+    def _get_fallback_feeds_for_category(self, category_name: str) -> Tuple[Dict[str, str], ...]:
+        """
+        分类兜底的联网来源（RSS）
+        """
+        return self._FALLBACK_FEEDS.get(category_name, ())
 
     def _article_timestamp(self, article: Article) -> float:
         """
-        统一文章时间戳，便于排序
+        统一文章时间戳，便于排序（结果缓存在文章对象上）
         """
-        if not article.published:
-            return 0.0
-        dt = article.published
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.timestamp()
+        return article.sort_timestamp()
 
     def _collect_fallback_articles(
         self,
-        feeds: List[Dict[str, str]],
-        max_articles: int = 120
+        feeds: Sequence[Dict[str, str]],
+        max_articles: int = 120,
+        now_ts: Optional[float] = None
     ) -> List[Article]:
         """
         从兜底 RSS 源抓取并按时间排序
+
+        fetch_all 内部已对各源并发抓取（整批耗时约等于最慢的单个源），
+        这里只负责时间窗口过滤和排序。now_ts 由上层按运行传入，
+        同一轮里多个分类兜底共用同一个"现在"。
         """
         if not feeds:
             return []
@@ -981,24 +1896,26 @@ URL：{article.url}
 
         # 兜底阶段适当放宽时间窗口，保证最小数量目标
         fallback_hours = max(self.config.get('time_filter', {}).get('hours', 168), 336)
-        now = datetime.now(timezone.utc).timestamp()
+        now = now_ts if now_ts is not None else datetime.now(_UTC).timestamp()
         cutoff = now - fallback_hours * 3600
 
-        filtered = []
+        # 时间戳只算一次，过滤与排序共用（装饰-排序-去装饰）
+        decorated = []
         for article in articles:
             ts = self._article_timestamp(article)
             if ts == 0 or ts >= cutoff:
-                filtered.append(article)
+                decorated.append((ts, article))
 
-        filtered.sort(key=self._article_timestamp, reverse=True)
-        return filtered[:max_articles]
+        decorated.sort(key=lambda pair: pair[0], reverse=True)
+        return [article for _, article in decorated[:max_articles]]
 
     def _supplement_category_with_feeds(
         self,
         category_name: str,
         needed_count: int,
         run_dedup_urls: set,
-        used_image_urls: set
+        used_image_urls: set,
+        now_ts: Optional[float] = None
     ) -> List[WeeklyItem]:
         """
         通过联网 RSS 兜底补齐指定分类
@@ -1007,11 +1924,16 @@ URL：{article.url}
             return []
 
         feeds = self._get_fallback_feeds_for_category(category_name)
-        fallback_articles = self._collect_fallback_articles(feeds, max_articles=max(needed_count * 20, 80))
+        fallback_articles = self._collect_fallback_articles(
+            feeds,
+            max_articles=max(needed_count * 20, 80),
+            now_ts=now_ts
+        )
         if not fallback_articles:
             return []
 
-        items: List[WeeklyItem] = []
+        # 第一阶段：纯本地过滤（去重/URL/可用素材），选满所需数量的候选
+        candidates: List[Tuple[Article, str]] = []
         for article in fallback_articles:
             title = (article.title or "").strip()
             item_url = (article.url or "").strip()
@@ -1019,23 +1941,45 @@ URL：{article.url}
                 continue
 
             dedup_key = self._build_dedup_key(item_url, item_url, title)
-            if dedup_key in run_dedup_urls:
+            dedup_fp = _fp(dedup_key)
+            if dedup_fp in run_dedup_urls:
                 continue
             if self.deduplicator and self.deduplicator.is_duplicate(dedup_key):
                 continue
 
             raw_summary = article.summary or article.content or title
-            summary = self._compose_editor_commentary(title, raw_summary, category_name)
+            # 没有可用素材的文章点评必然是"暂无描述"，提前跳过省一次模型调用
+            if self._clean_summary(raw_summary) == "暂无描述":
+                continue
+
+            run_dedup_urls.add(dedup_fp)
+            candidates.append((article, dedup_key))
+            if len(candidates) >= needed_count:
+                break
+
+        # 第二阶段：点评请求并发分发，整批耗时约等于最慢的一次往返
+        summaries = self._compose_editor_commentary_batch([
+            (
+                (article.title or "").strip(),
+                article.summary or article.content or (article.title or "").strip(),
+                category_name
+            )
+            for article, _ in candidates
+        ])
+
+        items: List[WeeklyItem] = []
+        for (article, dedup_key), summary in zip(candidates, summaries):
             if not summary or summary == "暂无描述":
                 continue
+            title = (article.title or "").strip()
+            item_url = (article.url or "").strip()
 
             image_url = self._resolve_item_image_url(item_url, item_url, article.image_url)
-            if image_url and image_url in used_image_urls:
+            if image_url and _fp(image_url) in used_image_urls:
                 image_url = ""
             if image_url:
-                used_image_urls.add(image_url)
+                used_image_urls.add(_fp(image_url))
 
-            run_dedup_urls.add(dedup_key)
             items.append(WeeklyItem(
                 title=title,
                 url=item_url,
@@ -1045,19 +1989,21 @@ URL：{article.url}
                 short_title=title,
                 image_url=image_url,
                 item_url=item_url,
-                source_url=item_url
+                source_url=item_url,
+                dedup_key=dedup_key
             ))
 
-            if len(items) >= needed_count:
-                break
-
         if items:
             logger.info(f"{category_name} 分类已通过联网兜底补齐 {len(items)} 条")
         return items
 
-    def _get_effective_min_count(self, category_name: str, config_min_count: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_effective_min_count(category_name: str, config_min_count: int) -> int:
         """
         计算分类最小数量约束（时事/AI资讯强制至少5）
+
+        纯函数且入参组合有限，lru_cache 后每分类只算一次。
         """
         min_count = max(0, int(config_min_count or 0))
         if category_name in ("时事", "AI资讯"):
@@ -1087,12 +2033,13 @@ URL：{article.url}
                 continue
 
             dedup_key = self._build_dedup_key(item_url, item_url, title)
-            if dedup_key in run_dedup_urls:
+            dedup_fp = _fp(dedup_key)
+            if dedup_fp in run_dedup_urls:
                 continue
             if self.deduplicator and self.deduplicator.is_duplicate(dedup_key):
                 continue
 
-            run_dedup_urls.add(dedup_key)
+            run_dedup_urls.add(dedup_fp)
             item = WeeklyItem(
                 title=title,
                 url=item_url,
@@ -1106,7 +2053,8 @@ URL：{article.url}
                 short_title=title,
                 image_url="",
                 item_url=item_url,
-                source_url=item_url
+                source_url=item_url,
+                dedup_key=dedup_key
             )
             items.append(item)
             if len(items) >= needed_count:
@@ -1132,8 +2080,7 @@ URL：{article.url}
         original_title = article.title.strip()
         
         # 检测是否为日期格式的日刊/日报标题
-        date_pattern = r'^\d{4}-?\d{2}-?\d{2}.*?(日刊|日报|Daily)'
-        is_date_title = re.match(date_pattern, original_title, re.IGNORECASE)
+        is_date_title = _DATE_TITLE_RE.match(original_title)
         
         if not is_date_title:
             # 不是日期格式，直接返回原标题（截断到15字）
@@ -1144,22 +2091,13 @@ URL：{article.url}
         
         # 优先从"今日摘要"后提取第一条有意义的资讯
         # 格式通常是：今日摘要 豆包眼镜2000内售腾讯ima一键生成PPT SeedFold超...
-        summary_match = re.search(r'今日摘要\s*([^\n]{5,80})', content)
+        summary_match = _TODAY_SUMMARY_TITLE_RE.search(content)
         if summary_match:
             summary_text = summary_match.group(1).strip()
             # 提取第一个有意义的短语（通常以中文名词/产品开头）
             # 匹配模式：产品名+动作，或者公司名+产品
-            news_patterns = [
-                # 公司/产品名 + 动作（如：豆包眼镜开售、腾讯ima一键生成PPT）
-                r'([A-Za-z\u4e00-\u9fa5]{2,8}(?:眼镜|模型|平台|工具|框架|系统)?(?:开售|发布|上线|开源|推出|获得|完成|融资|突破|超越|冲刺)[^\s]*)',
-                # 产品版本格式（如：SeedFold超AlphaFold3）
-                r'([A-Za-z][A-Za-z0-9]{1,10}超[A-Za-z0-9]{2,12})',
-                # 通用的"XX+动词"格式
-                r'([\u4e00-\u9fa5A-Za-z]{2,6}(?:AI|眼镜|模型|芯片|平台)?[\u4e00-\u9fa5]{2,8})',
-            ]
-            
-            for pattern in news_patterns:
-                match = re.search(pattern, summary_text)
+            for pattern in _NEWS_TITLE_PATTERNS:
+                match = pattern.search(summary_text)
                 if match:
                     extracted = match.group(1).strip()
                     if 4 <= len(extracted) <= 15:
@@ -1169,24 +2107,33 @@ URL：{article.url}
             return summary_text[:15]
         
         # 备用：从内容中匹配常见的资讯模式
-        patterns = [
-            # 中文产品/公司名 + 动作
-            r'([\u4e00-\u9fa5A-Za-z]{2,8}(?:公测|发布|开源|上线|推出|开售|开放|获得|完成|宣布|融资|突破)[^\n。！]{0,8})',
-            # 公司名 + 产品动作
-            r'((?:小米|字节|腾讯|阿里|百度|华为|OpenAI|Meta|Google|微软|Apple|北京|上海)[A-Za-z\u4e00-\u9fa5]{2,12})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content[:2000])
+        # 用 pos/endpos 限定扫描范围，省掉每个模式一次 content[:2000] 切片拷贝
+        for pattern in _CONTENT_TITLE_PATTERNS:
+            match = pattern.search(content, 0, 2000)
             if match:
                 extracted = match.group(1).strip()
-                extracted = re.sub(r'\s+', '', extracted)
+                extracted = _WS_RE.sub('', extracted)
                 if 4 <= len(extracted) <= 15:
                     return extracted
         
         # 最后回退：使用原标题
         return original_title[:15]
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _keyword_sentence_pattern(keywords: Tuple[str, ...]) -> 're.Pattern':
+        """
+        构建“包含任一关键词的整句”正则（按关键词组合缓存）
+
+        Args:
+            keywords: 标题关键词
+
+        Returns:
+            编译后的正则
+        """
+        alternation = '|'.join(map(re.escape, keywords))
+        return re.compile(rf'[^。！？\n]*(?:{alternation})[^。！？\n]*[。！？]?')
+
     def _extract_fallback_summary(self, article: Article, title: str) -> str:
         """
         从日刊类文章内容中提取与标题相关的简介
@@ -1204,24 +2151,21 @@ URL：{article.url}
         
         # 尝试从内容中查找与标题相关的段落
         # 查找标题附近的内容
-        title_keywords = list(filter(lambda x: len(x) >= 2, 
-                                     re.findall(r'[A-Za-z]+|\u4e00-\u9fa5{2,}', title)))
+        title_keywords = [kw for kw in _TITLE_KEYWORD_RE.findall(title) if len(kw) >= 2]
         
         if title_keywords:
-            # 尝试找到包含标题关键词的句子
-            for keyword in title_keywords[:3]:
-                # 查找关键词所在的句子
-                pattern = rf'[^。！？\n]*{re.escape(keyword)}[^。！？\n]*[。！？]?'
-                match = re.search(pattern, content)
-                if match:
-                    sentence = match.group().strip()
-                    # 限制长度并清理
-                    if 20 <= len(sentence) <= 150:
-                        return self._clean_summary(sentence)
+            # 所有关键词融合为单条交替正则，整段内容只扫一遍就拿到最先出现的
+            # 命中句（不再先切句再逐关键词遍历）；模式按关键词组合缓存
+            pattern = self._keyword_sentence_pattern(tuple(title_keywords[:3]))
+            match = pattern.search(content)
+            if match:
+                sentence = match.group(0).strip()
+                # 限制长度并清理
+                if 20 <= len(sentence) <= 150:
+                    return self._clean_summary(sentence)
         
         # 如果找不到相关内容，提取"今日摘要"后的一段内容
-        summary_pattern = r'今日摘要\s*(.{20,200})'
-        summary_match = re.search(summary_pattern, content)
+        summary_match = _TODAY_SUMMARY_RE.search(content)
         if summary_match:
             return self._clean_summary(summary_match.group(1)[:150])
         
@@ -1231,24 +2175,107 @@ URL：{article.url}
         
         return "暂无描述"
     
-    def _detect_english(self, text: str) -> bool:
+    # 近重复判定阈值（3-gram Jaccard 相似度）
+    _NEAR_DUP_THRESHOLD = 0.85
+
+    @staticmethod
+    def _article_shingles(article: Article) -> frozenset:
         """
-        检测文本是否为英文
-        
+        构建文章去重指纹：标题 + 摘要前300字的字符 3-gram 集合
+
+        Args:
+            article: 文章对象
+
+        Returns:
+            3-gram 集合
+        """
+        text = _WS_RE.sub('', f"{article.title}{(article.summary or article.content or '')[:300]}".lower())
+        if len(text) < 3:
+            return frozenset((text,)) if text else frozenset()
+        return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+    def _is_article_relevant(self, article: Article) -> bool:
+        """
+        便宜的预筛：明显的招聘/营销类文章不值得一次模型往返
+
+        只做负向过滤且宁可放过：标题或摘要前500字命中标志词才跳过，
+        其余一律进入提取。
+
+        Args:
+            article: 文章对象
+
+        Returns:
+            True表示值得提取
+        """
+        sample = f"{article.title} {(article.summary or article.content or '')[:500]}"
+        return _IRRELEVANT_ARTICLE_RE.search(sample) is None
+
+    def _filter_near_duplicates(self, articles: List[Article]) -> List[Article]:
+        """
+        过滤跨源近重复文章（保留先出现者）
+
+        同一条资讯经常被多个源转载，标题和导语几乎一致但 URL 不同，
+        仅按 URL 去重拦不住；在进 AI 提取前按内容指纹合并，省掉重复的模型调用。
+
+        Args:
+            articles: 按 URL 去重后的文章列表
+
+        Returns:
+            过滤近重复后的文章列表
+        """
+        kept: List[Article] = []
+        kept_shingles: List[frozenset] = []
+        seen_sigs: set = set()
+        for article in articles:
+            # 先用"标题+正文前200字"的精确签名拦住逐字转载，
+            # 命中时省掉整轮shingle相似度比较
+            sig = _fp(f"{article.title.strip()}|{(article.content or article.summary or '')[:200]}")
+            if sig in seen_sigs:
+                logger.info(f"  跳过近重复文章: {article.title[:40]} (内容签名重复)")
+                continue
+            seen_sigs.add(sig)
+            shingles = self._article_shingles(article)
+            duplicate_of = None
+            if shingles:
+                for other, other_shingles in zip(kept, kept_shingles):
+                    intersection = len(shingles & other_shingles)
+                    union = len(shingles) + len(other_shingles) - intersection
+                    if union and intersection / union >= self._NEAR_DUP_THRESHOLD:
+                        duplicate_of = other
+                        break
+            if duplicate_of is not None:
+                logger.info(
+                    f"  跳过近重复文章: {article.title[:40]} (与 {duplicate_of.title[:40]} 相似)"
+                )
+                continue
+            kept.append(article)
+            kept_shingles.append(shingles)
+        return kept
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _detect_english(text: str) -> bool:
+        """
+        检测文本是否为英文（纯函数，标题会重复出现，lru_cache 记忆结果）
+
         Args:
             text: 待检测文本
-            
+
         Returns:
             是否为英文
         """
         if not text:
             return False
-        # 计算英文字符占比
-        english_chars = sum(1 for c in text if c.isalpha() and ord(c) < 128)
-        total_chars = sum(1 for c in text if c.isalpha())
+        # 计算英文字符占比：encode+translate 和正则 sub 都在C层单遍完成，
+        # 代替逐字符isalpha/ord的两趟Python循环
+        ascii_alpha = text.encode('ascii', 'ignore').translate(None, _NON_ALPHA_ASCII_BYTES)
+        if not ascii_alpha:
+            # 没有任何英文字母（纯中文标题的常见情形）就不必再做第二遍扫描
+            return False
+        total_chars = len(_NON_ALPHA_RE.sub('', text))
         if total_chars == 0:
             return False
-        return english_chars / total_chars > 0.7
+        return len(ascii_alpha) / total_chars > 0.7
     
     def _process_all_articles(self) -> Dict[str, List[WeeklyItem]]:
         """
@@ -1259,35 +2286,80 @@ URL：{article.url}
         """
         categories_config = self.config.get('categories', {})
         all_items: Dict[str, List[WeeklyItem]] = {}
-        processed_urls = set()
-        run_dedup_urls = set()
-        used_image_urls = set()
+        # 每轮运行的去重集合只存64位指纹（见 _fp），不保留长URL字符串
+        processed_urls: set = set()
+        run_dedup_urls: set = set()
+        used_image_urls: set = set()
         allowed_category_names = {
             cat_config.get('name', cat_key)
             for cat_key, cat_config in categories_config.items()
             if cat_key != 'training'
         }
         
-        # 收集所有唯一的文章
+        # 收集所有唯一的文章：各分类抓取互相独立且以等待I/O为主，
+        # 线程池并发后这一阶段的总耗时约等于最慢的单个分类
+        fetch_targets = [
+            (cat_key, cat_config)
+            for cat_key, cat_config in categories_config.items()
+            if cat_key != 'training'
+        ]
         all_articles = []
-        for cat_key, cat_config in categories_config.items():
-            if cat_key == 'training':
-                continue
-            articles = self._fetch_category_articles(cat_config)
-            for article in articles:
-                if article.url not in processed_urls:
-                    all_articles.append(article)
-                    processed_urls.add(article.url)
+        if fetch_targets:
+            with ThreadPoolExecutor(max_workers=min(4, len(fetch_targets))) as executor:
+                futures = [
+                    executor.submit(self._fetch_category_articles, cat_config)
+                    for _, cat_config in fetch_targets
+                ]
+                # 按提交顺序合并，去重的"先到先留"结果与串行版本一致
+                for (cat_key, _), future in zip(fetch_targets, futures):
+                    try:
+                        articles = future.result()
+                    except Exception as e:
+                        logger.error(f"分类抓取失败: {cat_key}, 错误: {e}")
+                        continue
+                    for article in articles:
+                        # 去掉跟踪参数后再取指纹：同文不同渠道链接不再重复进提取
+                        url_fp = _fp(_normalize_dedup_url(article.url))
+                        if url_fp not in processed_urls:
+                            all_articles.append(article)
+                            processed_urls.add(url_fp)
         
+        # URL 去重后再按内容指纹过滤跨源转载，避免对同一条资讯重复调模型
+        all_articles = self._filter_near_duplicates(all_articles)
+
+        # 便宜预筛：明显无关（招聘/营销）的文章直接跳过，不为其支付模型调用
+        relevant_articles = [a for a in all_articles if self._is_article_relevant(a)]
+        if len(relevant_articles) != len(all_articles):
+            logger.info(f"预筛跳过 {len(all_articles) - len(relevant_articles)} 篇明显无关文章")
+        all_articles = relevant_articles
         logger.info(f"共收集 {len(all_articles)} 篇唯一文章")
         
-        # 处理每篇文章，提取多条目
-        for article in all_articles:
-            logger.info(f"  处理文章: {article.title[:40]}...")
-            
-            extracted_items = self._extract_items(article)
-            logger.info(f"    提取到 {len(extracted_items)} 个条目")
-            
+        # 并发提取所有文章的条目，再按原顺序逐篇归类
+        extracted_per_article = self._extract_items_all(all_articles)
+
+        # 预热条目页预览图缓存：条目链接与来源页不同时，归类循环里必然会
+        # 为其拉一次预览图，提前并发取回后主循环内的图片解析全部命中缓存，
+        # 不再在关键路径上逐条阻塞HTTP往返
+        prefetch_urls = []
+        seen_prefetch = set()
+        for article, extracted_items in zip(all_articles, extracted_per_article):
+            for item_data in extracted_items:
+                item_url = (item_data.get('item_url') or article.url or "").strip()
+                source_url = (item_data.get('source_url') or article.url or "").strip()
+                if item_url.startswith('http') and item_url != source_url and item_url not in seen_prefetch:
+                    seen_prefetch.add(item_url)
+                    prefetch_urls.append(item_url)
+        if prefetch_urls:
+            with ThreadPoolExecutor(max_workers=min(8, len(prefetch_urls))) as executor:
+                list(executor.map(self._fetch_page_preview_image, prefetch_urls))
+
+        # 第二阶段：纯CPU的归类与去重，产出待配图的条目列表。
+        # 去重、图片、条目组装各自成段后，每段可以套用自己的并发策略，
+        # 不再被逐条目交错的 I/O 卡住
+        pending: List[Tuple[str, Dict[str, Any], str, str, str, str]] = []
+        for article, extracted_items in zip(all_articles, extracted_per_article):
+            logger.info(f"  处理文章: {article.title[:40]}..., 提取到 {len(extracted_items)} 个条目")
+
             for item_data in extracted_items:
                 category = item_data.get('category', '时事')
                 if category not in allowed_category_names:
@@ -1302,45 +2374,57 @@ URL：{article.url}
                 if category not in all_items:
                     all_items[category] = []
 
-                if dedup_key in run_dedup_urls:
+                dedup_fp = _fp(dedup_key)
+                if dedup_fp in run_dedup_urls:
                     continue
                 if self.deduplicator and self.deduplicator.is_duplicate(dedup_key):
                     logger.info(f"    跳过已处理条目: {item_data.get('title', '')[:40]}")
                     continue
-                run_dedup_urls.add(dedup_key)
-
-                image_url = self._resolve_item_image_url(
-                    item_url,
-                    source_url,
-                    item_data.get('image_url', '')
-                )
-                if image_url and image_url in used_image_urls:
-                    # 避免周刊中大面积复用同一封面图
-                    if item_url and item_url != source_url:
-                        alt_image = self._fetch_page_preview_image(item_url)
-                        if alt_image and not self._is_bad_image_url(alt_image) and alt_image not in used_image_urls:
-                            image_url = alt_image
-                        else:
-                            image_url = ""
+                run_dedup_urls.add(dedup_fp)
+                pending.append((category, item_data, title, item_url, source_url, dedup_key))
+
+        # 第三阶段：图片解析并发执行（预览图缓存已预热，残余的回源请求互相重叠）；
+        # executor.map 保序，后面的组装顺序与串行版本一致
+        def resolve_image(entry):
+            _, item_data, _, item_url, source_url, _ = entry
+            return self._resolve_item_image_url(item_url, source_url, item_data.get('image_url', ''))
+
+        resolved_images: List[str] = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                resolved_images = list(executor.map(resolve_image, pending))
+
+        # 封面图冲突处理依赖 used_image_urls 的累积顺序，保持串行组装
+        for (category, item_data, title, item_url, source_url, dedup_key), image_url in zip(pending, resolved_images):
+            if image_url and _fp(image_url) in used_image_urls:
+                # 避免周刊中大面积复用同一封面图
+                if item_url and item_url != source_url:
+                    alt_image = self._fetch_page_preview_image(item_url)
+                    if alt_image and not self._is_bad_image_url(alt_image) and _fp(alt_image) not in used_image_urls:
+                        image_url = alt_image
                     else:
                         image_url = ""
-                if image_url:
-                    used_image_urls.add(image_url)
-                
-                item = WeeklyItem(
-                    title=title,
-                    url=item_url,
-                    summary=item_data.get('summary', '暂无描述'),
-                    is_english=item_data.get('is_english', False),
-                    category=category,
-                    short_title=item_data.get('title', ''),
-                    image_url=image_url,
-                    item_url=item_url,
-                    source_url=source_url
-                )
-                all_items[category].append(item)
+                else:
+                    image_url = ""
+            if image_url:
+                used_image_urls.add(_fp(image_url))
+
+            item = WeeklyItem(
+                title=title,
+                url=item_url,
+                summary=item_data.get('summary', '暂无描述'),
+                is_english=item_data.get('is_english', False),
+                category=category,
+                short_title=item_data.get('title', ''),
+                image_url=image_url,
+                item_url=item_url,
+                source_url=source_url,
+                dedup_key=dedup_key
+            )
+            all_items[category].append(item)
 
-        # 联网兜底：确保分类达到最小数量
+        # 联网兜底：确保分类达到最小数量（"现在"每轮只取一次，各分类共用）
+        run_now_ts = datetime.now(_UTC).timestamp()
         for cat_key, cat_config in categories_config.items():
             if cat_key == 'training':
                 continue
@@ -1358,7 +2442,8 @@ URL：{article.url}
                     cat_name,
                     needed_count,
                     run_dedup_urls,
-                    used_image_urls
+                    used_image_urls,
+                    now_ts=run_now_ts
                 )
 
             if fallback_items:
@@ -1404,7 +2489,8 @@ URL：{article.url}
         
         logger.info(f"获取 LeetCode 题目: {count} 道")
         
-        fetcher = LeetCodeFetcher(difficulties)
+        # 题目列表按天缓存在 cache/ 下，同日多次生成（预览/重试）只抓一次
+        fetcher = LeetCodeFetcher(difficulties, cache_dir=str(self.project_root / 'cache'))
         problems = fetcher.get_random_problems(count)
         
         items = []
@@ -1478,7 +2564,8 @@ URL：{article.url}
                 if category_name == "训练":
                     continue
                 for item in items:
-                    dedup_url = self._build_dedup_key(item.item_url, item.source_url, item.title)
+                    # 生成阶段已在条目上缓存去重键，这里直接复用（老条目兜底重算）
+                    dedup_url = item.dedup_key or self._build_dedup_key(item.item_url, item.source_url, item.title)
                     if dedup_url:
                         dedup_urls.append(dedup_url)
             if dedup_urls:
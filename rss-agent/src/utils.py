@@ -3,8 +3,13 @@
 包含URL去重、缓存管理等功能
 """
 
+import atexit
 import json
 import os
+import re
+import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 from pathlib import Path
@@ -13,13 +18,42 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
+# Python 3.10+ 的dataclass支持slots=True，省掉每实例__dict__（约40-60%内存）
+# 老版本解释器退回普通dataclass
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# HTML标签的兜底剥除正则，模块导入时编译一次
+_HTML_TAG_RE = re.compile('<.*?>')
+
+try:
+    # lxml是C实现的解析后端，大页面上比html.parser快5-10倍
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+try:
+    # brotli可用时才声明br，否则urllib3无法解压响应体
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+
 class URLDeduplicator:
     """URL去重器，使用本地JSON文件缓存已处理的URL"""
     
     def __init__(self, cache_file: str, expire_hours: int = 168):
         """
         初始化URL去重器
-        
+
+        写路径为"快照 + 追加日志"：标记URL只追加一行，不重写整个快照；
+        进程退出时合并日志、清理过期条目并重写快照。
+
         Args:
             cache_file: 缓存文件路径
             expire_hours: 缓存过期时间（小时）
@@ -27,45 +61,80 @@ class URLDeduplicator:
         self.cache_file = cache_file
         self.expire_hours = expire_hours
         self.cache: dict = {}
+        self._log_path = f"{cache_file}.log"
+        self._last_clean = 0.0
         self._load_cache()
+        self._log_file = open(self._log_path, 'a', encoding='utf-8')
+        atexit.register(self._compact)
     
+    @staticmethod
+    def _to_epoch(value) -> float:
+        """把缓存时间戳统一成unix秒；兼容旧的ISO字符串，解析失败视为过期"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            pass
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (ValueError, TypeError):
+            return 0.0
+
     def _load_cache(self):
-        """从文件加载缓存"""
+        """从文件加载缓存（快照 + 重放追加日志），旧ISO格式在加载时迁移"""
         if os.path.exists(self.cache_file):
             try:
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.cache = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                    raw = json.load(f)
+                self.cache = {url: self._to_epoch(ts) for url, ts in raw.items()}
+            except (json.JSONDecodeError, IOError, AttributeError):
                 self.cache = {}
         else:
             # 确保目录存在
             Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
             self.cache = {}
+
+        # 上次运行若未正常合并（崩溃/被杀），从日志补回增量
+        if os.path.exists(self._log_path):
+            try:
+                with open(self._log_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        url, sep, timestamp = line.rstrip('\n').partition('\t')
+                        if sep and url:
+                            self.cache[url] = self._to_epoch(timestamp)
+            except IOError:
+                pass
     
     def _save_cache(self):
-        """保存缓存到文件"""
+        """保存缓存快照到文件"""
         Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
         with open(self.cache_file, 'w', encoding='utf-8') as f:
             json.dump(self.cache, f, ensure_ascii=False, indent=2)
-    
-    def _clean_expired(self):
-        """清理过期的缓存条目"""
-        now = datetime.now()
-        expired_urls = []
-        
-        for url, timestamp_str in self.cache.items():
-            try:
-                cached_time = datetime.fromisoformat(timestamp_str)
-                if now - cached_time > timedelta(hours=self.expire_hours):
-                    expired_urls.append(url)
-            except (ValueError, TypeError):
-                expired_urls.append(url)
-        
-        for url in expired_urls:
-            del self.cache[url]
-        
-        if expired_urls:
+
+    def _append_log(self, entries):
+        """把若干 (url, 时间戳) 追加进日志（单次write，不做fsync）"""
+        try:
+            self._log_file.write(''.join(f"{url}\t{timestamp}\n" for url, timestamp in entries))
+            self._log_file.flush()
+        except (IOError, ValueError):
+            # 日志写失败只影响崩溃恢复，内存状态与退出时的快照仍然正确
+            pass
+
+    def _compact(self):
+        """合并日志进快照：清理过期条目、重写快照并清空日志"""
+        try:
+            self._clean_expired()
             self._save_cache()
+            self._log_file.close()
+            open(self._log_path, 'w', encoding='utf-8').close()
+        except (IOError, OSError):
+            pass
+
+    def _clean_expired(self):
+        """清理过期的缓存条目（只改内存，落盘由退出时的合并负责）"""
+        cutoff = time.time() - self.expire_hours * 3600
+        self.cache = {url: ts for url, ts in self.cache.items() if ts >= cutoff}
     
     def is_duplicate(self, url: str) -> bool:
         """
@@ -77,8 +146,15 @@ class URLDeduplicator:
         Returns:
             True如果是重复的，False否则
         """
-        self._clean_expired()
-        return url in self.cache
+        # 负查询直接短路：未见过的URL（绝大多数新条目）一次哈希查找就能判定；
+        # 命中时也只比较这一条的时间戳，不再每次全表扫描
+        timestamp = self.cache.get(url)
+        if timestamp is None:
+            return False
+        if timestamp < time.time() - self.expire_hours * 3600:
+            del self.cache[url]
+            return False
+        return True
     
     def mark_processed(self, url: str):
         """
@@ -87,8 +163,9 @@ class URLDeduplicator:
         Args:
             url: 要标记的URL
         """
-        self.cache[url] = datetime.now().isoformat()
-        self._save_cache()
+        timestamp = time.time()
+        self.cache[url] = timestamp
+        self._append_log(((url, timestamp),))
     
     def mark_batch_processed(self, urls: List[str]):
         """
@@ -97,10 +174,10 @@ class URLDeduplicator:
         Args:
             urls: URL列表
         """
-        now = datetime.now().isoformat()
+        now = time.time()
         for url in urls:
             self.cache[url] = now
-        self._save_cache()
+        self._append_log((url, now) for url in urls)
     
     def filter_new_urls(self, urls: List[str]) -> List[str]:
         """
@@ -112,8 +189,14 @@ class URLDeduplicator:
         Returns:
             未处理过的URL列表
         """
-        self._clean_expired()
-        return [url for url in urls if url not in self.cache]
+        # 全表过期扫描节流到每5分钟一次；相对168小时的过期窗口，
+        # 5分钟内把刚过期的URL仍当作"已见过"没有实际影响
+        now = time.monotonic()
+        if now - self._last_clean > 300:
+            self._clean_expired()
+            self._last_clean = now
+        seen = self.cache
+        return [url for url in urls if url not in seen]
     
     def get_processed_count(self) -> int:
         """获取已处理URL数量"""
@@ -123,7 +206,9 @@ class URLDeduplicator:
 def create_retry_session(
     total_retries: int = 3,
     backoff_factor: float = 0.8,
-    status_forcelist: Optional[Tuple[int, ...]] = None
+    status_forcelist: Optional[Tuple[int, ...]] = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10
 ) -> requests.Session:
     """
     创建带重试机制的 requests Session
@@ -132,6 +217,8 @@ def create_retry_session(
         total_retries: 最大重试次数
         backoff_factor: 退避系数
         status_forcelist: 触发重试的状态码
+        pool_connections: 连接池数量（按host）
+        pool_maxsize: 单个连接池的最大连接数
 
     Returns:
         requests.Session
@@ -148,13 +235,47 @@ def create_retry_session(
         raise_on_status=False
     )
 
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize
+    )
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    获取进程级共享的重试 Session（懒初始化）
+
+    各分类的RSS抓取器各自建 Session 时，同一个源站在一轮运行里要反复
+    付出 TCP+TLS 握手；共享一个大连接池的 Session 后长连接跨抓取器复用。
+
+    Returns:
+        requests.Session
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = create_retry_session(
+                    total_retries=3,
+                    backoff_factor=0.8,
+                    pool_connections=32,
+                    pool_maxsize=64
+                )
+                # 显式声明压缩编码，源站按此返回压缩响应体
+                session.headers['Accept-Encoding'] = _ACCEPT_ENCODING
+                _shared_session = session
+    return _shared_session
+
+
 def clean_html(html_content: str) -> str:
     """
     清理HTML内容，提取纯文本
@@ -168,9 +289,9 @@ def clean_html(html_content: str) -> str:
     try:
         from bs4 import BeautifulSoup
         import html2text
-        
-        # 使用BeautifulSoup清理HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+
+        # 使用BeautifulSoup清理HTML（优先lxml后端，比html.parser快5-10倍）
+        soup = BeautifulSoup(html_content, _BS_PARSER)
         
         # 移除script和style标签
         for script in soup(["script", "style"]):
@@ -186,9 +307,34 @@ def clean_html(html_content: str) -> str:
         return text.strip()
     except Exception:
         # 如果处理失败，返回原始内容（去掉标签）
-        import re
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', html_content).strip()
+        return _HTML_TAG_RE.sub('', html_content).strip()
+
+
+try:
+    # 可选依赖：Lexbor的C解析器，纯文本提取比BeautifulSoup快一个数量级以上
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+
+def fast_clean_html(html_content: str) -> str:
+    """
+    快速清理HTML内容，提取纯文本（热路径用）
+
+    安装了selectolax时使用C解析器，否则回退到clean_html。
+
+    Args:
+        html_content: HTML内容
+
+    Returns:
+        清理后的纯文本
+    """
+    if _SelectolaxParser is not None:
+        try:
+            return _SelectolaxParser(html_content).text(separator=' ').strip()
+        except Exception:
+            pass
+    return clean_html(html_content)
 
 
 def truncate_text(text: str, max_length: int = 5000) -> str:
@@ -5,18 +5,48 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
-from .runner import RunManager, RunRequest
+from .runner import RunManager, RunRequest, event_bus
 from .storage import RunStorage, TERMINAL_STATUSES
 
+try:
+    # Optional Rust JSON encoder; the fetch/generator side already prefers it.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional SSE framing/keepalive implementation; falls back to manual
+    # framing over StreamingResponse when not installed.
+    from sse_starlette.sse import EventSourceResponse
+except ImportError:
+    EventSourceResponse = None
+
+if orjson is not None:
+    def _dumps(payload: Any) -> str:
+        # All SSE payload keys are strings, so no OPT_NON_STR_KEYS needed.
+        return orjson.dumps(payload).decode()
+else:
+    def _dumps(payload: Any) -> str:
+        return json.dumps(payload, ensure_ascii=False)
+
 MODULE_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = MODULE_DIR.parents[1]  # rss-agent/
 DB_PATH = PROJECT_ROOT / "cache" / "webui_runs.db"
@@ -24,10 +54,30 @@ DB_PATH = PROJECT_ROOT / "cache" / "webui_runs.db"
 storage = RunStorage(DB_PATH)
 manager = RunManager(project_root=PROJECT_ROOT, python_exec=os.environ.get("PYTHON_EXECUTABLE", "python"), storage=storage)
 
-app = FastAPI(title="RSS Agent Dashboard", version="1.0.0")
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Bind the server loop so run coroutines share it with SSE consumers."""
+    manager.bind_loop(asyncio.get_running_loop())
+    yield
+
+
+app = FastAPI(
+    title="RSS Agent Dashboard",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
+# Compress responses over 1 KiB (run lists, logs, artifact previews).
+# Starlette's default exclusions already skip text/event-stream, so the
+# SSE endpoint keeps streaming uncompressed and unbuffered.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 app.mount("/static", StaticFiles(directory=str(MODULE_DIR / "static")), name="static")
 templates = Jinja2Templates(directory=str(MODULE_DIR / "templates"))
 
+# The dashboard page only interpolates project_root, which is fixed for the
+# process — render once at import and serve the cached string.
+_INDEX_HTML = templates.get_template("index.html").render(project_root=str(PROJECT_ROOT))
+
 
 class StartRunPayload(BaseModel):
     """Payload for starting a run."""
@@ -41,30 +91,34 @@ class StartRunPayload(BaseModel):
     extra_args: List[str] = Field(default_factory=list)
 
 
+# The project root never moves while the process lives; resolve it once.
+_PROJECT_ROOT_RESOLVED = PROJECT_ROOT.resolve()
+
+
+@lru_cache(maxsize=256)
 def _resolve_artifact_path(path_text: str) -> Path:
+    """Resolve an artifact path and enforce project-root containment.
+
+    Cached: the same output_path is resolved on every preview/download of a
+    run, and resolve() stats each path component. lru_cache never caches
+    raised exceptions, so escaping paths are rejected on every call.
+    """
     path = Path(path_text)
     if not path.is_absolute():
         path = PROJECT_ROOT / path
 
     resolved = path.resolve()
-    project_root = PROJECT_ROOT.resolve()
     try:
-        resolved.relative_to(project_root)
+        resolved.relative_to(_PROJECT_ROOT_RESOLVED)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="产物路径超出项目目录") from exc
     return resolved
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+async def index():
     """Main dashboard page."""
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "project_root": str(PROJECT_ROOT),
-        },
-    )
+    return HTMLResponse(_INDEX_HTML)
 
 
 @app.get("/api/runs")
@@ -87,12 +141,17 @@ def get_run_logs(
     run_id: int,
     after_id: int = Query(default=0, ge=0),
     limit: int = Query(default=500, ge=1, le=2000),
+    include_raw: bool = Query(default=False),
 ):
-    """Get logs for a run."""
+    """Get logs for a run. raw_line is only returned when requested."""
     run = storage.get_run(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="运行记录不存在")
-    return {"logs": storage.get_logs(run_id, after_id=after_id, limit=limit)}
+    return {
+        "logs": storage.get_logs(
+            run_id, after_id=after_id, limit=limit, include_raw=include_raw
+        )
+    }
 
 
 @app.post("/api/runs")
@@ -155,15 +214,15 @@ def delete_run(run_id: int, delete_artifact: bool = Query(default=False)):
     deleted, artifact_deleted = storage.delete_run(run_id, delete_artifact=delete_artifact)
     if not deleted:
         raise HTTPException(status_code=404, detail="运行记录不存在")
+    event_bus.publish(run_id, {"type": "deleted", "data": {"run_id": run_id}})
     return {
         "deleted": True,
         "artifact_deleted": artifact_deleted,
     }
 
 
-@app.get("/api/runs/{run_id}/artifact")
-def get_artifact(run_id: int):
-    """Load markdown artifact content for preview."""
+def _artifact_path_for_run(run_id: int) -> Path:
+    """Resolve and validate the artifact path recorded for a run."""
     run = storage.get_run(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="运行记录不存在")
@@ -173,11 +232,25 @@ def get_artifact(run_id: int):
         raise HTTPException(status_code=404, detail="该运行没有产物路径")
 
     path = _resolve_artifact_path(output_path)
-    if not path.exists() or not path.is_file():
+    if not path.is_file():
         raise HTTPException(status_code=404, detail="产物文件不存在")
+    return path
+
+
+def _read_artifact_head(path: Path, max_chars: int) -> str:
+    """Read at most max_chars+1 chars so truncation is detectable without
+    loading the whole file."""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read(max_chars + 1)
+
+
+@app.get("/api/runs/{run_id}/artifact")
+async def get_artifact(run_id: int):
+    """Load markdown artifact content for preview."""
+    path = await asyncio.to_thread(_artifact_path_for_run, run_id)
 
-    content = path.read_text(encoding="utf-8", errors="ignore")
     max_chars = 120000
+    content = await asyncio.to_thread(_read_artifact_head, path, max_chars)
     truncated = len(content) > max_chars
 
     return {
@@ -187,64 +260,131 @@ def get_artifact(run_id: int):
     }
 
 
+@app.get("/api/runs/{run_id}/artifact/raw")
+async def get_artifact_raw(run_id: int):
+    """Download the full artifact file without server-side buffering."""
+    path = await asyncio.to_thread(_artifact_path_for_run, run_id)
+    return FileResponse(
+        path,
+        media_type="text/markdown; charset=utf-8",
+        filename=path.name,
+    )
+
+
+async def _format_sse(source):
+    """Manual SSE framing for the no-sse-starlette fallback."""
+    async for item in source:
+        if "comment" in item:
+            yield f": {item['comment']}\n\n"
+        elif "retry" in item:
+            yield f"retry: {item['retry']}\n\n"
+        else:
+            yield f"data: {item['data']}\n\n"
+
+
 @app.get("/api/runs/{run_id}/events")
 async def stream_events(run_id: int, request: Request):
     """SSE stream for run logs and status changes."""
-    if not storage.get_run(run_id):
+    if not await asyncio.to_thread(storage.get_run, run_id):
         raise HTTPException(status_code=404, detail="运行记录不存在")
 
     async def event_generator():
-        last_log_id = 0
-        last_run_fingerprint = ""
-        yield "retry: 2000\n\n"
-
-        while True:
-            if await request.is_disconnected():
-                break
-
-            run = storage.get_run(run_id)
+        # Subscribe before the catch-up read so nothing published in between
+        # is lost; duplicates are filtered below by log id.
+        queue = event_bus.subscribe(run_id)
+        try:
+            last_log_id = 0
+            yield {"retry": 2000}
+
+            # SQLite calls go through the threadpool so they never stall
+            # the event loop serving other requests.
+            run = await asyncio.to_thread(storage.get_run, run_id)
             if not run:
                 payload = {"type": "deleted", "data": {"run_id": run_id}}
-                yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
-                break
-
-            logs = storage.get_logs(run_id, after_id=last_log_id, limit=500)
-            for log in logs:
-                last_log_id = log["id"]
-                payload = {"type": "log", "data": log}
-                yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
-
-            fingerprint = json.dumps(
-                {
-                    "status": run.get("status"),
-                    "progress": run.get("progress"),
-                    "current_step": run.get("current_step"),
-                    "updated_at": run.get("updated_at"),
-                    "output_path": run.get("output_path"),
-                },
-                ensure_ascii=False,
-                sort_keys=True,
-            )
-
-            if fingerprint != last_run_fingerprint:
-                last_run_fingerprint = fingerprint
-                payload = {"type": "run", "data": run}
-                yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
-
-            if run.get("status") in TERMINAL_STATUSES and not logs:
+                yield {"data": _dumps(payload)}
+                return
+
+            # Replay persisted history, then switch to pushed events.
+            while True:
+                logs = await asyncio.to_thread(
+                    storage.get_logs, run_id, after_id=last_log_id, limit=500
+                )
+                if logs:
+                    last_log_id = logs[-1]["id"]
+                    payload = {"type": "logs", "data": logs}
+                    yield {"data": _dumps(payload)}
+                if len(logs) < 500:
+                    break
+
+            last_revision = run.get("revision", -1)
+            payload = {"type": "run", "data": run}
+            yield {"data": _dumps(payload)}
+
+            if run.get("status") in TERMINAL_STATUSES:
                 payload = {
                     "type": "done",
                     "data": {"run_id": run_id, "status": run.get("status")},
                 }
-                yield f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
-                break
-
-            yield ": ping\n\n"
-            await asyncio.sleep(1)
+                yield {"data": _dumps(payload)}
+                return
+
+            while True:
+                if await request.is_disconnected():
+                    break
+
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Keepalive so proxies don't drop the idle connection.
+                    yield {"comment": "ping"}
+                    continue
+
+                if message.get("type") == "logs":
+                    rows = [row for row in message["data"] if row.get("id", 0) > last_log_id]
+                    if not rows:
+                        continue
+                    last_log_id = rows[-1]["id"]
+                    message = {"type": "logs", "data": rows}
+                elif message.get("type") == "log":
+                    log_id = message["data"].get("id", 0)
+                    if log_id <= last_log_id:
+                        continue
+                    last_log_id = log_id
+                elif message.get("type") == "run":
+                    # Integer compare instead of the old JSON fingerprint:
+                    # drop frames already covered by the catch-up snapshot.
+                    revision = message["data"].get("revision", -1)
+                    if revision <= last_revision:
+                        continue
+                    last_revision = revision
+                elif message.get("type") == "done":
+                    run = await asyncio.to_thread(storage.get_run, run_id)
+                    message = {
+                        "type": "done",
+                        "data": {
+                            "run_id": run_id,
+                            "status": run.get("status") if run else None,
+                        },
+                    }
+
+                yield {"data": _dumps(message)}
+
+                if message.get("type") in {"done", "deleted"}:
+                    break
+        finally:
+            event_bus.unsubscribe(run_id, queue)
+
+    if EventSourceResponse is not None:
+        return EventSourceResponse(
+            event_generator(),
+            headers={"X-Accel-Buffering": "no"},
+        )
 
     headers = {
         "Cache-Control": "no-cache",
         "Connection": "keep-alive",
         "X-Accel-Buffering": "no",
     }
-    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=headers)
+    return StreamingResponse(
+        _format_sse(event_generator()), media_type="text/event-stream", headers=headers
+    )
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import shlex
-import subprocess
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .storage import RunStorage, utc_now_iso
 
@@ -25,8 +26,128 @@ OUTPUT_PATH_PATTERN = re.compile(r"(?:报告已保存到|Weekly 已保存到|文
 
 CATEGORY_FINAL_PATTERN = re.compile(r"分类\s+(.+?)\s+最终:\s*(\d+)\s*条")
 
+COMPLETION_PATTERN = re.compile(r"执行完成|生成完成|✅ 完成|Dry-run 模式")
+
+ERROR_HINT_PATTERN = re.compile(r"error|失败|异常|traceback", re.IGNORECASE)
+WARNING_HINT_PATTERN = re.compile(r"warning|warn|警告", re.IGNORECASE)
+
+# Step markers fused into one alternation per mode: a single C-level scan
+# replaces the per-marker substring loop, and m.lastindex picks the matching
+# (step name, progress) entry from the parallel table.
+STEP_PATTERNS = {
+    "standard": (
+        re.compile(r"(Step 1)|(Step 2)|(Step 3)|(Step 4)|(Step 5)"),
+        (
+            ("抓取源", 20),
+            ("内容过滤", 40),
+            ("AI 分析", 60),
+            ("写入缓存", 80),
+            ("生成报告", 92),
+        ),
+    ),
+    "weekly": (
+        re.compile(r"(开始生成 Weekly)|(共收集)|(处理文章)|(分类)|(Weekly 已保存到)|(文件已保存到)"),
+        (
+            ("初始化", 8),
+            ("抓取完成", 25),
+            ("AI 提取", 45),
+            ("分类整理", 70),
+            ("写入结果", 92),
+            ("写入结果", 92),
+        ),
+    ),
+}
+
+# Stats extractors for interpret_progress_line: (compiled pattern, match -> patch).
+# Compiled once at import so the per-line hot path skips re-cache lookups.
+STATS_PATTERNS = (
+    (
+        re.compile(r"共收集\s*(\d+)\s*篇唯一文章"),
+        lambda m: {"unique_articles": int(m.group(1))},
+    ),
+    (
+        re.compile(r"过滤后剩余\s*(\d+)\s*篇文章待处理"),
+        lambda m: {"filtered_articles": int(m.group(1))},
+    ),
+    (
+        re.compile(r"分析完成:\s*成功\s*(\d+)\s*/\s*(\d+)"),
+        lambda m: {"ai_success": int(m.group(1)), "ai_total": int(m.group(2))},
+    ),
+    (
+        re.compile(r"已写入 Weekly 去重缓存:\s*(\d+)\s*条"),
+        lambda m: {"dedup_written": int(m.group(1))},
+    ),
+    (
+        CATEGORY_FINAL_PATTERN,
+        lambda m: {"categories": {m.group(1): int(m.group(2))}},
+    ),
+)
+
+# Every STATS_PATTERNS entry contains one of these literals, so a line
+# missing all of them (the vast majority of output) can skip the regex
+# scans after a handful of substring checks.
+STATS_TRIGGERS = ("共收集", "过滤后剩余", "分析完成:", "去重缓存:", "最终:")
+
+# Characters shlex.quote would pass through untouched; arguments matching
+# this skip its pure-Python scan entirely. re.ASCII keeps the safe set
+# identical to shlex's own ASCII-only check.
+_SAFE_ARG_PATTERN = re.compile(r"\A[\w@%+=:,./-]+\Z", re.ASCII)
+
+
+def _quote_arg(part: str) -> str:
+    """shlex.quote with a fast path for the common all-safe argument."""
+    if _SAFE_ARG_PATTERN.match(part):
+        return part
+    return shlex.quote(part)
+
+
+class EventBus:
+    """In-process fan-out of run events from the runner thread to SSE consumers.
+
+    Subscribers get their own asyncio.Queue; the runner thread publishes via
+    loop.call_soon_threadsafe so consumers simply await the next message
+    instead of polling the database.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def subscribe(self, run_id: int) -> asyncio.Queue:
+        """Register a queue for a run. Must be called from the event loop."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            self._subscribers.setdefault(run_id, []).append((loop, queue))
+        return queue
 
-@dataclass
+    def unsubscribe(self, run_id: int, queue: asyncio.Queue) -> None:
+        """Remove a previously registered queue."""
+        with self._lock:
+            subscribers = self._subscribers.get(run_id)
+            if not subscribers:
+                return
+            subscribers[:] = [entry for entry in subscribers if entry[1] is not queue]
+            if not subscribers:
+                del self._subscribers[run_id]
+
+    def publish(self, run_id: int, message: Dict[str, Any]) -> None:
+        """Deliver one message to every subscriber of a run (thread-safe)."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(run_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+            except RuntimeError:
+                # Subscriber's loop already closed; it will be unsubscribed
+                # by its own cleanup path.
+                continue
+
+
+event_bus = EventBus()
+
+
+@dataclass(slots=True)
 class RunRequest:
     """User request for creating a run."""
 
@@ -39,7 +160,9 @@ class RunRequest:
     extra_args: List[str] = field(default_factory=list)
 
 
-@dataclass
+# slots=True: one ProgressUpdate is allocated per subprocess output line,
+# so dropping the per-instance __dict__ matters on long runs.
+@dataclass(slots=True)
 class ProgressUpdate:
     """Progress update parsed from one log line."""
 
@@ -49,9 +172,46 @@ class ProgressUpdate:
     stats: Dict[str, Any] = field(default_factory=dict)
 
 
+def _is_log_timestamp(text: str) -> bool:
+    """Cheap check for the 'YYYY-MM-DD HH:MM:SS[,mmm]' logging prefix."""
+    return (
+        len(text) >= 12
+        and text[0:4].isdigit()
+        and text[4] == "-"
+        and text[5:7].isdigit()
+        and text[7] == "-"
+        and text[8:10].isdigit()
+        and text[10] == " "
+        and all(c.isdigit() or c in ":," for c in text[11:])
+    )
+
+
 def parse_log_line(line: str) -> Dict[str, str]:
     """Parse a structured Python logging line if available."""
     clean = (line or "").rstrip("\n")
+
+    # Fast path: the standard 'ts - module - LEVEL - msg' shape splits on
+    # the literal separator without touching the regex engine. Validation
+    # mirrors LOG_LINE_PATTERN exactly, so anything ambiguous falls through
+    # to the regex and behavior is unchanged.
+    parts = clean.split(" - ", 3)
+    if (
+        len(parts) == 4
+        and _is_log_timestamp(parts[0])
+        and parts[1]
+        and all(c.isalnum() or c in "._" for c in parts[1])
+        and parts[2].isascii()
+        and parts[2].isalpha()
+        and parts[2].isupper()
+    ):
+        return {
+            "timestamp": parts[0],
+            "level": parts[2],
+            "module": parts[1],
+            "message": parts[3],
+            "raw_line": clean,
+        }
+
     matched = LOG_LINE_PATTERN.match(clean)
     if matched:
         payload = matched.groupdict()
@@ -63,11 +223,10 @@ def parse_log_line(line: str) -> Dict[str, str]:
             "raw_line": clean,
         }
 
-    lowered = clean.lower()
     level = "INFO"
-    if any(keyword in lowered for keyword in ("error", "失败", "异常", "traceback")):
+    if ERROR_HINT_PATTERN.search(clean):
         level = "ERROR"
-    elif any(keyword in lowered for keyword in ("warning", "warn", "警告")):
+    elif WARNING_HINT_PATTERN.search(clean):
         level = "WARNING"
 
     return {
@@ -91,58 +250,26 @@ def interpret_progress_line(mode: str, line: str, current_progress: int) -> Prog
     if output_match:
         update.output_path = output_match.group(1).strip()
 
-    if mode == "standard":
-        step_map = [
-            ("Step 1", "抓取源", 20),
-            ("Step 2", "内容过滤", 40),
-            ("Step 3", "AI 分析", 60),
-            ("Step 4", "写入缓存", 80),
-            ("Step 5", "生成报告", 92),
-        ]
-    else:
-        step_map = [
-            ("开始生成 Weekly", "初始化", 8),
-            ("共收集", "抓取完成", 25),
-            ("处理文章", "AI 提取", 45),
-            ("分类", "分类整理", 70),
-            ("Weekly 已保存到", "写入结果", 92),
-            ("文件已保存到", "写入结果", 92),
-        ]
-
-    for marker, step_name, progress in step_map:
-        if marker in text and progress > current_progress:
+    step_pattern, step_table = STEP_PATTERNS["standard" if mode == "standard" else "weekly"]
+    step_match = step_pattern.search(text)
+    if step_match:
+        step_name, progress = step_table[step_match.lastindex - 1]
+        if progress > current_progress:
             update.step = step_name
             update.progress = progress
 
-    if any(keyword in text for keyword in ("执行完成", "生成完成", "✅ 完成", "Dry-run 模式")):
+    if COMPLETION_PATTERN.search(text):
         update.step = "完成"
         update.progress = 100
 
-    stats: Dict[str, Any] = {}
-
-    match = re.search(r"共收集\s*(\d+)\s*篇唯一文章", text)
-    if match:
-        stats["unique_articles"] = int(match.group(1))
-
-    match = re.search(r"过滤后剩余\s*(\d+)\s*篇文章待处理", text)
-    if match:
-        stats["filtered_articles"] = int(match.group(1))
-
-    match = re.search(r"分析完成:\s*成功\s*(\d+)\s*/\s*(\d+)", text)
-    if match:
-        stats["ai_success"] = int(match.group(1))
-        stats["ai_total"] = int(match.group(2))
-
-    match = re.search(r"已写入 Weekly 去重缓存:\s*(\d+)\s*条", text)
-    if match:
-        stats["dedup_written"] = int(match.group(1))
-
-    match = CATEGORY_FINAL_PATTERN.search(text)
-    if match:
-        stats["categories"] = {match.group(1): int(match.group(2))}
-
-    if stats:
-        update.stats = stats
+    if any(trigger in text for trigger in STATS_TRIGGERS):
+        stats: Dict[str, Any] = {}
+        for pattern, extract in STATS_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                stats.update(extract(match))
+        if stats:
+            update.stats = stats
 
     return update
 
@@ -150,15 +277,29 @@ def interpret_progress_line(mode: str, line: str, current_progress: int) -> Prog
 class RunManager:
     """Create and track background runs started from the web UI."""
 
+    # Log flush policy: batch subprocess output into one transaction per
+    # FLUSH_MAX_LINES lines or FLUSH_INTERVAL seconds, whichever comes first.
+    FLUSH_MAX_LINES = 50
+    FLUSH_INTERVAL = 0.1
+
+    # asyncio stream limit for one stdout line; generous so a pathological
+    # long line fails the line instead of killing the reader.
+    STREAM_LINE_LIMIT = 1024 * 1024
+
     def __init__(self, *, project_root: Path, python_exec: str, storage: RunStorage):
         self.project_root = Path(project_root)
         self.python_exec = python_exec
         self.storage = storage
-        self._threads: Dict[int, threading.Thread] = {}
+        self._tasks: Dict[int, Any] = {}
         self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Attach the server's event loop; run coroutines are scheduled on it."""
+        self._loop = loop
 
     def start_run(self, request: RunRequest) -> int:
-        """Start a run in a background thread and return run id."""
+        """Start a run as a background coroutine and return run id."""
         if request.mode not in {"weekly", "standard"}:
             raise ValueError("mode must be 'weekly' or 'standard'")
 
@@ -182,7 +323,7 @@ class RunManager:
         if request.extra_args:
             cmd.extend(request.extra_args)
 
-        command_text = " ".join(shlex.quote(part) for part in cmd)
+        command_text = " ".join(_quote_arg(part) for part in cmd)
 
         run_id = self.storage.create_run(
             mode=request.mode,
@@ -193,16 +334,19 @@ class RunManager:
             command=command_text,
         )
 
-        thread = threading.Thread(
-            target=self._execute_run,
-            args=(run_id, cmd, request.mode),
-            daemon=True,
-        )
+        coro = self._execute_run(run_id, cmd, request.mode)
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            # Scheduled onto the server loop: the run coroutine shares it
+            # with the SSE consumers, so no dedicated reader thread exists.
+            handle: Any = asyncio.run_coroutine_threadsafe(coro, loop)
+        else:
+            # Standalone use (scripts/tests) without a long-lived loop.
+            handle = threading.Thread(target=asyncio.run, args=(coro,), daemon=True)
+            handle.start()
 
         with self._lock:
-            self._threads[run_id] = thread
-
-        thread.start()
+            self._tasks[run_id] = handle
         return run_id
 
     def rerun(self, source_run_id: int) -> int:
@@ -223,14 +367,56 @@ class RunManager:
         )
         return self.start_run(request)
 
-    def _execute_run(self, run_id: int, cmd: List[str], mode: str) -> None:
-        self.storage.update_run(
+    def _log_and_publish(
+        self,
+        run_id: int,
+        *,
+        level: str,
+        module: str,
+        message: str,
+        raw_line: str,
+        timestamp: Optional[str] = None,
+    ) -> None:
+        """Persist one log line and push it to live subscribers."""
+        ts = timestamp or utc_now_iso()
+        log_id = self.storage.append_log(
+            run_id,
+            level=level,
+            module=module,
+            message=message,
+            raw_line=raw_line,
+            timestamp=ts,
+        )
+        event_bus.publish(run_id, {
+            "type": "log",
+            "data": {
+                "id": log_id,
+                "run_id": run_id,
+                "timestamp": ts,
+                "level": level,
+                "module": module,
+                "message": message,
+                "raw_line": raw_line,
+            },
+        })
+
+    def _publish_run(self, run_id: int) -> None:
+        """Push the current run row to live subscribers."""
+        run = self.storage.get_run(run_id)
+        if run:
+            event_bus.publish(run_id, {"type": "run", "data": run})
+
+    async def _execute_run(self, run_id: int, cmd: List[str], mode: str) -> None:
+        await asyncio.to_thread(
+            self.storage.update_run,
             run_id,
             status="running",
             current_step="启动中",
             progress=2,
         )
-        self.storage.append_log(
+        await asyncio.to_thread(self._publish_run, run_id)
+        await asyncio.to_thread(
+            self._log_and_publish,
             run_id,
             level="INFO",
             module="webui.runner",
@@ -245,61 +431,112 @@ class RunManager:
         error_message = ""
 
         try:
-            process = subprocess.Popen(
-                cmd,
+            # asyncio subprocess: stdout is read on the event loop without a
+            # per-run OS thread; the transport still buffers reads in large
+            # chunks, so per-line syscall cost stays low.
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
                 cwd=str(self.project_root),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
                 env=os.environ.copy(),
+                limit=self.STREAM_LINE_LIMIT,
             )
 
             if process.stdout is None:
                 raise RuntimeError("未能捕获子进程输出")
 
-            for raw_line in process.stdout:
-                parsed = parse_log_line(raw_line)
-                self.storage.append_log(
-                    run_id,
-                    level=parsed["level"],
-                    module=parsed["module"],
-                    message=parsed["message"],
-                    raw_line=parsed["raw_line"],
-                    timestamp=parsed["timestamp"],
-                )
-
-                interpreted = interpret_progress_line(mode, parsed["message"], current_progress)
+            # Buffer parsed lines and coalesce run/stats updates so each
+            # flush is one SQLite transaction instead of one per line.
+            pending_rows: List[Dict[str, Any]] = []
+            pending_update: Dict[str, Any] = {}
+            pending_stats: Dict[str, Any] = {}
+            flush_deadline = time.monotonic() + self.FLUSH_INTERVAL
+
+            async def flush_pending() -> None:
+                nonlocal flush_deadline
+                if pending_rows:
+                    log_ids = await asyncio.to_thread(
+                        self.storage.append_logs_bulk, run_id, pending_rows
+                    )
+                    event_bus.publish(run_id, {
+                        "type": "logs",
+                        "data": [
+                            {"id": log_id, "run_id": run_id, **row}
+                            for log_id, row in zip(log_ids, pending_rows)
+                        ],
+                    })
+                    pending_rows.clear()
+                run_changed = False
+                if pending_stats:
+                    await asyncio.to_thread(self.storage.merge_stats, run_id, dict(pending_stats))
+                    pending_stats.clear()
+                    run_changed = True
+                if pending_update:
+                    await asyncio.to_thread(
+                        lambda kw: self.storage.update_run(run_id, **kw), dict(pending_update)
+                    )
+                    pending_update.clear()
+                    run_changed = True
+                if run_changed:
+                    await asyncio.to_thread(self._publish_run, run_id)
+                flush_deadline = time.monotonic() + self.FLUSH_INTERVAL
+
+            # Hoist hot lookups into locals: the loop body runs once per
+            # subprocess output line, and local loads beat repeated global/
+            # attribute lookups in the interpreter.
+            parse = parse_log_line
+            interpret = interpret_progress_line
+            append_row = pending_rows.append
+            monotonic = time.monotonic
+            flush_max = self.FLUSH_MAX_LINES
+
+            async for raw in process.stdout:
+                raw_line = raw.decode("utf-8", errors="replace")
+                parsed = parse(raw_line)
+                append_row(parsed)
+
+                interpreted = interpret(mode, parsed["message"], current_progress)
                 if interpreted.stats:
-                    self.storage.merge_stats(run_id, interpreted.stats)
-
-                run_update: Dict[str, Any] = {}
+                    # Mirror merge_stats semantics so coalesced patches keep
+                    # nested dicts (e.g. categories) merged, not replaced.
+                    for key, value in interpreted.stats.items():
+                        if isinstance(value, dict) and isinstance(pending_stats.get(key), dict):
+                            pending_stats[key].update(value)
+                        else:
+                            pending_stats[key] = value
 
                 if interpreted.step and interpreted.step != current_step:
                     current_step = interpreted.step
-                    run_update["current_step"] = current_step
+                    pending_update["current_step"] = current_step
 
                 if interpreted.progress is not None and interpreted.progress > current_progress:
                     current_progress = interpreted.progress
-                    run_update["progress"] = current_progress
+                    pending_update["progress"] = current_progress
 
                 if interpreted.output_path:
                     output_path = interpreted.output_path
-                    run_update["output_path"] = output_path
-
-                if run_update:
-                    self.storage.update_run(run_id, **run_update)
+                    pending_update["output_path"] = output_path
 
                 if parsed["level"] == "ERROR" and not error_message:
                     error_message = parsed["message"][:400]
 
-            return_code = process.wait()
+                if (
+                    len(pending_rows) >= flush_max
+                    or parsed["level"] == "ERROR"
+                    or monotonic() >= flush_deadline
+                ):
+                    await flush_pending()
+
+            await flush_pending()
+            return_code = await process.wait()
 
             end = datetime.now(timezone.utc)
             duration = (end - start).total_seconds()
 
             if return_code == 0:
-                self.storage.update_run(
+                await asyncio.to_thread(
+                    self.storage.update_run,
                     run_id,
                     status="success",
                     current_step="完成",
@@ -309,7 +546,8 @@ class RunManager:
                     exit_code=0,
                     output_path=output_path,
                 )
-                self.storage.append_log(
+                await asyncio.to_thread(
+                    self._log_and_publish,
                     run_id,
                     level="INFO",
                     module="webui.runner",
@@ -318,13 +556,14 @@ class RunManager:
                 )
             else:
                 if not error_message:
-                    latest = self.storage.latest_log(run_id)
+                    latest = await asyncio.to_thread(self.storage.latest_log, run_id)
                     if latest:
                         error_message = latest.get("message", "任务执行失败")
                     else:
                         error_message = f"任务执行失败，退出码 {return_code}"
 
-                self.storage.update_run(
+                await asyncio.to_thread(
+                    self.storage.update_run,
                     run_id,
                     status="failed",
                     current_step=current_step,
@@ -335,26 +574,30 @@ class RunManager:
                     output_path=output_path,
                     error_message=error_message,
                 )
-                self.storage.append_log(
+                await asyncio.to_thread(
+                    self._log_and_publish,
                     run_id,
                     level="ERROR",
                     module="webui.runner",
                     message=error_message,
                     raw_line=error_message,
                 )
+            await asyncio.to_thread(self._publish_run, run_id)
 
         except Exception as exc:  # pragma: no cover - safety net
             end = datetime.now(timezone.utc)
             duration = (end - start).total_seconds()
             message = f"任务异常终止: {exc}"
-            self.storage.append_log(
+            await asyncio.to_thread(
+                self._log_and_publish,
                 run_id,
                 level="ERROR",
                 module="webui.runner",
                 message=message,
                 raw_line=message,
             )
-            self.storage.update_run(
+            await asyncio.to_thread(
+                self.storage.update_run,
                 run_id,
                 status="failed",
                 current_step=current_step,
@@ -363,6 +606,10 @@ class RunManager:
                 duration_seconds=duration,
                 error_message=message,
             )
+            await asyncio.to_thread(self._publish_run, run_id)
         finally:
+            event_bus.publish(run_id, {"type": "done", "data": {"run_id": run_id}})
+            # The log burst is over; fold the WAL back into the database.
+            await asyncio.to_thread(self.storage.checkpoint_wal)
             with self._lock:
-                self._threads.pop(run_id, None)
+                self._tasks.pop(run_id, None)
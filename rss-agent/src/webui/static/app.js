@@ -230,6 +230,14 @@ function appendLog(log) {
   renderLogs();
 }
 
+function appendLogs(logs) {
+  state.logs.push(...logs);
+  if (state.logs.length > 3000) {
+    state.logs = state.logs.slice(-3000);
+  }
+  renderLogs();
+}
+
 function closeEventSource() {
   if (state.eventSource) {
     state.eventSource.close();
@@ -258,6 +266,11 @@ function connectRunEvents(runId) {
       return;
     }
 
+    if (payload.type === "logs") {
+      appendLogs(payload.data);
+      return;
+    }
+
     if (payload.type === "run") {
       state.run = payload.data;
       renderRunSummary();
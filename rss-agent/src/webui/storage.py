@@ -3,33 +3,178 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    # Optional Rust JSON codec; decoding stats blobs for run rows is the
+    # hottest JSON work in this module.
+    import orjson
+except ImportError:
+    orjson = None
+
 TERMINAL_STATUSES = {"success", "failed", "cancelled"}
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> str:
+        # SQLite columns are TEXT, so decode orjson's UTF-8 bytes once here.
+        return orjson.dumps(obj).decode()
+else:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+# Everything except the JSON columns: the list view renders none of
+# extra_args/stats_json, so list queries skip fetching and decoding them.
+_RUN_LITE_COLUMNS = (
+    "id, mode, dry_run, config_path, weekly_config_path, command, status, "
+    "current_step, progress, started_at, ended_at, duration_seconds, "
+    "output_path, error_message, exit_code, created_at, updated_at, revision"
+)
+
+# Page-cache budget per connection in KB (negative value in the PRAGMA means
+# KB rather than pages). Overridable for small deployments.
+SQLITE_CACHE_KB = int(os.environ.get("WEBUI_SQLITE_CACHE_KB", "65536"))
+
+
+# Hot-path SQL shared by append_log/append_logs_bulk; a single literal lets
+# the connection's statement cache reuse the compiled statement. The other
+# per-poll statements are hoisted for the same reason: byte-identical SQL
+# on every call keeps them pinned in the cache.
+_INSERT_LOG_SQL = (
+    "INSERT INTO logs (run_id, id, timestamp, level, module, message, raw_line) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SELECT_RUN_SQL = "SELECT * FROM runs WHERE id = ?"
+
+_SELECT_LOGS_SQL = (
+    "SELECT run_id, id, timestamp, level, module, message FROM logs "
+    "WHERE run_id = ? AND id > ? ORDER BY id ASC LIMIT ?"
+)
+
+_SELECT_LOGS_RAW_SQL = (
+    "SELECT run_id, id, timestamp, level, module, message, raw_line FROM logs "
+    "WHERE run_id = ? AND id > ? ORDER BY id ASC LIMIT ?"
+)
+
+
+# (whole second, formatted string): at second precision the same string is
+# answered for every call within that second, so the log hot path usually
+# skips datetime construction and formatting entirely. Race-tolerant — a
+# concurrent refresh just formats the same second twice.
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _compact_raw_line(
+    timestamp: str, level: str, module: str, message: str, raw_line: str
+) -> str:
+    """Collapse raw_line to '' when it is exactly reconstructable.
+
+    Runner rows duplicate the line: structured ones as
+    'ts - module - LEVEL - message', stdout fallbacks as the message
+    itself. Storing the duplicate doubles row size for no information.
+    """
+    if module == "stdout":
+        return "" if raw_line == message else raw_line
+    if raw_line == f"{timestamp} - {module} - {level} - {message}":
+        return ""
+    return raw_line
+
+
+def _restore_raw_line(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a collapsed raw_line from the structured fields."""
+    if not data.get("raw_line"):
+        if data["module"] == "stdout":
+            data["raw_line"] = data["message"]
+        else:
+            data["raw_line"] = (
+                f"{data['timestamp']} - {data['module']} - "
+                f"{data['level']} - {data['message']}"
+            )
+    return data
+
 
 def utc_now_iso() -> str:
     """Return UTC ISO timestamp with second precision."""
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if cached[0] == now:
+        return cached[1]
+    text = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now))
+    _ts_cache = (now, text)
+    return text
 
 
 class RunStorage:
     """Persist runs and logs to a local SQLite database."""
 
+    # Sub-second TTL for hot read endpoints: coalesces the dashboard's
+    # repeated list_runs/get_run hits into one DB round trip without
+    # user-visible staleness. Any write clears the cache immediately.
+    READ_CACHE_TTL = 0.5
+
     def __init__(self, db_path: Path):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # _lock only guards the in-memory log id counters below; SQL writes
+        # are serialized by SQLite itself (WAL + busy_timeout), so readers
+        # and writers no longer contend on a Python lock.
         self._lock = threading.Lock()
+        # Per-run log id counters so inserts don't re-run MAX(id).
+        self._log_seq: Dict[int, int] = {}
+        self._read_cache: Dict[Tuple[str, Any], Tuple[float, Any]] = {}
+        self._update_sql_cache: Dict[Tuple[str, ...], str] = {}
+        # One long-lived connection per thread: opening a handle re-parses
+        # PRAGMAs and rebuilds the statement cache, which dominated CPU when
+        # every call reconnected. Callers never close what _connect returns.
+        self._local = threading.local()
         self._init_schema()
+        self._has_json_patch = self._probe_json_patch()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+        return conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=256,
+        )
         conn.row_factory = sqlite3.Row
+        # 8 KiB pages shallow the b-trees for wide log rows; only takes
+        # effect on a fresh database (before WAL/first write), silently a
+        # no-op on existing files.
+        conn.execute("PRAGMA page_size = 8192;")
         conn.execute("PRAGMA foreign_keys = ON;")
+        # WAL lets SSE/list readers proceed while the runner thread commits
+        # log batches; NORMAL sync defers fsync to WAL checkpoints, which is
+        # safe for a local dashboard cache (worst case on power loss is the
+        # last batch of log lines).
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_KB};")
+        # 1 GiB mmap ceiling: SQLite only maps up to the file size, and
+        # mapped reads serve the polling endpoints zero-copy from the OS
+        # page cache instead of copying through SQLite's own cache.
+        conn.execute("PRAGMA mmap_size = 1073741824;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA busy_timeout = 5000;")
+        # Cap WAL growth across long runs: checkpoint every ~1000 pages and
+        # shrink the file back under 64 MB when checkpoints complete.
+        conn.execute("PRAGMA wal_autocheckpoint = 1000;")
+        conn.execute("PRAGMA journal_size_limit = 67108864;")
         return conn
 
     def _init_schema(self) -> None:
@@ -55,34 +200,80 @@ class RunStorage:
                     exit_code INTEGER,
                     stats_json TEXT NOT NULL DEFAULT '{}',
                     created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
+                    updated_at TEXT NOT NULL,
+                    revision INTEGER NOT NULL DEFAULT 0
                 );
 
                 CREATE TABLE IF NOT EXISTS logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     run_id INTEGER NOT NULL,
+                    id INTEGER NOT NULL,
                     timestamp TEXT NOT NULL,
                     level TEXT NOT NULL,
                     module TEXT NOT NULL,
                     message TEXT NOT NULL,
                     raw_line TEXT NOT NULL,
+                    PRIMARY KEY (run_id, id),
                     FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE
-                );
+                ) WITHOUT ROWID;
 
                 CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at DESC);
-                CREATE INDEX IF NOT EXISTS idx_logs_run_id_id ON logs(run_id, id);
                 """
             )
+            # Databases created before the revision column existed.
+            try:
+                conn.execute(
+                    "ALTER TABLE runs ADD COLUMN revision INTEGER NOT NULL DEFAULT 0"
+                )
+            except sqlite3.OperationalError:
+                pass
+
+            # Databases created while logs was a rowid table with a global
+            # AUTOINCREMENT id: rebuild it clustered on (run_id, id) so the
+            # keyset query reads only primary-key pages. Ids are preserved,
+            # so clients paginating with after_id are unaffected.
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'logs'"
+            ).fetchone()
+            if row and "WITHOUT ROWID" not in row["sql"]:
+                conn.executescript(
+                    """
+                    ALTER TABLE logs RENAME TO logs_old;
+                    CREATE TABLE logs (
+                        run_id INTEGER NOT NULL,
+                        id INTEGER NOT NULL,
+                        timestamp TEXT NOT NULL,
+                        level TEXT NOT NULL,
+                        module TEXT NOT NULL,
+                        message TEXT NOT NULL,
+                        raw_line TEXT NOT NULL,
+                        PRIMARY KEY (run_id, id),
+                        FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE
+                    ) WITHOUT ROWID;
+                    INSERT INTO logs (run_id, id, timestamp, level, module, message, raw_line)
+                        SELECT run_id, id, timestamp, level, module, message, raw_line
+                        FROM logs_old;
+                    DROP TABLE logs_old;
+                    DROP INDEX IF EXISTS idx_logs_run_id_id;
+                    """
+                )
+
+    def _probe_json_patch(self) -> bool:
+        """Check once whether this SQLite build ships the JSON1 functions."""
+        try:
+            self._connect().execute("SELECT json_patch('{}', '{}')")
+            return True
+        except sqlite3.OperationalError:
+            return False
 
     def _row_to_run(self, row: sqlite3.Row) -> Dict[str, Any]:
         data = dict(row)
         try:
-            data["extra_args"] = json.loads(data.get("extra_args") or "[]")
-        except json.JSONDecodeError:
+            data["extra_args"] = _json_loads(data.get("extra_args") or "[]")
+        except ValueError:
             data["extra_args"] = []
         try:
-            data["stats"] = json.loads(data.get("stats_json") or "{}")
-        except json.JSONDecodeError:
+            data["stats"] = _json_loads(data.get("stats_json") or "{}")
+        except ValueError:
             data["stats"] = {}
         data.pop("stats_json", None)
         return data
@@ -90,6 +281,19 @@ class RunStorage:
     def _row_to_log(self, row: sqlite3.Row) -> Dict[str, Any]:
         return dict(row)
 
+    def _cached_read(self, key: Tuple[str, Any], loader) -> Any:
+        """Serve a read from the TTL cache, falling back to `loader`.
+
+        Lock-free: a concurrent race costs at most one redundant query.
+        """
+        now = time.monotonic()
+        hit = self._read_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        value = loader()
+        self._read_cache[key] = (now + self.READ_CACHE_TTL, value)
+        return value
+
     def has_active_run(self) -> bool:
         with self._connect() as conn:
             row = conn.execute(
@@ -108,29 +312,29 @@ class RunStorage:
         command: str,
     ) -> int:
         now = utc_now_iso()
-        with self._lock:
-            with self._connect() as conn:
-                cur = conn.execute(
-                    """
-                    INSERT INTO runs (
-                        mode, dry_run, config_path, weekly_config_path, extra_args,
-                        command, status, current_step, progress,
-                        started_at, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, 'queued', '排队中', 0, ?, ?, ?)
-                    """,
-                    (
-                        mode,
-                        1 if dry_run else 0,
-                        config_path,
-                        weekly_config_path,
-                        json.dumps(extra_args, ensure_ascii=False),
-                        command,
-                        now,
-                        now,
-                        now,
-                    ),
-                )
-                return int(cur.lastrowid)
+        with self._connect() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO runs (
+                    mode, dry_run, config_path, weekly_config_path, extra_args,
+                    command, status, current_step, progress,
+                    started_at, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, 'queued', '排队中', 0, ?, ?, ?)
+                """,
+                (
+                    mode,
+                    1 if dry_run else 0,
+                    config_path,
+                    weekly_config_path,
+                    _json_dumps(extra_args),
+                    command,
+                    now,
+                    now,
+                    now,
+                ),
+            )
+            self._read_cache.clear()
+            return int(cur.lastrowid)
 
     def update_run(self, run_id: int, **fields: Any) -> None:
         if not fields:
@@ -152,53 +356,96 @@ class RunStorage:
 
         update_fields["updated_at"] = utc_now_iso()
 
-        keys = list(update_fields.keys())
-        placeholders = ", ".join(f"{k} = ?" for k in keys)
+        keys = tuple(update_fields.keys())
+        # Recurring update shapes (status-only, progress+step, ...) reuse the
+        # identical SQL string so the connection's statement cache hits
+        # instead of re-preparing a freshly formatted UPDATE every call.
+        sql = self._update_sql_cache.get(keys)
+        if sql is None:
+            placeholders = ", ".join(f"{k} = ?" for k in keys)
+            sql = f"UPDATE runs SET revision = revision + 1, {placeholders} WHERE id = ?"
+            self._update_sql_cache[keys] = sql
         values = [update_fields[k] for k in keys]
         values.append(run_id)
 
-        with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    f"UPDATE runs SET {placeholders} WHERE id = ?",
-                    values,
-                )
+        with self._connect() as conn:
+            conn.execute(sql, values)
+        self._read_cache.clear()
+
+    def get_revision(self, run_id: int) -> Optional[int]:
+        """Fetch just the change counter for a run (cheap change probe)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT revision FROM runs WHERE id = ?",
+                (run_id,),
+            ).fetchone()
+            return int(row["revision"]) if row else None
 
     def merge_stats(self, run_id: int, stats_patch: Dict[str, Any]) -> None:
         if not stats_patch:
             return
 
-        with self._lock:
+        # json_patch merges inside SQLite in one UPDATE, skipping the
+        # SELECT + json round-trip that grows with the stats blob. RFC 7396
+        # deletes keys on null, so None-valued keys are applied through
+        # chained json_set instead (a bound SQL NULL becomes JSON null,
+        # matching the Python merge's assignment). Keys containing a quote
+        # can't be embedded in a JSON path, so those take the Python merge.
+        if self._has_json_patch and not any('"' in key for key in stats_patch):
+            none_keys = [k for k, v in stats_patch.items() if v is None]
+            rest = {k: v for k, v in stats_patch.items() if v is not None}
+            expr = "stats_json"
+            params: List[Any] = []
+            if rest:
+                expr = f"json_patch({expr}, ?)"
+                params.append(_json_dumps(rest))
+            for key in none_keys:
+                expr = f"json_set({expr}, ?, NULL)"
+                params.append(f'$."{key}"')
             with self._connect() as conn:
-                row = conn.execute(
-                    "SELECT stats_json FROM runs WHERE id = ?",
-                    (run_id,),
-                ).fetchone()
-                if not row:
-                    return
-
-                try:
-                    current = json.loads(row["stats_json"] or "{}")
-                except json.JSONDecodeError:
-                    current = {}
-
-                for key, value in stats_patch.items():
-                    if (
-                        isinstance(current.get(key), dict)
-                        and isinstance(value, dict)
-                    ):
-                        current[key].update(value)
-                    else:
-                        current[key] = value
-
                 conn.execute(
-                    "UPDATE runs SET stats_json = ?, updated_at = ? WHERE id = ?",
-                    (
-                        json.dumps(current, ensure_ascii=False),
-                        utc_now_iso(),
-                        run_id,
-                    ),
+                    "UPDATE runs SET revision = revision + 1, "
+                    f"stats_json = {expr}, updated_at = ? "
+                    "WHERE id = ?",
+                    (*params, utc_now_iso(), run_id),
                 )
+            self._read_cache.clear()
+            return
+
+        with self._connect() as conn:
+            # BEGIN IMMEDIATE keeps the read-modify-write atomic against
+            # concurrent patches now that no Python lock serializes writers.
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT stats_json FROM runs WHERE id = ?",
+                (run_id,),
+            ).fetchone()
+            if not row:
+                return
+
+            try:
+                current = _json_loads(row["stats_json"] or "{}")
+            except ValueError:
+                current = {}
+
+            for key, value in stats_patch.items():
+                if (
+                    isinstance(current.get(key), dict)
+                    and isinstance(value, dict)
+                ):
+                    current[key].update(value)
+                else:
+                    current[key] = value
+
+            conn.execute(
+                "UPDATE runs SET revision = revision + 1, stats_json = ?, updated_at = ? WHERE id = ?",
+                (
+                    _json_dumps(current),
+                    utc_now_iso(),
+                    run_id,
+                ),
+            )
+        self._read_cache.clear()
 
     def append_log(
         self,
@@ -211,44 +458,124 @@ class RunStorage:
         timestamp: Optional[str] = None,
     ) -> int:
         ts = timestamp or utc_now_iso()
+        conn = self._connect()
+        log_id = self._next_log_id(conn, run_id, 1)
+        with conn:
+            conn.execute(
+                _INSERT_LOG_SQL,
+                (
+                    run_id,
+                    log_id,
+                    ts,
+                    level,
+                    module,
+                    message,
+                    _compact_raw_line(ts, level, module, message, raw_line),
+                ),
+            )
+        return log_id
+
+    def append_logs_bulk(self, run_id: int, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many log rows in a single transaction.
+
+        Each row needs timestamp/level/module/message/raw_line keys.
+        Returns the assigned log ids in insertion order.
+        """
+        if not rows:
+            return []
+        conn = self._connect()
+        first_id = self._next_log_id(conn, run_id, len(rows))
+        with conn:
+            conn.executemany(
+                _INSERT_LOG_SQL,
+                [
+                    (
+                        run_id,
+                        first_id + offset,
+                        row["timestamp"],
+                        row["level"],
+                        row["module"],
+                        row["message"],
+                        _compact_raw_line(
+                            row["timestamp"],
+                            row["level"],
+                            row["module"],
+                            row["message"],
+                            row["raw_line"],
+                        ),
+                    )
+                    for offset, row in enumerate(rows)
+                ],
+            )
+        return list(range(first_id, first_id + len(rows)))
+
+    def _next_log_id(self, conn: sqlite3.Connection, run_id: int, count: int) -> int:
+        """Reserve `count` sequential log ids for a run.
+
+        The MAX(id) probe runs once per run per process; subsequent inserts
+        use the in-memory counter. Disjoint id ranges mean two threads can
+        insert for the same run without conflicting.
+        """
         with self._lock:
+            seq = self._log_seq.get(run_id)
+            if seq is None:
+                row = conn.execute(
+                    "SELECT MAX(id) FROM logs WHERE run_id = ?", (run_id,)
+                ).fetchone()
+                seq = int(row[0] or 0)
+            self._log_seq[run_id] = seq + count
+            return seq + 1
+
+    def checkpoint_wal(self) -> None:
+        """Fold the WAL back into the main database and truncate it.
+
+        Called after a run finishes so the log burst doesn't leave a large
+        -wal file behind; best-effort.
+        """
+        try:
             with self._connect() as conn:
-                cur = conn.execute(
-                    """
-                    INSERT INTO logs (run_id, timestamp, level, module, message, raw_line)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (run_id, ts, level, module, message, raw_line),
-                )
-                return int(cur.lastrowid)
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        except sqlite3.Error:
+            pass
 
     def list_runs(self, limit: int = 100) -> List[Dict[str, Any]]:
+        return self._cached_read(("list_runs", limit), lambda: self._list_runs(limit))
+
+    def _list_runs(self, limit: int) -> List[Dict[str, Any]]:
         with self._connect() as conn:
             rows = conn.execute(
-                "SELECT * FROM runs ORDER BY id DESC LIMIT ?",
+                f"SELECT {_RUN_LITE_COLUMNS} FROM runs ORDER BY id DESC LIMIT ?",
                 (max(1, min(limit, 500)),),
             ).fetchall()
-            return [self._row_to_run(row) for row in rows]
+            return [dict(row) for row in rows]
 
     def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        return self._cached_read(("get_run", run_id), lambda: self._get_run(run_id))
+
+    def _get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM runs WHERE id = ?",
-                (run_id,),
-            ).fetchone()
+            row = conn.execute(_SELECT_RUN_SQL, (run_id,)).fetchone()
             return self._row_to_run(row) if row else None
 
-    def get_logs(self, run_id: int, after_id: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+    def get_logs(
+        self,
+        run_id: int,
+        after_id: int = 0,
+        limit: int = 500,
+        include_raw: bool = False,
+    ) -> List[Dict[str, Any]]:
+        # The dashboard renders timestamp/level/module/message only, and
+        # raw_line duplicates message for unstructured lines — skipping it
+        # roughly halves the bytes per polled page. Pass include_raw=True
+        # when the original line is actually needed.
+        sql = _SELECT_LOGS_RAW_SQL if include_raw else _SELECT_LOGS_SQL
         with self._connect() as conn:
             rows = conn.execute(
-                """
-                SELECT * FROM logs
-                WHERE run_id = ? AND id > ?
-                ORDER BY id ASC
-                LIMIT ?
-                """,
+                sql,
                 (run_id, max(0, after_id), max(1, min(limit, 2000))),
             ).fetchall()
+            if include_raw:
+                return [_restore_raw_line(self._row_to_log(row)) for row in rows]
             return [self._row_to_log(row) for row in rows]
 
     def latest_log(self, run_id: int) -> Optional[Dict[str, Any]]:
@@ -257,25 +584,38 @@ class RunStorage:
                 "SELECT * FROM logs WHERE run_id = ? ORDER BY id DESC LIMIT 1",
                 (run_id,),
             ).fetchone()
-            return self._row_to_log(row) if row else None
+            return _restore_raw_line(self._row_to_log(row)) if row else None
 
     def delete_run(self, run_id: int, delete_artifact: bool = False) -> Tuple[bool, bool]:
-        run = self.get_run(run_id)
-        if not run:
+        # DELETE ... RETURNING (SQLite >= 3.35) hands back output_path from
+        # the same statement, so no full row load and JSON decode just to
+        # find the artifact; older builds take the two-step path.
+        with self._connect() as conn:
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                row = conn.execute(
+                    "DELETE FROM runs WHERE id = ? RETURNING output_path",
+                    (run_id,),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT output_path FROM runs WHERE id = ?",
+                    (run_id,),
+                ).fetchone()
+                if row:
+                    conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
+        if not row:
             return False, False
+        self._log_seq.pop(run_id, None)
+        self._read_cache.clear()
 
         artifact_removed = False
-        if delete_artifact and run.get("output_path"):
+        if delete_artifact and row["output_path"]:
             try:
-                artifact_path = Path(run["output_path"])
+                artifact_path = Path(row["output_path"])
                 if artifact_path.exists() and artifact_path.is_file():
                     artifact_path.unlink()
                     artifact_removed = True
             except OSError:
                 artifact_removed = False
 
-        with self._lock:
-            with self._connect() as conn:
-                conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
-
         return True, artifact_removed